@@ -4,12 +4,22 @@ AI agents for cognitive operating system
 
 The agent loop:
 Intent → Plan → Execute → Evaluate → Learn → Update Profile
-"""
 
-from app.agents.cognitive_profile_agent import CognitiveProfileAgent
-from app.agents.orchestrator_agent import OrchestratorAgent
+Agents are imported on first access (PEP 562) so importing the package
+does not pull in every service module.
+"""
 
 __all__ = [
     "CognitiveProfileAgent",
     "OrchestratorAgent",
 ]
+
+
+def __getattr__(name: str):
+    if name == "CognitiveProfileAgent":
+        from app.agents.cognitive_profile_agent import CognitiveProfileAgent
+        return CognitiveProfileAgent
+    if name == "OrchestratorAgent":
+        from app.agents.orchestrator_agent import OrchestratorAgent
+        return OrchestratorAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
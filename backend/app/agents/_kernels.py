@@ -0,0 +1,85 @@
+"""
+ORBIT - Profile Update Kernels
+Vectorized cognitive profile math
+
+Every function works element-wise on NumPy arrays, so a learning pass can
+update one profile or every profile at once with the same code.
+"""
+
+import numpy as np
+
+
+# Weight given to the newest observation in exponential smoothing
+SMOOTHING = 0.2
+
+# Overcommitment heuristic thresholds
+OVERCOMMIT_PENDING_HIGH = 10
+OVERCOMMIT_PENDING_LOW = 5
+OVERCOMMIT_ABANDON_HIGH = 0.3
+OVERCOMMIT_ABANDON_LOW = 0.2
+OVERCOMMIT_STEP_UP = 0.1
+OVERCOMMIT_STEP_DOWN = 0.05
+
+
+def smooth(old, observed, has_data=True):
+    """Blend a new observation into a running value where data exists."""
+    old = np.asarray(old, dtype=np.float64)
+    blended = (1 - SMOOTHING) * old + SMOOTHING * np.asarray(observed, dtype=np.float64)
+    return np.where(has_data, blended, old)
+
+
+def overcommitment_step(score, pending, abandonment_rate):
+    """
+    Nudge the overcommitment score.
+
+    High pending + high abandonment = overcommitment; a short queue with
+    few abandons relaxes it.
+    """
+    score = np.asarray(score, dtype=np.float64)
+    pending = np.asarray(pending)
+    abandonment_rate = np.asarray(abandonment_rate, dtype=np.float64)
+
+    raise_mask = (pending > OVERCOMMIT_PENDING_HIGH) & (
+        abandonment_rate > OVERCOMMIT_ABANDON_HIGH
+    )
+    lower_mask = ~raise_mask & (pending < OVERCOMMIT_PENDING_LOW) & (
+        abandonment_rate < OVERCOMMIT_ABANDON_LOW
+    )
+    step = np.where(
+        raise_mask,
+        OVERCOMMIT_STEP_UP,
+        np.where(lower_mask, -OVERCOMMIT_STEP_DOWN, 0.0),
+    )
+    return np.clip(score + step, 0.0, 1.0)
+
+
+def update_profiles(
+    completion,
+    abandon,
+    overcommit,
+    starts,
+    completes,
+    abandons,
+    pending,
+):
+    """
+    Apply one learning step to a batch of profiles.
+
+    Takes per-profile arrays of current rates and task event counts for the
+    window; returns the updated (completion, abandonment, overcommitment)
+    arrays. Profiles with no task activity keep their current rates.
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    completes = np.asarray(completes, dtype=np.float64)
+    abandons = np.asarray(abandons, dtype=np.float64)
+    task_events = starts + completes + abandons
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        completion_rate = completes / starts
+        abandonment_rate = abandons / task_events
+
+    completion = smooth(completion, np.nan_to_num(completion_rate), starts > 0)
+    abandon = smooth(abandon, np.nan_to_num(abandonment_rate), task_events > 0)
+    overcommit = overcommitment_step(overcommit, pending, abandon)
+
+    return completion, abandon, overcommit
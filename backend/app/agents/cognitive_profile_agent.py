@@ -6,20 +6,93 @@ This is what makes ORBIT unique - structured behavioral intelligence,
 not embeddings spam.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
+from sqlalchemy.dialects.postgresql import insert
 
+from app.agents._kernels import overcommitment_step, smooth, update_profiles
 from app.core.redis import RedisClient
 from app.models import (
     User, CognitiveProfile, BehavioralEvent, Task, Intent,
     TaskStatus, EventType,
 )
 from app.schemas import CognitiveInsight
-from app.services.ai_service import AIService
+from app.services.ai_service import ai_service
+from app.services.profile_cache import load_cached_profile
+
+
+# Insights are keyed by profile version, so the TTL only bounds staleness
+# of fields that change without bumping last_updated
+INSIGHTS_CACHE_TTL = 30
+
+# Insight templates, built once without validation; per-call values are
+# patched in with model_copy
+_OVERCOMMIT_INSIGHT = CognitiveInsight.model_construct(
+    type="suggestion",
+    message="You might be taking on more than you can complete. Consider focusing on fewer tasks.",
+    confidence=0.0,
+    related_metric="overcommitment_score",
+    suggested_action="Review pending tasks and defer some",
+)
+_ABANDONMENT_INSIGHT = CognitiveInsight.model_construct(
+    type="observation",
+    message="Many tasks are started but not finished. Smaller, more specific tasks might help.",
+    confidence=0.7,
+    related_metric="task_abandonment_rate",
+    suggested_action="Break tasks into 15-minute chunks",
+)
+_PEAK_HOURS_INSIGHT = CognitiveInsight.model_construct(
+    type="observation",
+    message="",
+    confidence=0.0,
+    related_metric="peak_focus_hours",
+    suggested_action=None,
+)
+_SHORT_FOCUS_INSIGHT = CognitiveInsight.model_construct(
+    type="suggestion",
+    message="Your focus sessions are quite short. Try committing to 25 minutes without interruption.",
+    confidence=0.6,
+    related_metric="average_focus_duration",
+    suggested_action="Use the Pomodoro technique",
+)
+_LONG_FOCUS_INSIGHT = CognitiveInsight.model_construct(
+    type="observation",
+    message="You can focus for long periods. Make sure to take breaks to maintain quality.",
+    confidence=0.7,
+    related_metric="average_focus_duration",
+    suggested_action=None,
+)
+_CONSISTENCY_INSIGHT = CognitiveInsight.model_construct(
+    type="observation",
+    message="You have good follow-through on tasks. Keep it up.",
+    confidence=0.0,
+    related_metric="consistency_score",
+    suggested_action=None,
+)
+
+
+# Profile columns a learning pass reads and rewrites; profiles created by
+# the batch pass start from the column defaults
+_LEARNED_COLUMNS = (
+    CognitiveProfile.task_completion_rate,
+    CognitiveProfile.task_abandonment_rate,
+    CognitiveProfile.overcommitment_score,
+    CognitiveProfile.average_focus_duration,
+    CognitiveProfile.peak_focus_hours,
+    CognitiveProfile.average_intents_per_day,
+    CognitiveProfile.data_points_collected,
+)
+_LEARNED_DEFAULTS = tuple(column.default.arg for column in _LEARNED_COLUMNS)
+
+
+def _utc_now() -> datetime:
+    """Current UTC time, naive to match the DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class CognitiveProfileAgent:
@@ -35,7 +108,7 @@ class CognitiveProfileAgent:
     def __init__(self, db: AsyncSession, redis: RedisClient):
         self.db = db
         self.redis = redis
-        self.ai_service = AIService()
+        self.ai_service = ai_service
 
     async def learn_from_events(
         self,
@@ -59,121 +132,406 @@ class CognitiveProfileAgent:
             self.db.add(profile)
             await self.db.flush()
 
-        # Get recent events
-        cutoff = datetime.utcnow() - timedelta(hours=lookback_hours)
-        events_result = await self.db.execute(
-            select(BehavioralEvent).where(
-                BehavioralEvent.user_id == user_id,
-                BehavioralEvent.created_at >= cutoff,
-                BehavioralEvent.is_analyzed == False,
+        # Window of unanalyzed events; the upper bound keeps rows inserted
+        # while we aggregate out of the bulk "analyzed" update below
+        now = _utc_now()
+        cutoff = now - timedelta(hours=lookback_hours)
+        window = (
+            BehavioralEvent.user_id == user_id,
+            BehavioralEvent.created_at >= cutoff,
+            BehavioralEvent.created_at <= now,
+            BehavioralEvent.is_analyzed == False,
+        )
+
+        # Aggregate server-side instead of hydrating every event row
+        counts_result = await self.db.execute(
+            select(
+                BehavioralEvent.event_type,
+                BehavioralEvent.entity_type,
+                func.count(BehavioralEvent.id),
+                func.count(func.distinct(func.date(BehavioralEvent.created_at))),
+            ).where(*window).group_by(
+                BehavioralEvent.event_type,
+                BehavioralEvent.entity_type,
             )
         )
-        events = events_result.scalars().all()
+        type_counts = counts_result.all()
+        events_analyzed = sum(row[2] for row in type_counts)
 
-        if not events:
+        if not events_analyzed:
             return {"message": "No new events to analyze"}
 
-        updates = await self._analyze_patterns(profile, events)
+        # Column values to write back; collected instead of set on the
+        # instance so the profile is saved with one UPDATE
+        changes = {}
+        updates = await self._analyze_patterns(
+            profile, type_counts, window, changes
+        )
 
-        # Mark events as analyzed
-        for event in events:
-            event.is_analyzed = True
-            event.contributed_to_profile = True
+        # Mark events as analyzed in a single statement
+        await self.db.execute(
+            update(BehavioralEvent).where(*window).values(
+                is_analyzed=True,
+                contributed_to_profile=True,
+            )
+        )
 
         # Update profile timestamp
-        profile.last_updated = datetime.utcnow()
-        profile.data_points_collected += len(events)
-        profile.profile_confidence = min(1.0, profile.data_points_collected / 100)
+        data_points = profile.data_points_collected + events_analyzed
+        changes["last_updated"] = now
+        changes["data_points_collected"] = data_points
+        changes["profile_confidence"] = min(1.0, data_points / 100)
 
+        await self.db.execute(
+            update(CognitiveProfile)
+            .where(CognitiveProfile.id == profile.id)
+            .values(**changes)
+            .execution_options(synchronize_session=False)
+        )
         await self.db.commit()
+        await self.redis.invalidate_cognitive_profile(str(user_id))
 
         return {
-            "events_analyzed": len(events),
+            "events_analyzed": events_analyzed,
             "updates": updates,
         }
 
+    async def learn_from_events_batch(
+        self,
+        user_ids: list[UUID],
+        lookback_hours: int = 24,
+    ) -> dict:
+        """
+        Run learn_from_events for many users at once.
+
+        Each aggregate is one grouped query over every user, the rate math
+        goes through the vectorized kernels, and all profiles are written
+        with a single upsert, so round-trips stay constant as users grow.
+        """
+        now = _utc_now()
+        cutoff = now - timedelta(hours=lookback_hours)
+        window = (
+            BehavioralEvent.user_id.in_(user_ids),
+            BehavioralEvent.created_at >= cutoff,
+            BehavioralEvent.created_at <= now,
+            BehavioralEvent.is_analyzed == False,
+        )
+
+        counts_result = await self.db.execute(
+            select(
+                BehavioralEvent.user_id,
+                BehavioralEvent.event_type,
+                BehavioralEvent.entity_type,
+                func.count(BehavioralEvent.id),
+                func.count(func.distinct(func.date(BehavioralEvent.created_at))),
+            ).where(*window).group_by(
+                BehavioralEvent.user_id,
+                BehavioralEvent.event_type,
+                BehavioralEvent.entity_type,
+            )
+        )
+        type_counts = counts_result.all()
+
+        if not type_counts:
+            return {"users_analyzed": 0, "events_analyzed": 0}
+
+        # Only users with new events are updated; row i of every array
+        # below belongs to learners[i]
+        learners = list(dict.fromkeys(row[0] for row in type_counts))
+        index = {user_id: i for i, user_id in enumerate(learners)}
+        size = len(learners)
+
+        events = np.zeros(size)
+        starts = np.zeros(size)
+        completes = np.zeros(size)
+        abandons = np.zeros(size)
+        intents = np.zeros(size)
+        intent_days = np.zeros(size)
+        for user_id, event_type, entity_type, count, days in type_counts:
+            i = index[user_id]
+            events[i] += count
+            if entity_type == "task":
+                if event_type == EventType.TASK_STARTED:
+                    starts[i] += count
+                elif event_type == EventType.TASK_COMPLETED:
+                    completes[i] += count
+                elif event_type == EventType.TASK_ABANDONED:
+                    abandons[i] += count
+            if event_type == EventType.INTENT_EXPRESSED:
+                intents[i] += count
+                intent_days[i] = max(intent_days[i], days)
+
+        # Hour-of-day histograms, one row per user
+        hours_result = await self.db.execute(
+            select(
+                BehavioralEvent.user_id,
+                BehavioralEvent.time_of_day,
+                func.count(BehavioralEvent.id),
+            ).where(
+                *window,
+                BehavioralEvent.time_of_day.isnot(None),
+            ).group_by(BehavioralEvent.user_id, BehavioralEvent.time_of_day)
+        )
+        hour_counts = np.zeros((size, 24))
+        for user_id, hour, count in hours_result.all():
+            hour_counts[index[user_id], hour] += count
+
+        # Average focus session length per user, pairing starts with ends
+        # as in _analyze_patterns but bounded and averaged in Postgres
+        focus_events = (
+            select(
+                BehavioralEvent.user_id,
+                BehavioralEvent.event_type,
+                BehavioralEvent.created_at,
+                func.lead(BehavioralEvent.event_type).over(
+                    partition_by=(BehavioralEvent.user_id, BehavioralEvent.entity_id),
+                    order_by=BehavioralEvent.created_at,
+                ).label("next_type"),
+                func.lead(BehavioralEvent.created_at).over(
+                    partition_by=(BehavioralEvent.user_id, BehavioralEvent.entity_id),
+                    order_by=BehavioralEvent.created_at,
+                ).label("next_at"),
+            ).where(
+                *window,
+                BehavioralEvent.event_type.in_([
+                    EventType.FOCUS_SESSION_START,
+                    EventType.FOCUS_SESSION_END,
+                ]),
+            ).subquery()
+        )
+        duration_minutes = (
+            func.extract("epoch", focus_events.c.next_at)
+            - func.extract("epoch", focus_events.c.created_at)
+        ) / 60
+        focus_result = await self.db.execute(
+            select(
+                focus_events.c.user_id,
+                func.avg(duration_minutes),
+            ).where(
+                focus_events.c.event_type == EventType.FOCUS_SESSION_START,
+                focus_events.c.next_type == EventType.FOCUS_SESSION_END,
+                duration_minutes > 5,
+                duration_minutes < 180,
+            ).group_by(focus_events.c.user_id)
+        )
+        focus_avg = np.full(size, np.nan)
+        for user_id, avg_duration in focus_result.all():
+            focus_avg[index[user_id]] = float(avg_duration)
+
+        pending_result = await self.db.execute(
+            select(Task.user_id, func.count(Task.id)).where(
+                Task.user_id.in_(learners),
+                Task.status == TaskStatus.PENDING,
+            ).group_by(Task.user_id)
+        )
+        pending = np.zeros(size, dtype=np.int64)
+        for user_id, count in pending_result.all():
+            pending[index[user_id]] = count
+
+        profiles_result = await self.db.execute(
+            select(CognitiveProfile.user_id, *_LEARNED_COLUMNS).where(
+                CognitiveProfile.user_id.in_(learners)
+            )
+        )
+        current = {row[0]: tuple(row[1:]) for row in profiles_result.all()}
+        (
+            old_completion,
+            old_abandon,
+            old_overcommit,
+            old_focus,
+            old_peak,
+            old_intents,
+            old_points,
+        ) = zip(*(current.get(user_id, _LEARNED_DEFAULTS) for user_id in learners))
+
+        completion, abandon, overcommit = update_profiles(
+            old_completion, old_abandon, old_overcommit,
+            starts, completes, abandons, pending,
+        )
+        focus = smooth(old_focus, np.nan_to_num(focus_avg), ~np.isnan(focus_avg))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            intent_rate = np.where(
+                intents > 0, intents / np.maximum(1, intent_days), old_intents
+            )
+        points = np.asarray(old_points) + events
+
+        rows = []
+        for i, user_id in enumerate(learners):
+            peak = old_peak[i]
+            if np.count_nonzero(hour_counts[i]) >= 3:
+                top_hours = np.argsort(-hour_counts[i], kind="stable")[:4]
+                peak = top_hours[hour_counts[i][top_hours] > 0].tolist()
+            rows.append({
+                "user_id": user_id,
+                "task_completion_rate": float(completion[i]),
+                "task_abandonment_rate": float(abandon[i]),
+                "overcommitment_score": float(overcommit[i]),
+                "average_focus_duration": int(focus[i]),
+                "peak_focus_hours": peak,
+                "average_intents_per_day": float(intent_rate[i]),
+                "data_points_collected": int(points[i]),
+                "profile_confidence": min(1.0, float(points[i]) / 100),
+                "last_updated": now,
+            })
+
+        upsert = insert(CognitiveProfile).values(rows)
+        await self.db.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[CognitiveProfile.user_id],
+                set_={key: upsert.excluded[key] for key in rows[0] if key != "user_id"},
+            )
+        )
+
+        await self.db.execute(
+            update(BehavioralEvent).where(*window).values(
+                is_analyzed=True,
+                contributed_to_profile=True,
+            )
+        )
+        await self.db.commit()
+        await self.redis.invalidate_cognitive_profiles([str(user_id) for user_id in learners])
+
+        return {
+            "users_analyzed": size,
+            "events_analyzed": int(events.sum()),
+        }
+
     async def _analyze_patterns(
         self,
         profile: CognitiveProfile,
-        events: list[BehavioralEvent],
+        type_counts: list,
+        window: tuple,
+        changes: dict,
     ) -> dict:
-        """Analyze events and update profile patterns."""
+        """
+        Analyze events and update profile patterns.
+
+        `type_counts` holds (event_type, entity_type, count, distinct_days)
+        aggregates for the window; `window` is the WHERE clause that selects
+        the events being analyzed. New column values are written to
+        `changes` rather than to `profile`.
+        """
         updates = {}
 
         # Analyze work hours
-        work_hours = [e.time_of_day for e in events if e.time_of_day is not None]
-        if work_hours:
-            avg_hour = sum(work_hours) / len(work_hours)
+        hours_result = await self.db.execute(
+            select(
+                BehavioralEvent.time_of_day,
+                func.count(BehavioralEvent.id),
+            ).where(
+                *window,
+                BehavioralEvent.time_of_day.isnot(None),
+            ).group_by(BehavioralEvent.time_of_day)
+        )
+        hour_rows = hours_result.all()
+        if hour_rows:
+            hours, hour_totals = np.array(hour_rows, dtype=np.int64).T
+            counts = np.bincount(hours, weights=hour_totals, minlength=24)
+            avg_hour = float(np.average(np.arange(counts.size), weights=counts))
             updates["avg_active_hour"] = avg_hour
 
             # Update peak focus hours (weighted average with existing)
-            active_hours = list(set(work_hours))
-            if len(active_hours) >= 3:
+            if np.count_nonzero(counts) >= 3:
                 # Find top 4 most common hours
-                hour_counts = {}
-                for h in work_hours:
-                    hour_counts[h] = hour_counts.get(h, 0) + 1
-                top_hours = sorted(hour_counts.keys(), key=lambda x: -hour_counts[x])[:4]
-                profile.peak_focus_hours = top_hours
+                top_hours = np.argsort(-counts, kind="stable")[:4]
+                top_hours = top_hours[counts[top_hours] > 0]
+                changes["peak_focus_hours"] = top_hours.tolist()
 
         # Analyze task patterns
-        task_events = [e for e in events if e.entity_type == "task"]
-        
-        starts = len([e for e in task_events if e.event_type == EventType.TASK_STARTED])
-        completes = len([e for e in task_events if e.event_type == EventType.TASK_COMPLETED])
-        abandons = len([e for e in task_events if e.event_type == EventType.TASK_ABANDONED])
+        task_counts = {
+            event_type: count
+            for event_type, entity_type, count, _ in type_counts
+            if entity_type == "task"
+        }
+        starts = task_counts.get(EventType.TASK_STARTED, 0)
+        completes = task_counts.get(EventType.TASK_COMPLETED, 0)
+        abandons = task_counts.get(EventType.TASK_ABANDONED, 0)
 
         if starts > 0:
             # Update completion rate (smoothed)
             session_completion_rate = completes / starts
-            profile.task_completion_rate = (
-                0.8 * profile.task_completion_rate + 0.2 * session_completion_rate
+            changes["task_completion_rate"] = float(
+                smooth(profile.task_completion_rate, session_completion_rate)
             )
             updates["session_completion_rate"] = session_completion_rate
 
         if starts + completes + abandons > 0:
             session_abandonment_rate = abandons / (starts + completes + abandons)
-            profile.task_abandonment_rate = (
-                0.8 * profile.task_abandonment_rate + 0.2 * session_abandonment_rate
+            changes["task_abandonment_rate"] = float(
+                smooth(profile.task_abandonment_rate, session_abandonment_rate)
             )
             updates["session_abandonment_rate"] = session_abandonment_rate
 
-        # Analyze focus sessions
-        focus_starts = [e for e in events if e.event_type == EventType.FOCUS_SESSION_START]
-        focus_ends = [e for e in events if e.event_type == EventType.FOCUS_SESSION_END]
-
-        if focus_starts and focus_ends:
-            # Calculate average focus duration
-            durations = []
-            for start_event in focus_starts:
-                for end_event in focus_ends:
-                    if (end_event.entity_id == start_event.entity_id and
-                        end_event.created_at > start_event.created_at):
-                        duration = (end_event.created_at - start_event.created_at).seconds / 60
-                        if 5 < duration < 180:  # Reasonable bounds
-                            durations.append(duration)
-                        break
-
-            if durations:
-                avg_duration = sum(durations) / len(durations)
-                profile.average_focus_duration = int(
-                    0.8 * profile.average_focus_duration + 0.2 * avg_duration
-                )
-                updates["avg_focus_duration"] = avg_duration
+        # Analyze focus sessions: pair each start with the next focus event
+        # on the same entity when that event is an end
+        focus_events = (
+            select(
+                BehavioralEvent.event_type,
+                BehavioralEvent.created_at,
+                func.lead(BehavioralEvent.event_type).over(
+                    partition_by=BehavioralEvent.entity_id,
+                    order_by=BehavioralEvent.created_at,
+                ).label("next_type"),
+                func.lead(BehavioralEvent.created_at).over(
+                    partition_by=BehavioralEvent.entity_id,
+                    order_by=BehavioralEvent.created_at,
+                ).label("next_at"),
+            ).where(
+                *window,
+                BehavioralEvent.event_type.in_([
+                    EventType.FOCUS_SESSION_START,
+                    EventType.FOCUS_SESSION_END,
+                ]),
+            ).subquery()
+        )
+        # Stream pair durations (minutes, from epoch seconds in Postgres) and
+        # keep running totals instead of a list
+        duration_minutes = (
+            func.extract("epoch", focus_events.c.next_at)
+            - func.extract("epoch", focus_events.c.created_at)
+        ) / 60
+        pairs_result = await self.db.stream_scalars(
+            select(duration_minutes).where(
+                focus_events.c.event_type == EventType.FOCUS_SESSION_START,
+                focus_events.c.next_type == EventType.FOCUS_SESSION_END,
+            ).execution_options(yield_per=1000)
+        )
+
+        total_duration = 0.0
+        session_count = 0
+        async for duration in pairs_result:
+            duration = float(duration)
+            if 5 < duration < 180:  # Reasonable bounds
+                total_duration += duration
+                session_count += 1
+
+        if session_count:
+            avg_duration = total_duration / session_count
+            changes["average_focus_duration"] = int(
+                smooth(profile.average_focus_duration, avg_duration)
+            )
+            updates["avg_focus_duration"] = avg_duration
 
         # Analyze intent patterns
-        intent_events = [e for e in events if e.event_type == EventType.INTENT_EXPRESSED]
-        if intent_events:
-            profile.average_intents_per_day = len(intent_events) / max(1, len(set(
-                e.created_at.date() for e in intent_events
-            )))
+        intent_count = 0
+        intent_days = 0
+        for event_type, _, count, days in type_counts:
+            if event_type == EventType.INTENT_EXPRESSED:
+                intent_count += count
+                intent_days = max(intent_days, days)
+        if intent_count:
+            changes["average_intents_per_day"] = intent_count / max(1, intent_days)
 
         # Detect overcommitment
-        await self._detect_overcommitment(profile)
+        await self._detect_overcommitment(profile, changes)
 
         return updates
 
-    async def _detect_overcommitment(self, profile: CognitiveProfile):
+    async def _detect_overcommitment(
+        self,
+        profile: CognitiveProfile,
+        changes: dict,
+    ):
         """Detect if user tends to overcommit."""
         # Get pending tasks count
         pending_result = await self.db.execute(
@@ -184,11 +542,23 @@ class CognitiveProfileAgent:
         )
         pending_count = pending_result.scalar() or 0
 
-        # High pending + high abandonment = overcommitment
-        if pending_count > 10 and profile.task_abandonment_rate > 0.3:
-            profile.overcommitment_score = min(1.0, profile.overcommitment_score + 0.1)
-        elif pending_count < 5 and profile.task_abandonment_rate < 0.2:
-            profile.overcommitment_score = max(0.0, profile.overcommitment_score - 0.05)
+        abandonment_rate = changes.get(
+            "task_abandonment_rate", profile.task_abandonment_rate
+        )
+        changes["overcommitment_score"] = float(
+            overcommitment_step(
+                profile.overcommitment_score,
+                pending_count,
+                abandonment_rate,
+            )
+        )
+
+    async def get_cached_profile(
+        self,
+        user_id: UUID,
+    ) -> Optional[CognitiveProfile]:
+        """Get the cognitive profile for read-only use; see load_cached_profile."""
+        return await load_cached_profile(self.db, self.redis, user_id)
 
     async def generate_insights(
         self,
@@ -202,72 +572,56 @@ class CognitiveProfileAgent:
         - Observations over judgments
         - Calm, helpful tone
         """
-        result = await self.db.execute(
-            select(CognitiveProfile).where(CognitiveProfile.user_id == user_id)
-        )
-        profile = result.scalar_one_or_none()
+        profile = await self.get_cached_profile(user_id)
         
         if not profile or profile.profile_confidence < 0.2:
             return []
 
+        # A new last_updated from learning makes older entries unreachable
+        version = int(profile.last_updated.timestamp()) if profile.last_updated else 0
+        cached = await self.redis.get_cached_insights(str(user_id), version)
+        if cached is not None:
+            return [CognitiveInsight.model_construct(**item) for item in cached]
+
         insights = []
 
         # Overcommitment insight
         if profile.overcommitment_score > 0.6:
-            insights.append(CognitiveInsight(
-                type="suggestion",
-                message="You might be taking on more than you can complete. Consider focusing on fewer tasks.",
-                confidence=profile.overcommitment_score,
-                related_metric="overcommitment_score",
-                suggested_action="Review pending tasks and defer some",
+            insights.append(_OVERCOMMIT_INSIGHT.model_copy(
+                update={"confidence": profile.overcommitment_score}
             ))
 
         # Abandonment pattern
         if profile.task_abandonment_rate > 0.4:
-            insights.append(CognitiveInsight(
-                type="observation",
-                message="Many tasks are started but not finished. Smaller, more specific tasks might help.",
-                confidence=0.7,
-                related_metric="task_abandonment_rate",
-                suggested_action="Break tasks into 15-minute chunks",
-            ))
+            insights.append(_ABANDONMENT_INSIGHT.model_copy())
 
         # Peak hours suggestion
         if profile.peak_focus_hours:
             peak = profile.peak_focus_hours[0]
-            insights.append(CognitiveInsight(
-                type="observation",
-                message=f"You seem most active around {peak}:00. Consider scheduling important work then.",
-                confidence=profile.profile_confidence,
-                related_metric="peak_focus_hours",
-            ))
+            insights.append(_PEAK_HOURS_INSIGHT.model_copy(update={
+                "message": f"You seem most active around {peak}:00. Consider scheduling important work then.",
+                "confidence": profile.profile_confidence,
+            }))
 
         # Focus duration optimization
         if profile.average_focus_duration < 20:
-            insights.append(CognitiveInsight(
-                type="suggestion",
-                message="Your focus sessions are quite short. Try committing to 25 minutes without interruption.",
-                confidence=0.6,
-                related_metric="average_focus_duration",
-                suggested_action="Use the Pomodoro technique",
-            ))
+            insights.append(_SHORT_FOCUS_INSIGHT.model_copy())
         elif profile.average_focus_duration > 60:
-            insights.append(CognitiveInsight(
-                type="observation",
-                message="You can focus for long periods. Make sure to take breaks to maintain quality.",
-                confidence=0.7,
-                related_metric="average_focus_duration",
-            ))
+            insights.append(_LONG_FOCUS_INSIGHT.model_copy())
 
         # Consistency check
         if profile.consistency_score > 0.7:
-            insights.append(CognitiveInsight(
-                type="observation",
-                message="You have good follow-through on tasks. Keep it up.",
-                confidence=profile.consistency_score,
-                related_metric="consistency_score",
+            insights.append(_CONSISTENCY_INSIGHT.model_copy(
+                update={"confidence": profile.consistency_score}
             ))
 
+        await self.redis.cache_insights(
+            str(user_id),
+            version,
+            [insight.model_dump() for insight in insights],
+            ttl=INSIGHTS_CACHE_TTL,
+        )
+
         return insights
 
     async def detect_overwhelm(
@@ -283,45 +637,39 @@ class CognitiveProfileAgent:
         - Short focus sessions
         - High intent frequency
         """
-        # Get profile
-        result = await self.db.execute(
-            select(CognitiveProfile).where(CognitiveProfile.user_id == user_id)
-        )
-        profile = result.scalar_one_or_none()
-        if not profile:
-            return None
-
-        # Get recent data
-        now = datetime.utcnow()
+        now = _utc_now()
         hour_ago = now - timedelta(hours=1)
 
-        # Recent abandonments
-        abandon_result = await self.db.execute(
-            select(func.count(BehavioralEvent.id)).where(
-                BehavioralEvent.user_id == user_id,
-                BehavioralEvent.event_type == EventType.TASK_ABANDONED,
-                BehavioralEvent.created_at >= hour_ago,
-            )
-        )
-        recent_abandons = abandon_result.scalar() or 0
+        profile = await self.get_cached_profile(user_id)
+        if not profile:
+            return None
 
-        # Pending tasks
-        pending_result = await self.db.execute(
-            select(func.count(Task.id)).where(
-                Task.user_id == user_id,
-                Task.status == TaskStatus.PENDING,
-            )
-        )
-        pending_count = pending_result.scalar() or 0
+        # The three recent-activity counts in one round trip
+        recent_abandons_q = select(func.count(BehavioralEvent.id)).where(
+            BehavioralEvent.user_id == user_id,
+            BehavioralEvent.event_type == EventType.TASK_ABANDONED,
+            BehavioralEvent.created_at >= hour_ago,
+        ).scalar_subquery()
+        pending_count_q = select(func.count(Task.id)).where(
+            Task.user_id == user_id,
+            Task.status == TaskStatus.PENDING,
+        ).scalar_subquery()
+        recent_intents_q = select(func.count(Intent.id)).where(
+            Intent.user_id == user_id,
+            Intent.created_at >= hour_ago,
+        ).scalar_subquery()
 
-        # Recent intents
-        intent_result = await self.db.execute(
-            select(func.count(Intent.id)).where(
-                Intent.user_id == user_id,
-                Intent.created_at >= hour_ago,
+        result = await self.db.execute(
+            select(
+                recent_abandons_q.label("recent_abandons"),
+                pending_count_q.label("pending_count"),
+                recent_intents_q.label("recent_intents"),
             )
         )
-        recent_intents = intent_result.scalar() or 0
+        row = result.one()
+        recent_abandons = row.recent_abandons or 0
+        pending_count = row.pending_count or 0
+        recent_intents = row.recent_intents or 0
 
         # Calculate overwhelm score
         overwhelm_score = 0.0
@@ -362,9 +710,9 @@ class CognitiveProfileAgent:
         
         ORBIT philosophy: It's okay to do less.
         """
-        # Get the single most important pending task
+        # Get the single most important pending task (only the columns used)
         result = await self.db.execute(
-            select(Task).where(
+            select(Task.id, Task.title, Task.estimated_minutes).where(
                 Task.user_id == user_id,
                 Task.status == TaskStatus.PENDING,
             ).order_by(
@@ -372,7 +720,7 @@ class CognitiveProfileAgent:
                 Task.created_at.asc(),
             ).limit(1)
         )
-        top_task = result.scalar_one_or_none()
+        top_task = result.one_or_none()
 
         if not top_task:
             return {
@@ -380,16 +728,7 @@ class CognitiveProfileAgent:
                 "suggested_task": None,
             }
 
-        # Defer all other tasks
-        await self.db.execute(
-            select(Task).where(
-                Task.user_id == user_id,
-                Task.status == TaskStatus.PENDING,
-                Task.id != top_task.id,
-            )
-        )
-        # Note: Not actually deferring here, just suggesting
-
+        # Other tasks are only suggested for deferral, not deferred here
         return {
             "message": "Focus on just this one thing",
             "suggested_task": {
@@ -8,14 +8,16 @@ This is the core agent loop that makes ORBIT intelligent.
 """
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
+import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import async_session_maker
 from app.core.redis import RedisClient
-from app.models import Intent, CognitiveProfile
+from app.models import Intent
 from app.schemas import PlanResponse, EvaluationResponse, CognitiveInsight
 from app.services.intent_service import IntentService
 from app.services.planner_service import PlannerService
@@ -23,6 +25,27 @@ from app.services.executor_service import ExecutorService
 from app.services.evaluator_service import EvaluatorService
 from app.agents.cognitive_profile_agent import CognitiveProfileAgent
 
+logger = structlog.get_logger()
+
+
+class _DeferredEvents:
+    """
+    RedisClient view for the agent's services.
+
+    publish_event joins the agent's broadcast buffer instead of making its
+    own round trip; everything else goes straight to the real client.
+    """
+
+    def __init__(self, redis: RedisClient, agent: "OrchestratorAgent"):
+        self._redis = redis
+        self._agent = agent
+
+    def __getattr__(self, name: str):
+        return getattr(self._redis, name)
+
+    async def publish_event(self, channel: str, event: dict) -> None:
+        self._agent._queue_event(channel, event)
+
 
 class OrchestratorAgent:
     """
@@ -38,12 +61,17 @@ class OrchestratorAgent:
         self.db = db
         self.redis = redis
         
-        # Initialize services
-        self.intent_service = IntentService(db, redis)
-        self.planner_service = PlannerService(db, redis)
-        self.executor_service = ExecutorService(db, redis)
-        self.evaluator_service = EvaluatorService(db, redis)
-        self.profile_agent = CognitiveProfileAgent(db, redis)
+        # Initialize services; their events are batched with our thoughts
+        events = _DeferredEvents(redis, self)
+        self.intent_service = IntentService(db, events)
+        self.planner_service = PlannerService(db, events)
+        self.executor_service = ExecutorService(db, events)
+        self.evaluator_service = EvaluatorService(db, events)
+        self.profile_agent = CognitiveProfileAgent(db, events)
+
+        # (channel, event) broadcasts queued during the current pipeline run
+        self._event_buffer: list[tuple[str, dict]] = []
+        self._pending_thoughts: list[asyncio.Task] = []
 
     async def process_intent(
         self,
@@ -62,72 +90,75 @@ class OrchestratorAgent:
         4. Generate plan (optional)
         5. Broadcast updates
         """
-        result = {
-            "steps_completed": [],
-            "intent": None,
-            "interpretation": None,
-            "overwhelm_check": None,
-            "plan": None,
-        }
-
-        # Step 1: Create intent
-        await self._broadcast_thought(user_id, "Processing intent...")
-        intent = await self.intent_service.create_intent(
-            user_id=user_id,
-            raw_input=raw_input,
-            source=source,
-        )
-        result["intent"] = intent
-        result["steps_completed"].append("create_intent")
-
-        # Step 2: Interpret
-        await self._broadcast_thought(user_id, "Understanding...")
-        interpretation = await self.intent_service.interpret_intent(
-            intent_id=intent.id,
-            user_id=user_id,
-        )
-        result["interpretation"] = interpretation
-        result["steps_completed"].append("interpret")
+        try:
+            result = {
+                "steps_completed": [],
+                "intent": None,
+                "interpretation": None,
+                "overwhelm_check": None,
+                "plan": None,
+            }
 
-        # Step 3: Check for overwhelm
-        overwhelm = await self.profile_agent.detect_overwhelm(user_id)
-        result["overwhelm_check"] = overwhelm
-        
-        if overwhelm and overwhelm.get("is_overwhelmed"):
-            await self._broadcast_thought(
-                user_id, 
-                "I notice you have a lot going on. Would you like to focus on just one thing?"
+            # Step 1: Create intent
+            self._emit(user_id, "Processing intent...")
+            intent = await self.intent_service.create_intent(
+                user_id=user_id,
+                raw_input=raw_input,
+                source=source,
             )
-            result["suggestion"] = await self.profile_agent.suggest_scope_reduction(user_id)
-            return result
+            result["intent"] = intent
+            result["steps_completed"].append("create_intent")
 
-        # Step 4: Generate plan (if auto_plan enabled)
-        if auto_plan and not interpretation.is_ambiguous:
-            await self._broadcast_thought(user_id, "Creating plan...")
-            
-            try:
-                plan = await self.planner_service.create_plan(
-                    user_id=user_id,
+            # Step 2 & 3: Interpret and check for overwhelm concurrently
+            self._emit(user_id, "Understanding...")
+            interpretation, overwhelm = await asyncio.gather(
+                self.intent_service.interpret_intent(
                     intent_id=intent.id,
-                    max_tasks=5,
-                )
-                result["plan"] = plan
-                result["steps_completed"].append("plan")
-                
-                await self._broadcast_thought(
+                    user_id=user_id,
+                ),
+                self._detect_overwhelm_isolated(user_id),
+            )
+            result["interpretation"] = interpretation
+            result["steps_completed"].append("interpret")
+            result["overwhelm_check"] = overwhelm
+
+            if overwhelm and overwhelm.get("is_overwhelmed"):
+                self._emit(
                     user_id, 
-                    f"Plan ready with {len(plan.steps)} steps"
+                    "I notice you have a lot going on. Would you like to focus on just one thing?"
+                )
+                result["suggestion"] = await self.profile_agent.suggest_scope_reduction(user_id)
+                return result
+
+            # Step 4: Generate plan (if auto_plan enabled)
+            if auto_plan and not interpretation.is_ambiguous:
+                self._emit(user_id, "Creating plan...")
+
+                try:
+                    plan = await self.planner_service.create_plan(
+                        user_id=user_id,
+                        intent_id=intent.id,
+                        max_tasks=5,
+                    )
+                    result["plan"] = plan
+                    result["steps_completed"].append("plan")
+
+                    self._emit(
+                        user_id, 
+                        f"Plan ready with {len(plan.steps)} steps"
+                    )
+                except Exception as e:
+                    result["plan_error"] = str(e)
+
+            elif interpretation.is_ambiguous:
+                self._emit(
+                    user_id,
+                    interpretation.suggested_clarification or "Could you tell me more?"
                 )
-            except Exception as e:
-                result["plan_error"] = str(e)
-        
-        elif interpretation.is_ambiguous:
-            await self._broadcast_thought(
-                user_id,
-                interpretation.suggested_clarification or "Could you tell me more?"
-            )
 
-        return result
+            return result
+        finally:
+            await self._flush_thoughts()
 
     async def complete_task_and_learn(
         self,
@@ -145,45 +176,48 @@ class OrchestratorAgent:
         3. Update cognitive profile
         4. Generate insights
         """
-        result = {
-            "completion": None,
-            "evaluation": None,
-            "insights": [],
-        }
+        try:
+            result = {
+                "completion": None,
+                "evaluation": None,
+                "insights": [],
+            }
 
-        # Step 1: Complete task
-        completion = await self.executor_service.complete_task(
-            user_id=user_id,
-            task_id=task_id,
-            completion_notes=completion_notes,
-            actual_minutes=actual_minutes,
-        )
-        result["completion"] = completion
+            # Step 1: Complete task
+            completion = await self.executor_service.complete_task(
+                user_id=user_id,
+                task_id=task_id,
+                completion_notes=completion_notes,
+                actual_minutes=actual_minutes,
+            )
+            result["completion"] = completion
 
-        # Step 2: Evaluate
-        await self._broadcast_thought(user_id, "Learning from this...")
-        
-        evaluation = await self.evaluator_service.evaluate(
-            user_id=user_id,
-            task_id=task_id,
-        )
-        result["evaluation"] = evaluation
+            # Step 2: Evaluate
+            self._emit(user_id, "Learning from this...")
 
-        # Step 3: Trigger profile learning (background)
-        asyncio.create_task(
-            self._learn_in_background(user_id)
-        )
+            evaluation = await self.evaluator_service.evaluate(
+                user_id=user_id,
+                task_id=task_id,
+            )
+            result["evaluation"] = evaluation
 
-        # Step 4: Get insights
-        insights = await self.profile_agent.generate_insights(user_id)
-        result["insights"] = insights
+            # Step 3: Trigger profile learning (background)
+            asyncio.create_task(
+                self._learn_in_background(user_id)
+            )
+
+            # Step 4: Get insights
+            insights = await self.profile_agent.generate_insights(user_id)
+            result["insights"] = insights
 
-        if insights:
-            # Broadcast most relevant insight
-            top_insight = insights[0]
-            await self._broadcast_thought(user_id, top_insight.message)
+            if insights:
+                # Broadcast most relevant insight
+                top_insight = insights[0]
+                self._emit(user_id, top_insight.message)
 
-        return result
+            return result
+        finally:
+            await self._flush_thoughts()
 
     async def abandon_task_and_learn(
         self,
@@ -199,50 +233,53 @@ class OrchestratorAgent:
         - Learn from what didn't work
         - Suggest alternatives without judgment
         """
-        result = {
-            "abandonment": None,
-            "evaluation": None,
-            "suggestion": None,
-        }
-
-        # Abandon task
-        abandonment = await self.executor_service.abandon_task(
-            user_id=user_id,
-            task_id=task_id,
-            reason=reason,
-        )
-        result["abandonment"] = abandonment
-
-        # Evaluate
-        await self._broadcast_thought(user_id, "That's okay. Learning from this...")
-        
-        evaluation = await self.evaluator_service.evaluate(
-            user_id=user_id,
-            task_id=task_id,
-        )
-        result["evaluation"] = evaluation
+        try:
+            result = {
+                "abandonment": None,
+                "evaluation": None,
+                "suggestion": None,
+            }
 
-        # Trigger learning
-        asyncio.create_task(
-            self._learn_in_background(user_id)
-        )
+            # Abandon task
+            abandonment = await self.executor_service.abandon_task(
+                user_id=user_id,
+                task_id=task_id,
+                reason=reason,
+            )
+            result["abandonment"] = abandonment
 
-        # Suggest next action
-        suggestion = await self.profile_agent.suggest_scope_reduction(user_id)
-        result["suggestion"] = suggestion
+            # Evaluate
+            self._emit(user_id, "That's okay. Learning from this...")
 
-        if suggestion.get("suggested_task"):
-            await self._broadcast_thought(
-                user_id,
-                f"How about focusing on: {suggestion['suggested_task']['title']}"
+            evaluation = await self.evaluator_service.evaluate(
+                user_id=user_id,
+                task_id=task_id,
             )
-        else:
-            await self._broadcast_thought(
-                user_id,
-                "Take a moment. No rush."
+            result["evaluation"] = evaluation
+
+            # Trigger learning
+            asyncio.create_task(
+                self._learn_in_background(user_id)
             )
 
-        return result
+            # Suggest next action
+            suggestion = await self.profile_agent.suggest_scope_reduction(user_id)
+            result["suggestion"] = suggestion
+
+            if suggestion.get("suggested_task"):
+                self._emit(
+                    user_id,
+                    f"How about focusing on: {suggestion['suggested_task']['title']}"
+                )
+            else:
+                self._emit(
+                    user_id,
+                    "Take a moment. No rush."
+                )
+
+            return result
+        finally:
+            await self._flush_thoughts()
 
     async def get_focus_suggestion(
         self,
@@ -264,13 +301,9 @@ class OrchestratorAgent:
             }
 
         # Check time of day against peak hours
-        from sqlalchemy import select
-        result = await self.db.execute(
-            select(CognitiveProfile).where(CognitiveProfile.user_id == user_id)
-        )
-        profile = result.scalar_one_or_none()
+        profile = await self.profile_agent.get_cached_profile(user_id)
 
-        current_hour = datetime.utcnow().hour
+        current_hour = datetime.now(timezone.utc).hour
         
         if profile and profile.peak_focus_hours:
             if current_hour in profile.peak_focus_hours:
@@ -296,6 +329,17 @@ class OrchestratorAgent:
             **suggestion,
         }
 
+    async def _detect_overwhelm_isolated(self, user_id: UUID) -> dict:
+        """
+        Run overwhelm detection on its own session.
+
+        AsyncSession is not safe for concurrent use, so this lets the check
+        overlap with work running on self.db.
+        """
+        async with async_session_maker() as session:
+            agent = CognitiveProfileAgent(session, self.redis)
+            return await agent.detect_overwhelm(user_id)
+
     async def _learn_in_background(self, user_id: UUID):
         """Run learning process in background."""
         try:
@@ -303,13 +347,48 @@ class OrchestratorAgent:
         except Exception as e:
             print(f"Background learning error: {e}")
 
-    async def _broadcast_thought(self, user_id: UUID, message: str):
-        """Broadcast an AI thought to the user."""
-        await self.redis.publish_event(
+    def _emit(self, user_id: UUID, message: str):
+        """Queue a thought broadcast without blocking the pipeline."""
+        self._queue_event(
             f"user:{user_id}:events",
             {
                 "type": "thought_signal",
                 "payload": {"message": message},
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
             },
         )
+
+    def _queue_event(self, channel: str, event: dict):
+        """
+        Queue an event publish without blocking the pipeline.
+
+        Events queued while a publish is in flight are sent together in
+        the next pipeline, in the order they were queued.
+        """
+        self._event_buffer.append((channel, event))
+        if not self._pending_thoughts or self._pending_thoughts[-1].done():
+            self._pending_thoughts.append(
+                asyncio.create_task(self._broadcast_thoughts())
+            )
+
+    async def _flush_thoughts(self):
+        """
+        Wait for queued broadcasts and log any publish errors.
+
+        Runs in the pipelines' finally blocks, so a failed publish must not
+        replace the pipeline's own exception or fail a finished pipeline.
+        """
+        tasks, self._pending_thoughts = self._pending_thoughts, []
+        if tasks:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for error in results:
+                if isinstance(error, Exception):
+                    logger.error("Thought broadcast failed", error=str(error))
+
+    async def _broadcast_thoughts(self):
+        """Broadcast buffered thoughts and service events, one round trip per burst."""
+        while self._event_buffer:
+            batch, self._event_buffer = self._event_buffer, []
+            async with self.redis.pipeline() as pipe:
+                for channel, event in batch:
+                    pipe.publish_event(channel, event)
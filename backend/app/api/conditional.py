@@ -0,0 +1,38 @@
+"""
+ORBIT - Conditional GET Helpers
+ETags for endpoints the UI polls, so unchanged data costs a 304
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values that determine a response.
+
+    Uses a stable digest rather than hash(), so every worker process
+    agrees on the tag.
+    """
+    digest = hashlib.blake2b(
+        "|".join(map(str, parts)).encode(),
+        digest_size=12,
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 if the client already holds this version, else None."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+
+    tags = {tag.strip() for tag in header.split(",")}
+    if etag in tags or "*" in tags:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag},
+        )
+    return None
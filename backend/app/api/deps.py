@@ -2,9 +2,11 @@
 ORBIT - Authentication Dependencies
 """
 
+import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -15,6 +17,7 @@ from sqlalchemy import select
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.redis import redis_client
 from app.models import User
 from app.schemas import TokenData
 
@@ -24,6 +27,36 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Cached users live as long as the tokens that look them up
+USER_CACHE_TTL = settings.access_token_expire_minutes * 60
+
+# Columns kept in the user cache; the password hash never leaves Postgres
+_CACHED_USER_FIELDS = (
+    "email", "name", "voice_enabled", "timezone", "language",
+    "is_active", "is_verified",
+)
+_CACHED_USER_TIMESTAMPS = ("created_at", "updated_at", "last_active_at")
+
+
+def _user_to_cache(user: User) -> dict:
+    """Serialize the fields request handlers read off the current user."""
+    data = {"id": str(user.id)}
+    for name in _CACHED_USER_FIELDS:
+        data[name] = getattr(user, name)
+    for name in _CACHED_USER_TIMESTAMPS:
+        value = getattr(user, name)
+        data[name] = value.isoformat() if value else None
+    return data
+
+
+def _user_from_cache(data: dict) -> User:
+    """Rebuild a detached User from its cached projection."""
+    values = {name: data.get(name) for name in _CACHED_USER_FIELDS}
+    for name in _CACHED_USER_TIMESTAMPS:
+        value = data.get(name)
+        values[name] = datetime.fromisoformat(value) if value else None
+    return User(id=UUID(data["id"]), **values)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
@@ -47,6 +80,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         )
     
     to_encode.update({"exp": expire})
+    to_encode.setdefault("jti", uuid4().hex)
     encoded_jwt = jwt.encode(
         to_encode,
         settings.secret_key,
@@ -55,11 +89,25 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def decode_access_token(token: str) -> dict:
+    """Decode and validate a JWT access token."""
+    return jwt.decode(
+        token,
+        settings.secret_key,
+        algorithms=[settings.algorithm],
+    )
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
 ) -> User:
-    """Get the current authenticated user."""
+    """
+    Get the current authenticated user.
+
+    Users are served from Redis when cached, so handlers must not rely on
+    the returned instance being attached to the session.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -67,11 +115,7 @@ async def get_current_user(
     )
     
     try:
-        payload = jwt.decode(
-            token,
-            settings.secret_key,
-            algorithms=[settings.algorithm],
-        )
+        payload = decode_access_token(token)
         user_id: str = payload.get("sub")
         email: str = payload.get("email")
         
@@ -80,27 +124,40 @@ async def get_current_user(
             
         token_data = TokenData(user_id=UUID(user_id), email=email)
         
-    except JWTError:
+    except (JWTError, ValueError):
         raise credentials_exception
-    
-    result = await db.execute(
-        select(User).where(User.id == token_data.user_id)
-    )
-    user = result.scalar_one_or_none()
-    
-    if user is None:
+
+    jti = payload.get("jti")
+    if jti and await redis_client.is_token_revoked(jti):
         raise credentials_exception
-    
+
+    cached = await redis_client.get_cached_user(user_id)
+    if cached:
+        user = _user_from_cache(cached)
+    else:
+        result = await db.execute(
+            select(User).where(User.id == token_data.user_id)
+        )
+        user = result.scalar_one_or_none()
+
+        if user is None:
+            raise credentials_exception
+
+        # Update last active (refreshed whenever the cache entry expires)
+        user.last_active_at = datetime.utcnow()
+        await db.commit()
+
+        await asyncio.gather(
+            redis_client.cache_user(user_id, _user_to_cache(user), ttl=USER_CACHE_TTL),
+            redis_client.mark_user_active(user_id, time.time()),
+        )
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user",
         )
-    
-    # Update last active
-    user.last_active_at = datetime.utcnow()
-    await db.commit()
-    
+
     return user
 
 
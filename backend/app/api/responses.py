@@ -0,0 +1,34 @@
+"""
+ORBIT - Response Classes
+orjson rendering for route return values
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """Encode values orjson has no native support for."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson.
+
+    Routes return this directly to skip jsonable_encoder and response model
+    validation. UUIDs, datetimes and numpy arrays encode natively; pydantic
+    models nested in the content are dumped on the way out.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
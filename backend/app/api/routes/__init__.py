@@ -1,19 +1,10 @@
 """
 ORBIT - API Routes
+
+Route modules are imported on first access (PEP 562).
 """
 
-from app.api.routes import (
-    auth,
-    intent,
-    planner,
-    executor,
-    evaluator,
-    memory,
-    voice,
-    events,
-    orchestrator,
-    notifications,
-)
+import importlib
 
 __all__ = [
     "auth",
@@ -27,3 +18,9 @@ __all__ = [
     "orchestrator",
     "notifications",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
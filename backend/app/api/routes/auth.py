@@ -2,22 +2,29 @@
 ORBIT - Authentication Routes
 """
 
+import asyncio
+import time
 from datetime import timedelta
+from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.redis import redis_client
 from app.models import User, CognitiveProfile
 from app.schemas import UserCreate, UserResponse, Token, LoginRequest
 from app.api.deps import (
     get_password_hash,
     verify_password,
     create_access_token,
+    decode_access_token,
     get_current_user,
+    oauth2_scheme,
 )
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -33,32 +40,32 @@ async def register(
     
     Automatically creates a cognitive profile for the user.
     """
-    # Check if email exists
-    result = await db.execute(
-        select(User).where(User.email == user_data.email)
-    )
-    if result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-    
-    # Create user
+    # Create user (bcrypt runs off the event loop)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     user = User(
+        id=uuid4(),
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=hashed_password,
         name=user_data.name,
     )
     db.add(user)
-    await db.flush()  # Get user ID
     
-    # Create cognitive profile
+    # Create cognitive profile; the client-side id lets both rows go out
+    # in the same flush
     profile = CognitiveProfile(user_id=user.id)
     db.add(profile)
     
-    await db.commit()
-    await db.refresh(user)
+    # The unique constraint on email replaces a pre-check SELECT
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered",
+        )
     
+    # Column defaults are client-side, so no refresh is needed
     return user
 
 
@@ -75,7 +82,10 @@ async def login(
     )
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # bcrypt verification is CPU-bound; keep it off the event loop
+    if not user or not await asyncio.to_thread(
+        verify_password, form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -103,12 +113,20 @@ async def get_me(
 
 @router.post("/logout")
 async def logout(
+    token: str = Depends(oauth2_scheme),
     current_user: User = Depends(get_current_user),
 ):
     """
-    Logout (client-side token invalidation).
+    Logout and revoke the current token.
     
-    Note: JWT tokens are stateless. This endpoint is for
-    logging purposes and client-side cleanup.
+    The token's jti is kept in Redis until the token would have
+    expired, so it is rejected by every protected route.
     """
+    payload = decode_access_token(token)
+    jti = payload.get("jti")
+    if jti:
+        remaining = int(payload["exp"] - time.time())
+        await redis_client.revoke_token(jti, ttl=remaining)
+    await redis_client.invalidate_user(str(current_user.id))
+
     return {"message": "Successfully logged out"}
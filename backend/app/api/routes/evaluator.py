@@ -5,24 +5,29 @@ Evaluates completed work and updates cognitive profile
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 
 from app.core.database import get_db
-from app.core.redis import RedisClient, get_redis
-from app.models import User
-from app.schemas import EvaluationRequest, EvaluationResponse
+from app.core.redis import redis_client
+from app.models import CognitiveProfile, User
+from app.schemas import CognitiveProfileResponse, EvaluationRequest, JobAccepted
 from app.services.evaluator_service import EvaluatorService
+from app.services.profile_cache import PROFILE_CACHE_TTL, load_cached_profile
+from app.api.conditional import make_etag, not_modified
 from app.api.deps import get_current_user
 
 router = APIRouter(prefix="/evaluator", tags=["evaluator"])
 
 
-@router.post("/evaluate", response_model=EvaluationResponse)
+@router.post(
+    "/evaluate",
+    response_model=JobAccepted,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def evaluate(
     request: EvaluationRequest,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -35,21 +40,26 @@ async def evaluate(
     - Insights learned
     - Profile updates applied
     - Suggestions for improvement
+
+    Runs as a background job: responds 202 with a job id, and the result
+    arrives as a job_complete event on the user's WebSocket.
     """
-    evaluator_service = EvaluatorService(db, redis)
-    evaluation = await evaluator_service.evaluate(
-        user_id=current_user.id,
-        task_id=request.task_id,
-        goal_id=request.goal_id,
+    job_id = await redis_client.enqueue_job(
+        "evaluate",
+        str(current_user.id),
+        task_id=str(request.task_id) if request.task_id else None,
+        goal_id=str(request.goal_id) if request.goal_id else None,
         session_id=request.session_id,
     )
-    return evaluation
+    return JobAccepted(job_id=job_id)
 
 
-@router.post("/evaluate/session")
+@router.post(
+    "/evaluate/session",
+    response_model=JobAccepted,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def evaluate_session(
-    db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -60,16 +70,20 @@ async def evaluate_session(
     - Productivity insights
     - Pattern observations
     - Gentle suggestions for next time
+
+    Runs as a background job: responds 202 with a job id, and the result
+    arrives as a job_complete event on the user's WebSocket.
     """
-    evaluator_service = EvaluatorService(db, redis)
-    evaluation = await evaluator_service.evaluate_session(user_id=current_user.id)
-    return evaluation
+    job_id = await redis_client.enqueue_job("evaluate_session", str(current_user.id))
+    return JobAccepted(job_id=job_id)
 
 
-@router.post("/evaluate/day")
+@router.post(
+    "/evaluate/day",
+    response_model=JobAccepted,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def evaluate_day(
-    db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -81,17 +95,20 @@ async def evaluate_day(
     - What can wait until tomorrow
     
     Philosophy: End the day with closure, not anxiety.
+
+    Runs as a background job: responds 202 with a job id, and the result
+    arrives as a job_complete event on the user's WebSocket.
     """
-    evaluator_service = EvaluatorService(db, redis)
-    evaluation = await evaluator_service.evaluate_day(user_id=current_user.id)
-    return evaluation
+    job_id = await redis_client.enqueue_job("evaluate_day", str(current_user.id))
+    return JobAccepted(job_id=job_id)
 
 
 @router.get("/insights")
 async def get_insights(
+    request: Request,
+    response: Response,
     limit: int = 5,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -101,8 +118,22 @@ async def get_insights(
     - Patterns in your work
     - What strategies work for you
     - Potential improvements
+
+    Insights derive from the cognitive profile alone, so its last update
+    is the ETag.
     """
-    evaluator_service = EvaluatorService(db, redis)
+    result = await db.execute(
+        select(CognitiveProfile.updated_at).where(
+            CognitiveProfile.user_id == current_user.id
+        )
+    )
+    etag = make_etag(current_user.id, limit, result.scalar_one_or_none())
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    response.headers["ETag"] = etag
+
+    evaluator_service = EvaluatorService(db, redis_client)
     insights = await evaluator_service.get_insights(
         user_id=current_user.id,
         limit=limit,
@@ -110,6 +141,41 @@ async def get_insights(
     return insights
 
 
+@router.get("/profile", response_model=CognitiveProfileResponse)
+async def get_profile(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the learned cognitive profile.
+
+    The rendered JSON is cached in Redis and dropped whenever the profile
+    is written, so a hit is sent as stored without parsing or validation.
+    """
+    user_id = str(current_user.id)
+    body = await redis_client.get_cached_profile_response(user_id)
+    if body is None:
+        profile = await load_cached_profile(db, redis_client, current_user.id)
+        if profile is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Profile not found",
+            )
+        body = CognitiveProfileResponse.from_orm_fast(profile).model_dump_json().encode()
+        await redis_client.cache_profile_response(user_id, body, ttl=PROFILE_CACHE_TTL)
+
+    etag = make_etag(body)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
 @router.post("/feedback")
 async def submit_feedback(
     entity_type: str,
@@ -117,7 +183,6 @@ async def submit_feedback(
     was_helpful: bool,
     feedback_text: str = None,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -125,7 +190,7 @@ async def submit_feedback(
     
     This helps ORBIT learn what works for you.
     """
-    evaluator_service = EvaluatorService(db, redis)
+    evaluator_service = EvaluatorService(db, redis_client)
     result = await evaluator_service.record_feedback(
         user_id=current_user.id,
         entity_type=entity_type,
@@ -3,29 +3,97 @@ ORBIT - Events API Routes (WebSocket)
 Real-time event streaming for UI updates
 """
 
+import asyncio
 from datetime import datetime
-import json
 from typing import Optional
 
-from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+import orjson
+import structlog
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
 
 from app.core.database import get_db
-from app.core.redis import RedisClient, get_redis
-from app.schemas import WSEvent, AgentThought
+from app.core.redis import RedisClient, redis_client
+from app.models import BehavioralEvent, User
+from app.schemas import AgentThought, UUIDStr
 from app.services.event_service import EventService, ConnectionManager
+from app.api.conditional import make_etag, not_modified
+from app.api.deps import get_current_user
 
 router = APIRouter(prefix="/events", tags=["events"])
+logger = structlog.get_logger()
 
 # WebSocket connection manager
 manager = ConnectionManager()
 
+# Every user's event channel, served by one subscription per process
+USER_EVENTS_PATTERN = "user:*:events"
+
+# Application-level keepalive, one shared frame for every socket
+HEARTBEAT_INTERVAL_SECONDS = 30
+_PING_EVENT = orjson.dumps({"type": "ping"})
+
+
+async def dispatch_events(redis: RedisClient):
+    """
+    Fan out user events from Redis to this process's WebSockets.
+
+    One pattern subscription replaces a Redis connection and listener per
+    socket. Events are handed to the connection manager's per-socket
+    queues, so a slow client never stalls the listener.
+    """
+    while True:
+        try:
+            await _dispatch_from(await redis.psubscribe(USER_EVENTS_PATTERN))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Event dispatcher failed, resubscribing", error=str(e))
+            await asyncio.sleep(1)
+
+
+async def _dispatch_from(pubsub):
+    """Run the dispatch loop on one pattern subscription."""
+    try:
+        while True:
+            message = await pubsub.get_message(timeout=None)
+            if message is None:
+                continue
+            # Channel is b"user:<id>:events"; payloads are already JSON bytes
+            user_id = message["channel"].split(b":", 2)[1].decode()
+            manager.send_personal_bytes(message["data"], user_id)
+    finally:
+        await pubsub.aclose()
+
+
+async def heartbeat():
+    """
+    Ping every connected socket from a single loop.
+
+    The ping goes through each socket's send queue like any other event,
+    so it never races the writer; a socket whose send fails is dropped by
+    its writer.
+    """
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+        for user_id in list(manager.active_connections):
+            manager.send_personal_bytes(_PING_EVENT, user_id)
+
 
 @router.websocket("/ws/{user_id}")
 async def websocket_endpoint(
     websocket: WebSocket,
     user_id: str,
-    redis: RedisClient = Depends(get_redis),
 ):
     """
     WebSocket endpoint for real-time events.
@@ -36,32 +104,28 @@ async def websocket_endpoint(
     - Task status changes
     - Cognitive profile insights
     
+    Events are pushed by dispatch_events; this handler only keeps the
+    connection registered until the client goes away.
+
     Philosophy: Progressive disclosure, no loading spinners.
     """
     await manager.connect(websocket, user_id)
     
     try:
-        # Subscribe to user's Redis channel
-        pubsub = await redis.subscribe(f"user:{user_id}:events")
-        
-        # Listen for messages
-        async for message in pubsub.listen():
-            if message["type"] == "message":
-                event_data = json.loads(message["data"])
-                await manager.send_personal_message(
-                    json.dumps(event_data),
-                    user_id,
-                )
-                
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except WebSocketDisconnect:
-        manager.disconnect(user_id)
+        pass
+    finally:
+        manager.disconnect(user_id, websocket)
 
 
 @router.post("/broadcast/thought")
 async def broadcast_thought(
     thought: AgentThought,
     user_id: str,
-    redis: RedisClient = Depends(get_redis),
 ):
     """
     Broadcast an agent thought to the user's UI.
@@ -71,15 +135,15 @@ async def broadcast_thought(
     - "Reducing scope..."
     - "Noticing a pattern..."
     """
-    event = WSEvent(
-        type="agent_thought",
-        payload=thought.model_dump(),
-        timestamp=datetime.utcnow(),
-    )
-    
-    await redis.publish_event(
+    # Same shape as a WSEvent, built directly: AgentThought's fields are
+    # all plain values, and orjson encodes the timestamp natively
+    await redis_client.publish_raw(
         f"user:{user_id}:events",
-        event.model_dump(),
+        orjson.dumps({
+            "type": "agent_thought",
+            "payload": thought.__dict__,
+            "timestamp": datetime.utcnow(),
+        }),
     )
     
     return {"status": "broadcast"}
@@ -87,7 +151,9 @@ async def broadcast_thought(
 
 @router.get("/history/{user_id}")
 async def get_event_history(
-    user_id: str,
+    request: Request,
+    response: Response,
+    user_id: UUIDStr,
     limit: int = 50,
     event_type: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
@@ -95,8 +161,21 @@ async def get_event_history(
     """
     Get recent event history for a user.
     
-    Useful for loading UI state on reconnect.
+    Useful for loading UI state on reconnect. Events are append-only, so
+    the newest timestamp and count make the ETag.
     """
+    query = select(func.max(BehavioralEvent.created_at), func.count()).where(
+        BehavioralEvent.user_id == user_id
+    )
+    if event_type:
+        query = query.where(BehavioralEvent.event_type == event_type)
+    result = await db.execute(query)
+    etag = make_etag(user_id, limit, event_type, *result.one())
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    response.headers["ETag"] = etag
+
     event_service = EventService(db)
     events = await event_service.get_history(
         user_id=user_id,
@@ -106,6 +185,26 @@ async def get_event_history(
     return events
 
 
+@router.get("/jobs/{job_id}")
+async def get_job_status(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the state of a background job.
+
+    Results are also pushed over the WebSocket; this is for clients that
+    missed the event, e.g. after a reconnect.
+    """
+    state = await redis_client.get_job_state(job_id)
+    if state is None or orjson.loads(state)["user_id"] != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+    return Response(content=state, media_type="application/json")
+
+
 @router.get("/status")
 async def get_connection_status(user_id: str):
     """
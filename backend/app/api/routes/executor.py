@@ -4,27 +4,40 @@ Executes tasks and tracks progress
 """
 
 from typing import Optional
-from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, func, select
 
-from app.core.database import get_db
-from app.core.redis import RedisClient, get_redis
+from app.core.database import get_db, stream_json_rows
+from app.core.redis import redis_client
 from app.models import User, Task, TaskStatus
-from app.schemas import TaskCreate, TaskUpdate, TaskResponse
+from app.schemas import TaskCreate, TaskUpdate, TaskResponse, UUIDStr
 from app.services.executor_service import ExecutorService
+from app.api.conditional import make_etag, not_modified
 from app.api.deps import get_current_user
 
 router = APIRouter(prefix="/executor", tags=["executor"])
 
+# Columns backing list_tasks; plain rows skip ORM hydration and are
+# streamed straight to JSON
+_TASK_COLUMNS = [getattr(Task, name) for name in TaskResponse.model_fields]
+
+# Single-row statements built once so every request reuses the same
+# compiled SQL and asyncpg prepared statement
+_OWNED_TASK = (
+    Task.id == bindparam("task_id"),
+    Task.user_id == bindparam("user_id"),
+)
+_GET_TASK = select(Task).where(*_OWNED_TASK)
+_DELETE_TASK = delete(Task).where(*_OWNED_TASK).returning(Task.id)
+
 
 @router.post("/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task_data: TaskCreate,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -32,16 +45,21 @@ async def create_task(
     
     Use this for quick tasks that don't need planning.
     """
-    executor_service = ExecutorService(db, redis)
+    executor_service = ExecutorService(db, redis_client)
     task = await executor_service.create_task(
         user_id=current_user.id,
         task_data=task_data,
     )
-    return task
+    return Response(
+        content=TaskResponse.from_orm_fast(task).model_dump_json(),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
 
 
 @router.get("/tasks", response_model=list[TaskResponse])
 async def list_tasks(
+    request: Request,
     status: Optional[TaskStatus] = None,
     limit: int = 50,
     offset: int = 0,
@@ -50,21 +68,39 @@ async def list_tasks(
 ):
     """
     List user's tasks with optional status filter.
+
+    Rows are streamed as they arrive from the database. The ETag comes
+    from the newest update and row count, so an unchanged list is a 304.
     """
-    query = select(Task).where(Task.user_id == current_user.id)
-    
+    filters = [Task.user_id == current_user.id]
     if status:
-        query = query.where(Task.status == status)
-    
-    query = query.order_by(Task.priority.desc()).offset(offset).limit(limit)
-    result = await db.execute(query)
-    return result.scalars().all()
+        filters.append(Task.status == status)
+
+    result = await db.execute(
+        select(func.max(Task.updated_at), func.count()).where(*filters)
+    )
+    etag = make_etag(current_user.id, status, limit, offset, *result.one())
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    query = (
+        select(*_TASK_COLUMNS)
+        .where(*filters)
+        .order_by(Task.priority.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    return StreamingResponse(
+        stream_json_rows(query),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @router.get("/tasks/focus", response_model=Optional[TaskResponse])
 async def get_focus_task(
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -72,15 +108,25 @@ async def get_focus_task(
     
     ORBIT's philosophy: One thing at a time.
     This returns the highest priority pending task.
+
+    The rendered body is cached briefly and dropped on every task write,
+    so UI refreshes are served from Redis.
     """
-    executor_service = ExecutorService(db, redis)
+    cached = await redis_client.get_cached_focus_task(str(current_user.id))
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    executor_service = ExecutorService(db, redis_client)
     task = await executor_service.get_focus_task(user_id=current_user.id)
-    return task
+    body = TaskResponse.from_orm_fast(task).model_dump_json() if task else "null"
+    await redis_client.cache_focus_task(str(current_user.id), body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(
-    task_id: UUID,
+    request: Request,
+    task_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -88,10 +134,7 @@ async def get_task(
     Get a specific task by ID.
     """
     result = await db.execute(
-        select(Task).where(
-            Task.id == task_id,
-            Task.user_id == current_user.id,
-        )
+        _GET_TASK, {"task_id": task_id, "user_id": current_user.id}
     )
     task = result.scalar_one_or_none()
     
@@ -100,35 +143,45 @@ async def get_task(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
-    
-    return task
+
+    etag = make_etag(task.id, task.updated_at)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    return Response(
+        content=TaskResponse.from_orm_fast(task).model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @router.patch("/tasks/{task_id}", response_model=TaskResponse)
 async def update_task(
-    task_id: UUID,
+    task_id: UUIDStr,
     task_update: TaskUpdate,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
     Update a task.
     """
-    executor_service = ExecutorService(db, redis)
+    executor_service = ExecutorService(db, redis_client)
     task = await executor_service.update_task(
         user_id=current_user.id,
         task_id=task_id,
         task_update=task_update,
     )
-    return task
+    return Response(
+        content=TaskResponse.from_orm_fast(task).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @router.post("/tasks/{task_id}/start")
 async def start_task(
-    task_id: UUID,
+    task_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -136,7 +189,7 @@ async def start_task(
     
     This begins a focus session and logs the event.
     """
-    executor_service = ExecutorService(db, redis)
+    executor_service = ExecutorService(db, redis_client)
     result = await executor_service.start_task(
         user_id=current_user.id,
         task_id=task_id,
@@ -146,11 +199,10 @@ async def start_task(
 
 @router.post("/tasks/{task_id}/complete")
 async def complete_task(
-    task_id: UUID,
+    task_id: UUIDStr,
     completion_notes: Optional[str] = None,
     actual_minutes: Optional[int] = None,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -158,7 +210,7 @@ async def complete_task(
     
     This logs the event and triggers evaluation.
     """
-    executor_service = ExecutorService(db, redis)
+    executor_service = ExecutorService(db, redis_client)
     result = await executor_service.complete_task(
         user_id=current_user.id,
         task_id=task_id,
@@ -170,10 +222,9 @@ async def complete_task(
 
 @router.post("/tasks/{task_id}/abandon")
 async def abandon_task(
-    task_id: UUID,
+    task_id: UUIDStr,
     reason: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -181,7 +232,7 @@ async def abandon_task(
     
     This is not failure - it's a valid outcome that ORBIT learns from.
     """
-    executor_service = ExecutorService(db, redis)
+    executor_service = ExecutorService(db, redis_client)
     result = await executor_service.abandon_task(
         user_id=current_user.id,
         task_id=task_id,
@@ -192,10 +243,9 @@ async def abandon_task(
 
 @router.post("/tasks/{task_id}/defer")
 async def defer_task(
-    task_id: UUID,
+    task_id: UUIDStr,
     defer_until: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -203,7 +253,7 @@ async def defer_task(
     
     ORBIT learns deferral patterns to predict future behavior.
     """
-    executor_service = ExecutorService(db, redis)
+    executor_service = ExecutorService(db, redis_client)
     result = await executor_service.defer_task(
         user_id=current_user.id,
         task_id=task_id,
@@ -214,7 +264,7 @@ async def defer_task(
 
 @router.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
-    task_id: UUID,
+    task_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -222,18 +272,14 @@ async def delete_task(
     Delete a task permanently.
     """
     result = await db.execute(
-        select(Task).where(
-            Task.id == task_id,
-            Task.user_id == current_user.id,
-        )
+        _DELETE_TASK, {"task_id": task_id, "user_id": current_user.id}
     )
-    task = result.scalar_one_or_none()
     
-    if not task:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
     
-    await db.delete(task)
     await db.commit()
+    await redis_client.invalidate_focus_task(str(current_user.id))
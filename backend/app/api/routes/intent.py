@@ -5,31 +5,48 @@ Handles voice/text input interpretation
 
 from datetime import datetime
 from typing import Optional
-from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, update
 
-from app.core.database import get_db
-from app.core.redis import RedisClient, get_redis
+from app.core.database import get_db, stream_json_rows
+from app.core.redis import redis_client
 from app.models import Intent, User, IntentUrgency
 from app.schemas import (
     IntentCreate,
     IntentResponse,
-    IntentInterpretation,
+    JobAccepted,
+    UUIDStr,
 )
 from app.services.intent_service import IntentService
+from app.api.conditional import make_etag, not_modified
 from app.api.deps import get_current_user
 
 router = APIRouter(prefix="/intent", tags=["intent"])
 
+# IntentResponse fields, selected as plain columns for list_intents
+_INTENT_COLUMNS = [getattr(Intent, name) for name in IntentResponse.model_fields]
+
+# Prebuilt single-row statements; parameters are bound per request
+_OWNED_INTENT = (
+    Intent.id == bindparam("intent_id"),
+    Intent.user_id == bindparam("user_id"),
+)
+_GET_INTENT = select(Intent).where(*_OWNED_INTENT)
+_EXPIRE_INTENT = (
+    update(Intent)
+    .where(*_OWNED_INTENT)
+    .values(expires_at=bindparam("expires_at"))
+    .returning(Intent.id)
+)
+
 
 @router.post("/", response_model=IntentResponse, status_code=status.HTTP_201_CREATED)
 async def create_intent(
     intent_data: IntentCreate,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -40,17 +57,22 @@ async def create_intent(
     2. Interpreted by the AI
     3. Published to the event stream
     """
-    intent_service = IntentService(db, redis)
+    intent_service = IntentService(db, redis_client)
     intent = await intent_service.create_intent(
         user_id=current_user.id,
         raw_input=intent_data.raw_input,
         source=intent_data.source,
     )
-    return intent
+    return Response(
+        content=IntentResponse.from_orm_fast(intent).model_dump_json(),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
 
 
 @router.get("/", response_model=list[IntentResponse])
 async def list_intents(
+    request: Request,
     limit: int = 20,
     offset: int = 0,
     is_processed: Optional[bool] = None,
@@ -59,26 +81,44 @@ async def list_intents(
 ):
     """
     List user's intents, optionally filtered by processing status.
+
+    Rows are streamed as they arrive from the database, tagged with an
+    ETag so an unchanged list is a 304.
     """
-    query = select(Intent).where(Intent.user_id == current_user.id)
-    
+    filters = [Intent.user_id == current_user.id]
     if is_processed is not None:
-        query = query.where(Intent.is_processed == is_processed)
-    
-    query = query.order_by(Intent.created_at.desc()).offset(offset).limit(limit)
-    result = await db.execute(query)
-    return result.scalars().all()
+        filters.append(Intent.is_processed == is_processed)
+
+    result = await db.execute(
+        select(func.max(Intent.updated_at), func.count()).where(*filters)
+    )
+    etag = make_etag(current_user.id, is_processed, limit, offset, *result.one())
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    query = (
+        select(*_INTENT_COLUMNS)
+        .where(*filters)
+        .order_by(Intent.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    return StreamingResponse(
+        stream_json_rows(query),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @router.get("/current", response_model=Optional[IntentResponse])
 async def get_current_intent(
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
     Get the user's current active intent from session state.
     """
-    intent_data = await redis.get_current_intent(str(current_user.id))
+    intent_data = await redis_client.get_current_intent(str(current_user.id))
     if not intent_data:
         return None
     return IntentResponse(**intent_data)
@@ -86,7 +126,8 @@ async def get_current_intent(
 
 @router.get("/{intent_id}", response_model=IntentResponse)
 async def get_intent(
-    intent_id: UUID,
+    request: Request,
+    intent_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -94,10 +135,7 @@ async def get_intent(
     Get a specific intent by ID.
     """
     result = await db.execute(
-        select(Intent).where(
-            Intent.id == intent_id,
-            Intent.user_id == current_user.id,
-        )
+        _GET_INTENT, {"intent_id": intent_id, "user_id": current_user.id}
     )
     intent = result.scalar_one_or_none()
     
@@ -106,15 +144,26 @@ async def get_intent(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Intent not found",
         )
-    
-    return intent
 
+    etag = make_etag(intent.id, intent.updated_at)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
 
-@router.post("/{intent_id}/interpret", response_model=IntentInterpretation)
+    return Response(
+        content=IntentResponse.from_orm_fast(intent).model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
+@router.post(
+    "/{intent_id}/interpret",
+    response_model=JobAccepted,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def interpret_intent(
-    intent_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
+    intent_id: UUIDStr,
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -126,20 +175,23 @@ async def interpret_intent(
     - Ambiguity detection
     - Emotional tone
     - Suggested clarification if needed
+
+    Runs as a background job: responds 202 with a job id, and the result
+    arrives as a job_complete event on the user's WebSocket.
     """
-    intent_service = IntentService(db, redis)
-    interpretation = await intent_service.interpret_intent(
-        intent_id=intent_id,
-        user_id=current_user.id,
+    job_id = await redis_client.enqueue_job(
+        "interpret_intent", str(current_user.id), intent_id=intent_id
     )
-    return interpretation
+    return JobAccepted(job_id=job_id)
 
 
-@router.post("/{intent_id}/process")
+@router.post(
+    "/{intent_id}/process",
+    response_model=JobAccepted,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def process_intent(
-    intent_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
+    intent_id: UUIDStr,
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -147,18 +199,19 @@ async def process_intent(
     Intent → Plan → Execute → Evaluate
     
     This triggers the complete ORBIT workflow.
+
+    Runs as a background job: responds 202 with a job id, and the result
+    arrives as a job_complete event on the user's WebSocket.
     """
-    intent_service = IntentService(db, redis)
-    result = await intent_service.process_intent(
-        intent_id=intent_id,
-        user_id=current_user.id,
+    job_id = await redis_client.enqueue_job(
+        "process_intent", str(current_user.id), intent_id=intent_id
     )
-    return result
+    return JobAccepted(job_id=job_id)
 
 
 @router.delete("/{intent_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_intent(
-    intent_id: UUID,
+    intent_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -166,18 +219,18 @@ async def delete_intent(
     Delete an intent (soft delete - marks as expired).
     """
     result = await db.execute(
-        select(Intent).where(
-            Intent.id == intent_id,
-            Intent.user_id == current_user.id,
-        )
+        _EXPIRE_INTENT,
+        {
+            "intent_id": intent_id,
+            "user_id": current_user.id,
+            "expires_at": datetime.utcnow(),
+        },
     )
-    intent = result.scalar_one_or_none()
     
-    if not intent:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Intent not found",
         )
     
-    intent.expires_at = datetime.utcnow()
     await db.commit()
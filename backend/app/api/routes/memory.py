@@ -4,27 +4,53 @@ Personal memory system for RAG and context
 """
 
 from typing import Optional
-from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, update
 
-from app.core.database import get_db
-from app.core.redis import RedisClient, get_redis
+from app.core.database import get_db, stream_json_rows
+from app.core.redis import redis_client
 from app.models import User, Memory, MemoryType
-from app.schemas import MemoryCreate, MemoryResponse, MemorySearchResult
+from app.schemas import (
+    JobAccepted,
+    MemoryCreate,
+    MemoryResponse,
+    MemorySearchResult,
+    UUIDStr,
+)
 from app.services.memory_service import MemoryService
+from app.api.conditional import make_etag, not_modified
 from app.api.deps import get_current_user
 
 router = APIRouter(prefix="/memory", tags=["memory"])
 
+# Only what MemoryResponse exposes, as plain rows for list_memories
+_MEMORY_COLUMNS = [getattr(Memory, name) for name in MemoryResponse.model_fields]
+
+# Search result serializer, compiled once at import
+_SEARCH_RESULTS = TypeAdapter(list[MemorySearchResult])
+
+# Prebuilt single-row statements; parameters are bound per request
+_OWNED_MEMORY = (
+    Memory.id == bindparam("memory_id"),
+    Memory.user_id == bindparam("user_id"),
+)
+_GET_MEMORY = select(Memory).where(*_OWNED_MEMORY)
+_DEACTIVATE_MEMORY = (
+    update(Memory)
+    .where(*_OWNED_MEMORY)
+    .values(is_active=False)
+    .returning(Memory.id)
+)
+
 
 @router.post("/", response_model=MemoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_memory(
     memory_data: MemoryCreate,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -35,16 +61,21 @@ async def create_memory(
     - Scored for importance
     - Tagged for context
     """
-    memory_service = MemoryService(db, redis)
+    memory_service = MemoryService(db, redis_client)
     memory = await memory_service.create_memory(
         user_id=current_user.id,
         memory_data=memory_data,
     )
-    return memory
+    return Response(
+        content=MemoryResponse.from_orm_fast(memory).model_dump_json(),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
 
 
 @router.get("/", response_model=list[MemoryResponse])
 async def list_memories(
+    request: Request,
     memory_type: Optional[MemoryType] = None,
     limit: int = 50,
     offset: int = 0,
@@ -53,18 +84,37 @@ async def list_memories(
 ):
     """
     List memories with optional type filter.
+
+    Rows are streamed as they arrive from the database, tagged with an
+    ETag so an unchanged list is a 304.
     """
-    query = select(Memory).where(
+    filters = [
         Memory.user_id == current_user.id,
         Memory.is_active == True,
-    )
-    
+    ]
     if memory_type:
-        query = query.where(Memory.memory_type == memory_type)
-    
-    query = query.order_by(Memory.importance_score.desc()).offset(offset).limit(limit)
-    result = await db.execute(query)
-    return result.scalars().all()
+        filters.append(Memory.memory_type == memory_type)
+
+    result = await db.execute(
+        select(func.max(Memory.updated_at), func.count()).where(*filters)
+    )
+    etag = make_etag(current_user.id, memory_type, limit, offset, *result.one())
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    query = (
+        select(*_MEMORY_COLUMNS)
+        .where(*filters)
+        .order_by(Memory.importance_score.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    return StreamingResponse(
+        stream_json_rows(query),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @router.get("/search", response_model=list[MemorySearchResult])
@@ -74,7 +124,6 @@ async def search_memories(
     memory_types: Optional[list[MemoryType]] = None,
     min_relevance: float = 0.5,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -86,7 +135,7 @@ async def search_memories(
     IMPORTANT: Only returns relevant memories above min_relevance
     threshold to avoid prompt overload.
     """
-    memory_service = MemoryService(db, redis)
+    memory_service = MemoryService(db, redis_client)
     results = await memory_service.search_memories(
         user_id=current_user.id,
         query=query,
@@ -94,17 +143,16 @@ async def search_memories(
         memory_types=memory_types,
         min_relevance=min_relevance,
     )
-    return results
+    return Response(content=_SEARCH_RESULTS.dump_json(results), media_type="application/json")
 
 
 @router.get("/context")
 async def get_context_memories(
-    intent_id: Optional[UUID] = None,
-    task_id: Optional[UUID] = None,
+    intent_id: Optional[UUIDStr] = None,
+    task_id: Optional[UUIDStr] = None,
     tags: Optional[list[str]] = None,
     limit: int = 5,
     db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -113,7 +161,7 @@ async def get_context_memories(
     Use this to inject relevant personal memory into
     AI prompts without overloading.
     """
-    memory_service = MemoryService(db, redis)
+    memory_service = MemoryService(db, redis_client)
     memories = await memory_service.get_context_memories(
         user_id=current_user.id,
         intent_id=intent_id,
@@ -124,9 +172,74 @@ async def get_context_memories(
     return memories
 
 
+@router.post(
+    "/consolidate",
+    response_model=JobAccepted,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def consolidate_memories(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Consolidate short-term memories into long-term.
+    
+    This runs periodically to:
+    - Identify patterns in recent memories
+    - Create higher-level insights
+    - Prune redundant memories
+    - Update identity memories
+
+    Runs as a background job: responds 202 with a job id, and the result
+    arrives as a job_complete event on the user's WebSocket.
+    """
+    job_id = await redis_client.enqueue_job("consolidate_memories", str(current_user.id))
+    return JobAccepted(job_id=job_id)
+
+
+@router.get("/patterns")
+async def get_patterns(
+    request: Request,
+    time_range_days: int = 30,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get identified patterns from memory analysis.
+    
+    Returns patterns like:
+    - "You often feel stuck on Mondays"
+    - "Creative tasks work best in the morning"
+    - "You abandon tasks after 2+ deferrals"
+
+    Patterns shift slowly, so the rendered body is cached for an hour.
+    On a cache miss the analysis runs as a background job: the response
+    is 202 with a job id, and the patterns arrive as a job_complete event
+    (and are cached for the next request).
+    """
+    cached = await redis_client.get_cached_patterns(str(current_user.id), time_range_days)
+    if cached is not None:
+        etag = make_etag(cached)
+        unchanged = not_modified(request, etag)
+        if unchanged is not None:
+            return unchanged
+        return Response(
+            content=cached,
+            media_type="application/json",
+            headers={"ETag": etag},
+        )
+
+    # Misses while an analysis is pending share its job id
+    job_id = await redis_client.enqueue_patterns_job(str(current_user.id), time_range_days)
+    return Response(
+        content=JobAccepted(job_id=job_id).model_dump_json(),
+        status_code=status.HTTP_202_ACCEPTED,
+        media_type="application/json",
+    )
+
+
 @router.get("/{memory_id}", response_model=MemoryResponse)
 async def get_memory(
-    memory_id: UUID,
+    request: Request,
+    memory_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -134,10 +247,7 @@ async def get_memory(
     Get a specific memory by ID.
     """
     result = await db.execute(
-        select(Memory).where(
-            Memory.id == memory_id,
-            Memory.user_id == current_user.id,
-        )
+        _GET_MEMORY, {"memory_id": memory_id, "user_id": current_user.id}
     )
     memory = result.scalar_one_or_none()
     
@@ -146,13 +256,22 @@ async def get_memory(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Memory not found",
         )
-    
-    return memory
+
+    etag = make_etag(memory.id, memory.updated_at)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    return Response(
+        content=MemoryResponse.from_orm_fast(memory).model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @router.delete("/{memory_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_memory(
-    memory_id: UUID,
+    memory_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -160,61 +279,13 @@ async def delete_memory(
     Delete (deactivate) a memory.
     """
     result = await db.execute(
-        select(Memory).where(
-            Memory.id == memory_id,
-            Memory.user_id == current_user.id,
-        )
+        _DEACTIVATE_MEMORY, {"memory_id": memory_id, "user_id": current_user.id}
     )
-    memory = result.scalar_one_or_none()
     
-    if not memory:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Memory not found",
         )
     
-    memory.is_active = False
     await db.commit()
-
-
-@router.post("/consolidate")
-async def consolidate_memories(
-    db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
-    current_user: User = Depends(get_current_user),
-):
-    """
-    Consolidate short-term memories into long-term.
-    
-    This runs periodically to:
-    - Identify patterns in recent memories
-    - Create higher-level insights
-    - Prune redundant memories
-    - Update identity memories
-    """
-    memory_service = MemoryService(db, redis)
-    result = await memory_service.consolidate_memories(user_id=current_user.id)
-    return result
-
-
-@router.get("/patterns")
-async def get_patterns(
-    time_range_days: int = 30,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisClient = Depends(get_redis),
-    current_user: User = Depends(get_current_user),
-):
-    """
-    Get identified patterns from memory analysis.
-    
-    Returns patterns like:
-    - "You often feel stuck on Mondays"
-    - "Creative tasks work best in the morning"
-    - "You abandon tasks after 2+ deferrals"
-    """
-    memory_service = MemoryService(db, redis)
-    patterns = await memory_service.get_patterns(
-        user_id=current_user.id,
-        time_range_days=time_range_days,
-    )
-    return patterns
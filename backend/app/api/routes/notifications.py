@@ -5,16 +5,27 @@ Manages notification preferences and delivery.
 Philosophy: Respect attention - notifications should be rare and valuable.
 """
 
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import func, literal, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 import structlog
 
-from app.api.deps import get_db, get_current_user
-from app.models.models import User
-from app.services.notification_service import notification_service
+from app.api.deps import get_current_user
+from app.core.database import get_db
+from app.core.redis import redis_client
+from app.models.models import CognitiveProfile, NotificationPriority, User
+from app.services.notification_service import (
+    hours_to_mask,
+    mask_to_hours,
+    notification_service,
+    quiet_hours_to_mask,
+)
+from app.services.profile_cache import load_cached_profile
 
 logger = structlog.get_logger()
 
@@ -23,11 +34,16 @@ router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 # ==================== Schemas ====================
 
-class NotificationPreferences(BaseModel):
+HourOfDay = Annotated[int, msgspec.Meta(ge=0, le=23)]
+
+
+# A msgspec Struct rather than a pydantic model: request bodies are decoded
+# and validated, and responses encoded, in a single C call
+class NotificationPreferences(msgspec.Struct, kw_only=True):
     """User notification preferences."""
-    quiet_hours_start: Optional[int] = None  # Hour (0-23)
-    quiet_hours_end: Optional[int] = None
-    notification_times: Optional[List[int]] = None  # Preferred hours
+    quiet_hours_start: Optional[HourOfDay] = None
+    quiet_hours_end: Optional[HourOfDay] = None
+    notification_times: Optional[List[HourOfDay]] = None  # Preferred hours
     allow_insights: bool = True
     allow_reminders: bool = True
     allow_celebrations: bool = True
@@ -43,13 +59,25 @@ class PendingNotification(BaseModel):
     queued_at: str
 
 
+# Pending list serializer, compiled once at import
+_PENDING_NOTIFICATIONS = TypeAdapter(List[PendingNotification])
+
+# Preferences codec, plus its JSON schema for the OpenAPI docs since
+# FastAPI can't derive one from a Struct
+_PREFERENCES_DECODER = msgspec.json.Decoder(NotificationPreferences)
+_PREFERENCES_SCHEMA = msgspec.json.schema_components((NotificationPreferences,))[1][
+    "NotificationPreferences"
+]
+_PREFERENCES_CONTENT = {"application/json": {"schema": _PREFERENCES_SCHEMA}}
+
+
 # ==================== Endpoints ====================
 
-@router.get("/pending")
+@router.get("/pending", response_model=List[PendingNotification])
 async def get_pending_notifications(
     limit: int = 10,
     current_user: User = Depends(get_current_user)
-) -> List[PendingNotification]:
+):
     """
     Get pending notifications that were queued during focus/quiet hours.
     
@@ -61,16 +89,21 @@ async def get_pending_notifications(
         limit=limit
     )
     
-    return [
-        PendingNotification(
+    # Queued by notification_service itself; skip validation
+    notifications = [
+        PendingNotification.model_construct(
             title=n.get("title", ""),
             message=n.get("message", ""),
             type=n.get("type", "info"),
             priority=n.get("priority", "normal"),
-            queued_at=n.get("queued_at", "")
+            queued_at=n.get("queued_at", ""),
         )
         for n in pending
     ]
+    return Response(
+        content=_PENDING_NOTIFICATIONS.dump_json(notifications),
+        media_type="application/json",
+    )
 
 
 @router.post("/deliver-pending")
@@ -109,49 +142,51 @@ async def clear_pending_notifications(
     current_user: User = Depends(get_current_user)
 ) -> dict:
     """Clear all pending notifications."""
-    from app.core.redis import redis_client
-    
-    key = f"pending_notifications:{current_user.id}"
-    await redis_client.delete(key)
+    await redis_client.clear_pending_notifications(str(current_user.id))
     
     return {"status": "ok", "message": "Pending notifications cleared"}
 
 
-@router.get("/preferences")
+@router.get("/preferences", responses={200: {"content": _PREFERENCES_CONTENT}})
 async def get_notification_preferences(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
-) -> NotificationPreferences:
+):
     """Get user's notification preferences."""
-    from sqlalchemy import select
-    from app.models.models import CognitiveProfile
-    
-    result = await db.execute(
-        select(CognitiveProfile).where(
-            CognitiveProfile.user_id == current_user.id
-        )
-    )
-    profile = result.scalar_one_or_none()
+    profile = await load_cached_profile(db, redis_client, current_user.id)
     
     if not profile or not profile.preferences:
-        return NotificationPreferences()
+        return Response(
+            content=msgspec.json.encode(NotificationPreferences()),
+            media_type="application/json",
+        )
     
     prefs = profile.preferences
+    hours_mask = prefs.get("notification_hours_mask")
+    prefs_dict = {
+        "quiet_hours_start": prefs.get("quiet_hours_start"),
+        "quiet_hours_end": prefs.get("quiet_hours_end"),
+        "notification_times": mask_to_hours(hours_mask) if hours_mask else None,
+        "allow_insights": prefs.get("allow_insights", True),
+        "allow_reminders": prefs.get("allow_reminders", True),
+        "allow_celebrations": prefs.get("allow_celebrations", True),
+        "urgent_only_during_focus": prefs.get("urgent_only_during_focus", True),
+    }
     
-    return NotificationPreferences(
-        quiet_hours_start=prefs.get("quiet_hours_start"),
-        quiet_hours_end=prefs.get("quiet_hours_end"),
-        notification_times=prefs.get("notification_times"),
-        allow_insights=prefs.get("allow_insights", True),
-        allow_reminders=prefs.get("allow_reminders", True),
-        allow_celebrations=prefs.get("allow_celebrations", True),
-        urgent_only_during_focus=prefs.get("urgent_only_during_focus", True),
+    # Written by update_notification_preferences, so already validated;
+    # Struct construction doesn't re-check
+    return Response(
+        content=msgspec.json.encode(NotificationPreferences(**prefs_dict)),
+        media_type="application/json",
     )
 
 
-@router.put("/preferences")
+@router.put(
+    "/preferences",
+    openapi_extra={"requestBody": {"content": _PREFERENCES_CONTENT, "required": True}},
+)
 async def update_notification_preferences(
-    preferences: NotificationPreferences,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> dict:
@@ -160,33 +195,47 @@ async def update_notification_preferences(
     
     Philosophy: Let users control when they want to be interrupted.
     """
-    from sqlalchemy import select
-    from app.models.models import CognitiveProfile
+    try:
+        preferences = _PREFERENCES_DECODER.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     
-    result = await db.execute(
-        select(CognitiveProfile).where(
-            CognitiveProfile.user_id == current_user.id
-        )
-    )
-    profile = result.scalar_one_or_none()
-    
-    if not profile:
-        raise HTTPException(status_code=404, detail="Profile not found")
-    
-    # Merge with existing preferences
-    existing = profile.preferences or {}
-    existing.update({
+    changes = {
         "quiet_hours_start": preferences.quiet_hours_start,
         "quiet_hours_end": preferences.quiet_hours_end,
-        "notification_times": preferences.notification_times,
+        "quiet_hours_mask": (
+            quiet_hours_to_mask(preferences.quiet_hours_start, preferences.quiet_hours_end)
+            if preferences.quiet_hours_start is not None
+            and preferences.quiet_hours_end is not None
+            else None
+        ),
+        "notification_hours_mask": (
+            hours_to_mask(preferences.notification_times)
+            if preferences.notification_times
+            else None
+        ),
         "allow_insights": preferences.allow_insights,
         "allow_reminders": preferences.allow_reminders,
         "allow_celebrations": preferences.allow_celebrations,
         "urgent_only_during_focus": preferences.urgent_only_during_focus,
-    })
+    }
+    
+    # Merge into the stored preferences in one statement, no read first
+    result = await db.execute(
+        update(CognitiveProfile)
+        .where(CognitiveProfile.user_id == current_user.id)
+        .values(
+            preferences=func.coalesce(
+                CognitiveProfile.preferences, literal({}, JSONB)
+            ).op("||", return_type=JSONB)(literal(changes, JSONB))
+        )
+        .returning(CognitiveProfile.id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
     
-    profile.preferences = existing
     await db.commit()
+    await redis_client.invalidate_cognitive_profile(str(current_user.id))
     
     logger.info(
         "Notification preferences updated",
@@ -206,8 +255,6 @@ async def send_test_notification(
     
     Useful for verifying notification setup works.
     """
-    from app.models.models import NotificationPriority
-    
     sent = await notification_service.send_notification(
         db=db,
         user_id=current_user.id,
@@ -4,7 +4,6 @@ High-level cognitive loop endpoints
 """
 
 from typing import Optional
-from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
@@ -13,8 +12,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.redis import RedisClient, get_redis
 from app.models import User
+from app.schemas import IntentResponse, UUIDStr
 from app.api.deps import get_current_user
-from app.agents import OrchestratorAgent
+from app.api.responses import ORJSONResponse
+from app.agents import CognitiveProfileAgent, OrchestratorAgent
 
 
 router = APIRouter(prefix="/orbit", tags=["orchestrator"])
@@ -29,14 +30,14 @@ class ProcessIntentRequest(BaseModel):
 
 class CompleteTaskRequest(BaseModel):
     """Request to complete a task."""
-    task_id: UUID
+    task_id: UUIDStr
     completion_notes: Optional[str] = None
     actual_minutes: Optional[int] = None
 
 
 class AbandonTaskRequest(BaseModel):
     """Request to abandon a task."""
-    task_id: UUID
+    task_id: UUIDStr
     reason: Optional[str] = None
 
 
@@ -71,8 +72,10 @@ async def process_intent(
         source=request.source,
         auto_plan=request.auto_plan,
     )
+    if result["intent"] is not None:
+        result["intent"] = IntentResponse.from_orm_fast(result["intent"])
     
-    return result
+    return ORJSONResponse(result)
 
 
 @router.post("/complete")
@@ -155,8 +158,6 @@ async def get_insights(
     - Suggestions over commands
     - Observations without judgment
     """
-    from app.agents import CognitiveProfileAgent
-    
     profile_agent = CognitiveProfileAgent(db, redis)
     insights = await profile_agent.generate_insights(current_user.id)
     
@@ -177,8 +178,6 @@ async def check_overwhelm(
     
     Returns suggestions for scope reduction if needed.
     """
-    from app.agents import CognitiveProfileAgent
-    
     profile_agent = CognitiveProfileAgent(db, redis)
     overwhelm = await profile_agent.detect_overwhelm(current_user.id)
     
@@ -207,8 +206,6 @@ async def trigger_learning(
     
     Usually this runs automatically, but can be triggered manually.
     """
-    from app.agents import CognitiveProfileAgent
-    
     profile_agent = CognitiveProfileAgent(db, redis)
     result = await profile_agent.learn_from_events(
         user_id=current_user.id,
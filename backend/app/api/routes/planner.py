@@ -3,17 +3,16 @@ ORBIT - Planner API Routes
 Converts intents into actionable plans
 """
 
-from uuid import UUID
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.redis import RedisClient, get_redis
 from app.models import User
-from app.schemas import PlanRequest, PlanResponse
+from app.schemas import PlanRequest, PlanResponse, UUIDStr
 from app.services.planner_service import PlannerService
 from app.api.deps import get_current_user
+from app.api.responses import ORJSONResponse
 
 router = APIRouter(prefix="/planner", tags=["planner"])
 
@@ -43,12 +42,12 @@ async def create_plan(
         max_tasks=request.max_tasks,
         consider_current_load=request.consider_current_load,
     )
-    return plan
+    return Response(content=plan.model_dump_json(), media_type="application/json")
 
 
 @router.post("/plan/{intent_id}/accept")
 async def accept_plan(
-    intent_id: UUID,
+    intent_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
@@ -68,7 +67,7 @@ async def accept_plan(
 
 @router.post("/plan/{intent_id}/modify")
 async def modify_plan(
-    intent_id: UUID,
+    intent_id: UUIDStr,
     modifications: dict,
     db: AsyncSession = Depends(get_db),
     redis: RedisClient = Depends(get_redis),
@@ -108,12 +107,12 @@ async def get_planning_suggestions(
     """
     planner_service = PlannerService(db, redis)
     suggestions = await planner_service.get_suggestions(user_id=current_user.id)
-    return suggestions
+    return ORJSONResponse(suggestions)
 
 
 @router.post("/reduce-scope/{intent_id}")
 async def reduce_scope(
-    intent_id: UUID,
+    intent_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
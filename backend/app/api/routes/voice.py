@@ -3,8 +3,9 @@ ORBIT - Voice API Routes
 Voice input/output processing
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Response, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update
 
 from app.core.database import get_db
 from app.core.redis import RedisClient, get_redis
@@ -36,7 +37,7 @@ async def transcribe_audio(
         audio_format=request.format,
         sample_rate=request.sample_rate,
     )
-    return result
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.post("/transcribe/upload", response_model=VoiceInputResponse)
@@ -52,16 +53,11 @@ async def transcribe_audio_file(
     Accepts: wav, mp3, webm, ogg
     """
     voice_service = VoiceService(db, redis)
-    
-    # Read file content
-    content = await audio.read()
-    
     result = await voice_service.transcribe_file(
         user_id=current_user.id,
-        file_content=content,
-        filename=audio.filename,
+        audio=audio,
     )
-    return result
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.post("/speak")
@@ -109,14 +105,21 @@ async def update_voice_settings(
     voice_enabled: bool = None,
     voice_style: str = None,
     db: AsyncSession = Depends(get_db),
+    redis: RedisClient = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
     """
     Update user's voice settings.
     """
+    # current_user may be a detached cache entry, so write by id
     if voice_enabled is not None:
-        current_user.voice_enabled = voice_enabled
+        await db.execute(
+            update(User)
+            .where(User.id == current_user.id)
+            .values(voice_enabled=voice_enabled)
+        )
     
     await db.commit()
+    await redis.invalidate_user(str(current_user.id))
     
     return {"message": "Settings updated"}
@@ -5,12 +5,14 @@ Async SQLAlchemy setup with PostgreSQL
 
 from collections.abc import AsyncGenerator
 
+import orjson
+from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
 
@@ -19,8 +21,20 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_recycle=settings.database_pool_recycle,
+    pool_timeout=settings.database_pool_timeout,
+    # Compiled-SQL cache shared by all sessions
+    query_cache_size=1200,
+    connect_args={
+        # SQLAlchemy's per-connection cache of asyncpg prepared statements
+        "prepared_statement_cache_size": 500,
+        # asyncpg's own statement cache
+        "statement_cache_size": 1024,
+        # Short OLTP queries; JIT compilation only adds planning latency
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Session factory
@@ -32,8 +46,8 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
-# Base class for models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Base class for models."""
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -49,6 +63,24 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def stream_json_rows(query: Select) -> AsyncGenerator[bytes, None]:
+    """
+    Stream a column query's rows as a JSON array.
+
+    Uses its own session because dependency sessions are closed before a
+    streaming body is sent. Rows come off a server-side cursor and are
+    encoded one at a time, so the full result is never held in memory.
+    """
+    async with async_session_maker() as session:
+        result = await session.stream(query)
+        yield b"["
+        separator = b""
+        async for row in result.mappings():
+            yield separator + orjson.dumps(dict(row))
+            separator = b","
+        yield b"]"
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     async with engine.begin() as conn:
@@ -2,14 +2,64 @@
 ORBIT - Redis Client for Real-time State
 """
 
-from typing import Any, Optional
-import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+from uuid import uuid4
 
+import orjson
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 
 from app.core.config import settings
 
+# List the job worker pops from
+JOB_QUEUE = "jobs:queue"
+
+# Sorted set of user ids scored by last activity (epoch seconds)
+ACTIVE_USERS = "active_users"
+
+# Channel announcing new intents; wakes the scheduler's decay pass
+INTENTS_CREATED = "intents:created"
+
+# Lock held by the one process running the background scheduler
+SCHEDULER_LEADER = "scheduler:leader"
+
+# Lock scripts: only the holder's token may extend or release a lock
+_RENEW_LOCK = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("EXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_LOCK = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+def _key(*parts: str) -> str:
+    """Build a Redis key: _key("patterns", user_id, "30") -> "patterns:<user_id>:30"."""
+    return ":".join(parts)
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a JSON payload; values orjson can't handle fall back to str."""
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+class RedisPipeline:
+    """Queues commands on a pipeline; sent when the context exits."""
+
+    def __init__(self, pipe: Pipeline):
+        self._pipe = pipe
+
+    def publish_event(self, channel: str, event: dict) -> None:
+        """Queue an event publish."""
+        self._pipe.publish(channel, _dumps(event))
+
 
 class RedisClient:
     """Async Redis client for session state and pub/sub."""
@@ -19,16 +69,21 @@ class RedisClient:
 
     async def connect(self) -> None:
         """Initialize Redis connection."""
-        self._client = redis.from_url(
-            settings.redis_url,
-            encoding="utf-8",
-            decode_responses=True,
+        # Bounded pool: under load callers queue for a connection instead
+        # of opening an unbounded number of sockets. Replies stay as bytes;
+        # orjson and msgspec parse them directly, and the few text values
+        # are decoded where they are read.
+        self._client = Redis(
+            connection_pool=redis.BlockingConnectionPool.from_url(
+                settings.redis_url,
+                max_connections=settings.redis_pool_size,
+            )
         )
 
     async def disconnect(self) -> None:
         """Close Redis connection."""
         if self._client:
-            await self._client.close()
+            await self._client.aclose(close_connection_pool=True)
 
     @property
     def client(self) -> Redis:
@@ -42,58 +97,335 @@ class RedisClient:
         self, user_id: str, key: str, value: Any, ttl: int = 3600
     ) -> None:
         """Store session state for a user."""
-        full_key = f"session:{user_id}:{key}"
-        await self.client.set(full_key, json.dumps(value), ex=ttl)
+        full_key = _key("session", user_id, key)
+        await self.client.set(full_key, _dumps(value), ex=ttl)
 
     async def get_session_state(self, user_id: str, key: str) -> Optional[Any]:
         """Retrieve session state for a user."""
-        full_key = f"session:{user_id}:{key}"
+        full_key = _key("session", user_id, key)
         value = await self.client.get(full_key)
-        return json.loads(value) if value else None
+        return orjson.loads(value) if value else None
 
     async def delete_session_state(self, user_id: str, key: str) -> None:
         """Delete session state."""
-        full_key = f"session:{user_id}:{key}"
+        full_key = _key("session", user_id, key)
         await self.client.delete(full_key)
 
     # Real-time Event Operations
     async def publish_event(self, channel: str, event: dict) -> None:
         """Publish event to a channel."""
-        await self.client.publish(channel, json.dumps(event))
+        await self.client.publish(channel, _dumps(event))
+
+    async def publish_raw(self, channel: str, payload: bytes) -> None:
+        """Publish an already-encoded JSON payload to a channel."""
+        await self.client.publish(channel, payload)
+
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[RedisPipeline]:
+        """Batch commands into a single round trip."""
+        async with self.client.pipeline(transaction=False) as pipe:
+            yield RedisPipeline(pipe)
+            await pipe.execute()
 
     async def subscribe(self, channel: str):
-        """Subscribe to a channel for events."""
-        pubsub = self.client.pubsub()
+        """
+        Subscribe to a channel for events.
+
+        Messages carry the published bytes undecoded; subscribe
+        confirmations are skipped.
+        """
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
         await pubsub.subscribe(channel)
         return pubsub
 
+    async def psubscribe(self, pattern: str):
+        """
+        Subscribe to every channel matching a pattern.
+
+        Like subscribe(), messages carry the published bytes undecoded.
+        """
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.psubscribe(pattern)
+        return pubsub
+
     # Cognitive Profile Cache
     async def cache_cognitive_profile(
-        self, user_id: str, profile: dict, ttl: int = 1800
+        self, user_id: str, payload: bytes, ttl: int = 1800
+    ) -> None:
+        """Cache a MessagePack-encoded cognitive profile for quick access."""
+        key = _key("cognitive_profile", user_id)
+        await self.client.set(key, payload, ex=ttl)
+
+    async def get_cached_cognitive_profile(self, user_id: str) -> Optional[bytes]:
+        """Get the cached MessagePack-encoded cognitive profile."""
+        key = _key("cognitive_profile", user_id)
+        return await self.client.get(key)
+
+    async def invalidate_cognitive_profile(self, user_id: str) -> None:
+        """Drop the cached cognitive profile and its rendered response after a write."""
+        await self.client.delete(
+            _key("cognitive_profile", user_id),
+            _key("profile_response", user_id),
+        )
+
+    async def invalidate_cognitive_profiles(self, user_ids: list[str]) -> None:
+        """Drop cached profiles for many users with one DEL."""
+        keys = []
+        for user_id in user_ids:
+            keys += (_key("cognitive_profile", user_id), _key("profile_response", user_id))
+        if keys:
+            await self.client.delete(*keys)
+
+    # Rendered Response Cache
+    async def cache_focus_task(
+        self, user_id: str, payload: str, ttl: int = 30
     ) -> None:
-        """Cache cognitive profile for quick access."""
-        key = f"cognitive_profile:{user_id}"
-        await self.client.set(key, json.dumps(profile), ex=ttl)
+        """Cache the rendered focus-task response."""
+        key = _key("focus", user_id)
+        await self.client.set(key, payload, ex=ttl)
+
+    async def get_cached_focus_task(self, user_id: str) -> Optional[bytes]:
+        """Get the cached focus-task response body."""
+        return await self.client.get(_key("focus", user_id))
+
+    async def invalidate_focus_task(self, user_id: str) -> None:
+        """Drop the cached focus task after a task write."""
+        await self.client.delete(_key("focus", user_id))
+
+    async def cache_profile_response(
+        self, user_id: str, payload: bytes, ttl: int = 60
+    ) -> None:
+        """Cache the rendered cognitive-profile response."""
+        await self.client.set(_key("profile_response", user_id), payload, ex=ttl)
+
+    async def get_cached_profile_response(self, user_id: str) -> Optional[bytes]:
+        """Get the cached cognitive-profile response body."""
+        return await self.client.get(_key("profile_response", user_id))
+
+    async def cache_patterns(
+        self, user_id: str, time_range_days: int, payload: str, ttl: int = 3600
+    ) -> None:
+        """Cache the rendered memory-patterns response, ending its pending job."""
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(_key("patterns", user_id, str(time_range_days)), payload, ex=ttl)
+            pipe.delete(_key("patterns_job", user_id, str(time_range_days)))
+            await pipe.execute()
+
+    async def enqueue_patterns_job(
+        self, user_id: str, time_range_days: int, pending_ttl: int = 300
+    ) -> str:
+        """
+        Queue a pattern analysis unless one is already pending.
 
-    async def get_cached_cognitive_profile(self, user_id: str) -> Optional[dict]:
-        """Get cached cognitive profile."""
-        key = f"cognitive_profile:{user_id}"
+        Returns the id of the pending job, so repeated cache misses share
+        one analysis. The marker clears when the result is cached, or
+        after pending_ttl if the job fails.
+        """
+        key = _key("patterns_job", user_id, str(time_range_days))
+        job_id = str(uuid4())
+        while not await self.client.set(key, job_id, nx=True, ex=pending_ttl):
+            pending = await self.client.get(key)
+            if pending is not None:
+                return pending.decode()
+        return await self.enqueue_job(
+            "get_patterns", user_id, job_id=job_id, time_range_days=time_range_days
+        )
+
+    async def get_cached_patterns(
+        self, user_id: str, time_range_days: int
+    ) -> Optional[bytes]:
+        """Get the cached memory-patterns response body."""
+        return await self.client.get(_key("patterns", user_id, str(time_range_days)))
+
+    # Insight Memoization
+    async def cache_insights(
+        self, user_id: str, version: int, insights: list[dict], ttl: int = 30
+    ) -> None:
+        """Cache generated insights for one profile version."""
+        key = _key("insights", user_id, str(version))
+        await self.client.set(key, _dumps(insights), ex=ttl)
+
+    async def get_cached_insights(
+        self, user_id: str, version: int
+    ) -> Optional[list[dict]]:
+        """Get cached insights for a profile version."""
+        key = _key("insights", user_id, str(version))
         value = await self.client.get(key)
-        return json.loads(value) if value else None
+        return orjson.loads(value) if value is not None else None
+
+    # Authenticated User Cache
+    async def cache_user(self, user_id: str, user: dict, ttl: int = 1800) -> None:
+        """Cache the authenticated user's row for token lookups."""
+        key = _key("user", user_id)
+        await self.client.set(key, _dumps(user), ex=ttl)
+
+    async def get_cached_user(self, user_id: str) -> Optional[dict]:
+        """Get cached authenticated user."""
+        key = _key("user", user_id)
+        value = await self.client.get(key)
+        return orjson.loads(value) if value else None
+
+    async def invalidate_user(self, user_id: str) -> None:
+        """Drop the cached user after a write."""
+        key = _key("user", user_id)
+        await self.client.delete(key)
+
+    # User Activity
+    async def mark_user_active(self, user_id: str, timestamp: float) -> None:
+        """Record a user's latest activity time."""
+        await self.client.zadd(ACTIVE_USERS, {user_id: timestamp})
+
+    async def get_active_user_ids(self, since: float) -> list[str]:
+        """Get users active since a time, evicting everyone older."""
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(ACTIVE_USERS, "-inf", f"({since}")
+            pipe.zrange(ACTIVE_USERS, 0, -1)
+            _, members = await pipe.execute()
+        return [member.decode() for member in members]
+
+    # Token Revocation
+    async def revoke_token(self, jti: str, ttl: int) -> None:
+        """Revoke a token until it would have expired anyway."""
+        key = _key("revoked_token", jti)
+        await self.client.set(key, 1, ex=max(1, ttl))
+
+    async def is_token_revoked(self, jti: str) -> bool:
+        """Check whether a token has been revoked."""
+        key = _key("revoked_token", jti)
+        return bool(await self.client.exists(key))
+
+    # Locks
+    async def acquire_lock(self, key: str, token: str, ttl: int) -> bool:
+        """Take a lock for ttl seconds if nobody holds it."""
+        return bool(await self.client.set(key, token, nx=True, ex=ttl))
+
+    async def renew_lock(self, key: str, token: str, ttl: int) -> bool:
+        """Extend a lock we hold; False if it expired or changed hands."""
+        return bool(await self.client.eval(_RENEW_LOCK, 1, key, token, ttl))
+
+    async def release_lock(self, key: str, token: str) -> None:
+        """Release a lock if we still hold it."""
+        await self.client.eval(_RELEASE_LOCK, 1, key, token)
+
+    # Background Jobs
+    async def enqueue_job(
+        self,
+        name: str,
+        user_id: str,
+        ttl: int = 86400,
+        job_id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Queue a job for the worker and return its id."""
+        job_id = job_id or str(uuid4())
+        job = {"id": job_id, "name": name, "user_id": user_id, "kwargs": kwargs}
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(
+                _key("job", job_id),
+                _dumps({"status": "queued", "name": name, "user_id": user_id}),
+                ex=ttl,
+            )
+            pipe.lpush(JOB_QUEUE, _dumps(job))
+            await pipe.execute()
+        return job_id
+
+    async def dequeue_job(self, timeout: int = 5) -> Optional[dict]:
+        """Wait up to timeout seconds for the next queued job."""
+        item = await self.client.brpop(JOB_QUEUE, timeout=timeout)
+        return orjson.loads(item[1]) if item else None
+
+    async def set_job_state(self, job_id: str, state: bytes, ttl: int = 86400) -> None:
+        """Store a job's already-encoded JSON state."""
+        await self.client.set(_key("job", job_id), state, ex=ttl)
+
+    async def get_job_state(self, job_id: str) -> Optional[bytes]:
+        """Get a job's JSON state."""
+        return await self.client.get(_key("job", job_id))
+
+    # Embedding Memoization
+    async def get_cached_embeddings(self, digests: list[str]) -> list[Optional[bytes]]:
+        """Get cached int8-quantized embeddings by text digest, None for misses."""
+        return await self.client.mget([_key("embedding_i8", d) for d in digests])
+
+    async def cache_embeddings(
+        self, embeddings: dict[str, bytes], ttl: int = 86400
+    ) -> None:
+        """Cache int8-quantized embeddings keyed by text digest."""
+        async with self.client.pipeline(transaction=False) as pipe:
+            for digest, embedding in embeddings.items():
+                pipe.set(_key("embedding_i8", digest), embedding, ex=ttl)
+            await pipe.execute()
+
+    # Notifications
+    async def get_notification_state(
+        self, user_id: str
+    ) -> tuple[bool, int, Optional[str]]:
+        """Get focus mode, hourly send count and last send time in one MGET."""
+        focus, count, last = await self.client.mget(
+            _key("focus_mode", user_id),
+            _key("notification_count", user_id),
+            _key("last_notification", user_id),
+        )
+        return focus is not None, int(count or 0), last.decode() if last else None
+
+    async def record_notification(
+        self, user_id: str, sent_at: str, window: int = 3600
+    ) -> None:
+        """Count a sent notification against the rate limit window."""
+        count_key = _key("notification_count", user_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.incr(count_key)
+            pipe.expire(count_key, window)
+            pipe.set(_key("last_notification", user_id), sent_at, ex=86400)
+            await pipe.execute()
+
+    async def queue_notification(
+        self, user_id: str, notification: dict, ttl: int = 86400
+    ) -> None:
+        """Queue a suppressed notification for later delivery."""
+        key = _key("pending_notifications", user_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.rpush(key, _dumps(notification))
+            pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def get_pending_notifications(self, user_id: str, limit: int) -> list[dict]:
+        """Peek at the oldest queued notifications."""
+        items = await self.client.lrange(
+            _key("pending_notifications", user_id), 0, limit - 1
+        )
+        return [orjson.loads(item) for item in items]
+
+    async def pop_pending_notifications(self, user_id: str) -> list[dict]:
+        """Take every queued notification, atomically emptying the queue."""
+        key = _key("pending_notifications", user_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.lrange(key, 0, -1)
+            pipe.delete(key)
+            items, _ = await pipe.execute()
+        return [orjson.loads(item) for item in items]
+
+    async def clear_pending_notifications(self, user_id: str) -> None:
+        """Drop every queued notification."""
+        await self.client.delete(_key("pending_notifications", user_id))
 
     # Current Intent State
     async def set_current_intent(
         self, user_id: str, intent: dict, ttl: int = 900
     ) -> None:
         """Store current active intent."""
-        key = f"current_intent:{user_id}"
-        await self.client.set(key, json.dumps(intent), ex=ttl)
+        key = _key("current_intent", user_id)
+        await self.client.set(key, _dumps(intent), ex=ttl)
+
+    async def notify_intent_created(self, user_id: str) -> None:
+        """Announce a new intent to the scheduler."""
+        await self.client.publish(INTENTS_CREATED, user_id)
 
     async def get_current_intent(self, user_id: str) -> Optional[dict]:
         """Get current active intent."""
-        key = f"current_intent:{user_id}"
+        key = _key("current_intent", user_id)
         value = await self.client.get(key)
-        return json.loads(value) if value else None
+        return orjson.loads(value) if value else None
 
 
 # Global Redis client instance
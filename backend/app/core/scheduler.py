@@ -4,16 +4,70 @@ Runs periodic cognitive learning and memory consolidation
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import enum
+import heapq
+import random
+import time
+from collections.abc import Awaitable, Callable
 from typing import Optional
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+import structlog
+from sqlalchemy import Interval, func, literal, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core.config import settings
 from app.core.database import engine
-from app.core.redis import redis_client
-from app.models import User
+from app.core.redis import INTENTS_CREATED, SCHEDULER_LEADER, redis_client
+from app.models import Intent, Memory
 from app.agents import CognitiveProfileAgent
+from app.services.memory_service import (
+    CONSOLIDATION_AGE,
+    MemoryService,
+    consolidation_due,
+)
+
+logger = structlog.get_logger()
+
+# Per-user passes run concurrently, each on its own session; this caps how
+# many hold a DB connection (and LLM call) at once. Together with the
+# dispatcher's jobs it stays well inside the engine pool, leaving the rest
+# for API requests
+USER_CONCURRENCY = max(1, min(8, settings.database_pool_size // 2))
+
+# User ids fetched per round-trip when streaming a worklist
+USER_STREAM_CHUNK = 500
+
+# Users per batched learning pass; keeps the profile upsert well under
+# the Postgres bind parameter limit
+LEARNING_BATCH_SIZE = 500
+
+# Jobs the dispatcher runs at once; each holds at least one DB connection
+JOB_CONCURRENCY = 2
+
+# Each run lands within this fraction of its interval from its slot, so
+# jobs with the same period don't hit the pool at the same instant
+SCHEDULE_JITTER = 0.05
+
+# Decayed intents never drop below this priority
+INTENT_PRIORITY_FLOOR = 0.1
+
+# Decay only touches intents over an hour old, so a new intent can't be
+# due sooner than that; wakeups expedite at most one decay per interval
+INTENT_WAKEUP_INTERVAL = 3600
+
+# Every API worker starts a scheduler, but only the holder of the Redis
+# leader lock runs jobs. The lock is renewed well before it expires; if
+# the leader dies, another process takes over within the TTL
+LEADER_LOCK_TTL = 60
+LEADER_RENEW_INTERVAL = 20
+
+
+class JobPriority(enum.IntEnum):
+    """Order of jobs that fall due together; lower runs first."""
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
 
 
 class BackgroundScheduler:
@@ -23,20 +77,100 @@ class BackgroundScheduler:
     Tasks:
     - Cognitive profile learning (every hour)
     - Memory consolidation (every 6 hours)
-    - Intent decay (every hour)
+    - Intent decay (every hour, and at most hourly when intents are created)
+
+    One dispatcher keeps a heap of (next_run, priority, name) and starts
+    due jobs under a shared semaphore. A job is back on the heap only
+    after it finishes, so it never overlaps itself, and stop() lets
+    running jobs finish instead of cancelling them mid-commit.
+
+    Jobs only run in the process holding the leader lock, so multiple
+    uvicorn workers don't repeat each pass.
     """
 
     def __init__(self):
         self.running = False
         self.tasks: list[asyncio.Task] = []
+        self._jobs: dict[str, tuple[float, Callable[[], Awaitable[None]]]] = {}
+        self._queue: list[tuple[float, JobPriority, str]] = []
+        self._expedited: set[str] = set()
+        self._slots_at: dict[str, float] = {}
+        self._active: set[asyncio.Task] = set()
+        self._slots = asyncio.Semaphore(JOB_CONCURRENCY)
+        self._wakeup = asyncio.Event()
+        self._leader: Optional[asyncio.Task] = None
+        self._token = uuid4().hex
+
+    def add_job(
+        self,
+        name: str,
+        job: Callable[[], Awaitable[None]],
+        interval_seconds: float,
+        priority: JobPriority = JobPriority.NORMAL,
+    ):
+        """Register a periodic job; it first runs right away, by priority."""
+        self._jobs[name] = (interval_seconds, job)
+        heapq.heappush(self._queue, (0.0, priority, name))
+        self._wakeup.set()
+
+    def run_soon(self, name: str):
+        """Move a job's next run up to now, or rerun it once it finishes."""
+        for i, (_, priority, queued) in enumerate(self._queue):
+            if queued == name:
+                self._queue[i] = (time.monotonic(), priority, name)
+                heapq.heapify(self._queue)
+                self._wakeup.set()
+                return
+        self._expedited.add(name)
 
     async def start(self):
-        """Start the scheduler."""
+        """Start the scheduler; jobs run once this process is the leader."""
         if self.running:
             return
 
         self.running = True
-        
+        self._leader = asyncio.create_task(self._lead())
+
+    async def stop(self):
+        """Stop the scheduler, letting running jobs finish."""
+        self.running = False
+        if self._leader is not None:
+            self._leader.cancel()
+            await asyncio.gather(self._leader, return_exceptions=True)
+            self._leader = None
+        try:
+            await redis_client.release_lock(SCHEDULER_LEADER, self._token)
+        except Exception:
+            logger.exception("Scheduler lock release failed")
+
+    async def _lead(self):
+        """Run the jobs while holding the leader lock, retrying until stopped."""
+        while self.running:
+            try:
+                if await redis_client.acquire_lock(
+                    SCHEDULER_LEADER, self._token, LEADER_LOCK_TTL
+                ):
+                    logger.info("Scheduler leadership acquired")
+                    self._start_jobs()
+                    try:
+                        while await self._renew_leadership():
+                            pass
+                        logger.warning("Scheduler leadership lost")
+                    finally:
+                        await self._stop_jobs()
+            except Exception:
+                logger.exception("Scheduler leader election error")
+            await asyncio.sleep(LEADER_RENEW_INTERVAL)
+
+    async def _renew_leadership(self) -> bool:
+        """Wait one renewal interval, then extend the leader lock."""
+        await asyncio.sleep(LEADER_RENEW_INTERVAL)
+        return await redis_client.renew_lock(
+            SCHEDULER_LEADER, self._token, LEADER_LOCK_TTL
+        )
+
+    def _start_jobs(self):
+        """Register the periodic jobs and start dispatching them."""
         # Create async session factory
         async_session = async_sessionmaker(
             engine,
@@ -44,137 +178,220 @@ class BackgroundScheduler:
             expire_on_commit=False,
         )
 
-        # Start background tasks
-        self.tasks.append(
-            asyncio.create_task(self._learning_loop(async_session))
+        self.add_job(
+            "cognitive_learning",
+            lambda: self._learn_active_users(async_session),
+            interval_seconds=3600,
+            priority=JobPriority.CRITICAL,
         )
-        self.tasks.append(
-            asyncio.create_task(self._memory_consolidation_loop(async_session))
+        self.add_job(
+            "memory_consolidation",
+            lambda: self._consolidate_all_users(async_session),
+            interval_seconds=6 * 3600,
+            priority=JobPriority.NORMAL,
         )
-        self.tasks.append(
-            asyncio.create_task(self._intent_decay_loop(async_session))
+        self.add_job(
+            "intent_decay",
+            self._decay_intents,
+            interval_seconds=3600,
+            priority=JobPriority.HIGH,
         )
 
-    async def stop(self):
-        """Stop the scheduler."""
-        self.running = False
+        self.tasks.append(asyncio.create_task(self._dispatch()))
+        self.tasks.append(asyncio.create_task(self._listen_for_intents()))
+
+    async def _stop_jobs(self):
+        """Stop dispatching, letting running jobs finish."""
+        self._wakeup.set()
         for task in self.tasks:
             task.cancel()
+        await asyncio.gather(*self.tasks, *self._active, return_exceptions=True)
         self.tasks.clear()
+        self._queue.clear()
+        self._jobs.clear()
+        self._expedited.clear()
+        self._slots_at.clear()
 
-    async def _learning_loop(
-        self,
-        async_session: async_sessionmaker,
-        interval_minutes: int = 60,
-    ):
-        """
-        Periodic cognitive profile learning.
-        
-        Runs for all active users every hour.
-        """
+    async def _dispatch(self):
+        """Start jobs as they fall due until stopped."""
         while self.running:
-            try:
-                async with async_session() as db:
-                    # Get active users (active in last 24 hours)
-                    cutoff = datetime.utcnow() - timedelta(hours=24)
-                    result = await db.execute(
-                        select(User).where(
-                            User.is_active == True,
-                            User.last_active_at >= cutoff,
-                        )
-                    )
-                    users = result.scalars().all()
-
-                    for user in users:
-                        try:
-                            agent = CognitiveProfileAgent(db, redis_client)
-                            await agent.learn_from_events(
-                                user_id=user.id,
-                                lookback_hours=2,
-                            )
-                        except Exception as e:
-                            print(f"Learning error for user {user.id}: {e}")
+            if self._queue:
+                next_run, priority, name = self._queue[0]
+                delay = next_run - time.monotonic()
+            else:
+                delay = None
 
-                    await db.commit()
+            if delay is None or delay > 0:
+                # Sleep until the next job is due or the heap changes
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
 
-            except Exception as e:
-                print(f"Learning loop error: {e}")
+            heapq.heappop(self._queue)
+            await self._slots.acquire()
+            task = asyncio.create_task(self._run_job(name, priority))
+            self._active.add(task)
+            task.add_done_callback(self._active.discard)
 
-            # Wait for next interval
-            await asyncio.sleep(interval_minutes * 60)
+    async def _run_job(self, name: str, priority: JobPriority):
+        """Run one job under a dispatcher slot, then schedule its next run."""
+        interval, job = self._jobs[name]
+        # Runs are anchored to a fixed grid from the first one, so how long
+        # a run takes doesn't push later runs back
+        slot = self._slots_at.setdefault(name, time.monotonic())
+        try:
+            await job()
+        except Exception:
+            logger.exception("Scheduled job failed", job=name)
+        finally:
+            self._slots.release()
 
-    async def _memory_consolidation_loop(
-        self,
-        async_session: async_sessionmaker,
-        interval_hours: int = 6,
-    ):
-        """
-        Periodic memory consolidation.
-        
-        Promotes short-term memories to long-term based on retrieval.
-        """
+        if not self.running:
+            return
+        # Next slot on the grid, skipping any this run overran; expedited
+        # runs happen in between and leave the grid alone
+        now = time.monotonic()
+        while slot <= now:
+            slot += interval
+        self._slots_at[name] = slot
+
+        if name in self._expedited:
+            self._expedited.discard(name)
+            next_run = now
+        else:
+            next_run = slot + random.uniform(-SCHEDULE_JITTER, SCHEDULE_JITTER) * interval
+        heapq.heappush(self._queue, (next_run, priority, name))
+        self._wakeup.set()
+
+    async def _listen_for_intents(self):
+        """Run intent decay early when new intents are announced, debounced."""
+        last_expedited = float("-inf")
         while self.running:
             try:
-                async with async_session() as db:
-                    from app.services.memory_service import MemoryService
-                    
-                    # Get all users
-                    result = await db.execute(select(User))
-                    users = result.scalars().all()
-
-                    for user in users:
-                        try:
-                            memory_service = MemoryService(db, redis_client)
-                            await memory_service.consolidate_memories(user.id)
-                        except Exception as e:
-                            print(f"Memory consolidation error for user {user.id}: {e}")
+                wakeups = await redis_client.subscribe(INTENTS_CREATED)
+                try:
+                    async for _ in wakeups.listen():
+                        now = time.monotonic()
+                        if now - last_expedited < INTENT_WAKEUP_INTERVAL:
+                            continue
+                        last_expedited = now
+                        self.run_soon("intent_decay")
+                finally:
+                    await wakeups.aclose()
+            except Exception:
+                # Decay still runs every interval; resubscribe shortly
+                logger.exception("Intent wakeup error")
+                await asyncio.sleep(5)
 
-                    await db.commit()
+    async def _learn_active_users(self, async_session: async_sessionmaker):
+        """
+        Cognitive profile learning for users active in the last 24 hours.
 
-            except Exception as e:
-                print(f"Memory consolidation loop error: {e}")
+        Activity is tracked in Redis by get_current_user, so this never
+        scans the users table.
+        """
+        user_ids = await redis_client.get_active_user_ids(
+            since=time.time() - 24 * 3600
+        )
 
-            # Wait for next interval
-            await asyncio.sleep(interval_hours * 3600)
+        # One batched pass per slice; a failed slice is rolled back
+        # without holding up the rest
+        async with async_session() as db:
+            agent = CognitiveProfileAgent(db, redis_client)
+            for start in range(0, len(user_ids), LEARNING_BATCH_SIZE):
+                batch = user_ids[start:start + LEARNING_BATCH_SIZE]
+                try:
+                    await agent.learn_from_events_batch(
+                        user_ids=[UUID(user_id) for user_id in batch],
+                        lookback_hours=2,
+                    )
+                except Exception:
+                    await db.rollback()
+                    logger.exception("Learning batch failed", users=len(batch))
 
-    async def _intent_decay_loop(
-        self,
-        async_session: async_sessionmaker,
-        interval_minutes: int = 60,
-    ):
+    async def _consolidate_all_users(self, async_session: async_sessionmaker):
         """
-        Apply intent decay.
-        
-        Intents lose priority over time if not acted upon.
+        Memory consolidation for users with memories due.
+
+        Promotes short-term memories to long-term based on retrieval.
+        The worklist is one query for users that have short-term memories
+        old enough to consolidate, so idle users are skipped. Their ids
+        stream through a bounded queue to a fixed pool of workers, so
+        memory stays flat and work starts immediately.
         """
-        while self.running:
-            try:
-                async with async_session() as db:
-                    from app.models import Intent
-                    
-                    # Get unprocessed intents older than 1 hour
-                    cutoff = datetime.utcnow() - timedelta(hours=1)
-                    result = await db.execute(
-                        select(Intent).where(
-                            Intent.is_processed == False,
-                            Intent.created_at < cutoff,
-                        )
-                    )
-                    intents = result.scalars().all()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=USER_CONCURRENCY * 2)
+        workers = [
+            asyncio.create_task(self._consolidation_worker(async_session, queue))
+            for _ in range(USER_CONCURRENCY)
+        ]
+        try:
+            # A plain connection is enough to read ids; no ORM session
+            async with engine.connect() as conn:
+                # Database clock in UTC, like created_at and _decay_intents
+                cutoff = func.timezone("utc", func.now()) - literal(
+                    CONSOLIDATION_AGE, Interval
+                )
+                user_ids = await conn.stream_scalars(
+                    select(Memory.user_id)
+                    .where(*consolidation_due(cutoff))
+                    .distinct()
+                    .execution_options(yield_per=USER_STREAM_CHUNK)
+                )
+                async for user_id in user_ids:
+                    await queue.put(user_id)
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
 
-                    for intent in intents:
-                        # Apply decay
-                        hours_old = (datetime.utcnow() - intent.created_at).seconds / 3600
-                        decay = intent.decay_rate * hours_old
-                        intent.current_priority = max(0.1, intent.initial_priority - decay)
+    async def _consolidation_worker(
+        self, async_session: async_sessionmaker, queue: asyncio.Queue
+    ):
+        """
+        Consolidate queued users until cancelled.
 
+        Each worker keeps one session and MemoryService for the whole cycle
+        and commits per user.
+        """
+        async with async_session() as db:
+            memory_service = MemoryService(db, redis_client)
+            while True:
+                user_id = await queue.get()
+                try:
+                    await memory_service.consolidate_memories(user_id)
                     await db.commit()
+                except Exception:
+                    await db.rollback()
+                    logger.exception("Memory consolidation failed", user_id=str(user_id))
+                finally:
+                    queue.task_done()
 
-            except Exception as e:
-                print(f"Intent decay loop error: {e}")
-
-            # Wait for next interval
-            await asyncio.sleep(interval_minutes * 60)
+    async def _decay_intents(self):
+        """Run one intent decay pass as a Core statement, outside the ORM."""
+        async with engine.begin() as conn:
+            # Decay unprocessed intents older than 1 hour in one
+            # statement; created_at is naive UTC, so the cutoff and age are
+            # both taken from the database clock in UTC
+            now = func.timezone("utc", func.now())
+            cutoff = now - text("INTERVAL '1 hour'")
+            hours_old = func.extract("epoch", now - Intent.created_at) / 3600
+            await conn.execute(
+                update(Intent)
+                .where(
+                    Intent.is_processed == False,
+                    Intent.created_at < cutoff,
+                    Intent.current_priority > INTENT_PRIORITY_FLOOR,
+                )
+                .values(
+                    current_priority=func.greatest(
+                        INTENT_PRIORITY_FLOOR,
+                        Intent.initial_priority - Intent.decay_rate * hours_old,
+                    )
+                )
+            )
 
 
 # Global scheduler instance
@@ -0,0 +1,214 @@
+"""
+ORBIT - Background Job Worker
+Runs LLM calls and heavy aggregations off the request path
+
+Routes queue a job in Redis and answer 202 right away. A worker picks the
+job up on its own database session, stores the result under the job id,
+and publishes it on the user's event channel so the UI receives it over
+the WebSocket.
+
+The worker runs inside the API process by default; for more throughput,
+disable it there and run `python -m app.core.worker` separately.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import orjson
+import structlog
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.redis import RedisClient, redis_client
+from app.services.evaluator_service import EvaluatorService
+from app.services.intent_service import IntentService
+from app.services.memory_service import MemoryService
+
+logger = structlog.get_logger()
+
+JobHandler = Callable[..., Awaitable[Any]]
+
+# Job name -> handler(db, redis, user_id, **kwargs)
+JOBS: dict[str, JobHandler] = {}
+
+
+def register_job(name: str):
+    """Register a job handler under a name."""
+    def register(handler: JobHandler) -> JobHandler:
+        JOBS[name] = handler
+        return handler
+    return register
+
+
+@register_job("process_intent")
+async def process_intent(db: AsyncSession, redis: RedisClient, user_id: UUID, intent_id: str):
+    return await IntentService(db, redis).process_intent(
+        intent_id=UUID(intent_id),
+        user_id=user_id,
+    )
+
+
+@register_job("interpret_intent")
+async def interpret_intent(db: AsyncSession, redis: RedisClient, user_id: UUID, intent_id: str):
+    return await IntentService(db, redis).interpret_intent(
+        intent_id=UUID(intent_id),
+        user_id=user_id,
+    )
+
+
+@register_job("evaluate")
+async def evaluate(
+    db: AsyncSession,
+    redis: RedisClient,
+    user_id: UUID,
+    task_id: str = None,
+    goal_id: str = None,
+    session_id: str = None,
+):
+    return await EvaluatorService(db, redis).evaluate(
+        user_id=user_id,
+        task_id=UUID(task_id) if task_id else None,
+        goal_id=UUID(goal_id) if goal_id else None,
+        session_id=session_id,
+    )
+
+
+@register_job("evaluate_session")
+async def evaluate_session(db: AsyncSession, redis: RedisClient, user_id: UUID):
+    return await EvaluatorService(db, redis).evaluate_session(user_id=user_id)
+
+
+@register_job("evaluate_day")
+async def evaluate_day(db: AsyncSession, redis: RedisClient, user_id: UUID):
+    return await EvaluatorService(db, redis).evaluate_day(user_id=user_id)
+
+
+@register_job("consolidate_memories")
+async def consolidate_memories(db: AsyncSession, redis: RedisClient, user_id: UUID):
+    return await MemoryService(db, redis).consolidate_memories(user_id=user_id)
+
+
+@register_job("get_patterns")
+async def get_patterns(
+    db: AsyncSession, redis: RedisClient, user_id: UUID, time_range_days: int = 30
+):
+    patterns = await MemoryService(db, redis).get_patterns(
+        user_id=user_id,
+        time_range_days=time_range_days,
+    )
+    # Warm the route's cache so the next request skips the queue
+    await redis.cache_patterns(str(user_id), time_range_days, orjson.dumps(patterns))
+    return patterns
+
+
+def _encode(value: Any) -> bytes:
+    """Encode a job result; handlers may return pydantic models."""
+    return orjson.dumps(
+        value,
+        default=lambda obj: obj.model_dump(mode="json") if isinstance(obj, BaseModel) else str(obj),
+    )
+
+
+class JobWorker:
+    """Pulls queued jobs from Redis and runs a few of them at a time."""
+
+    def __init__(self, redis: RedisClient, concurrency: int = 4):
+        self.redis = redis
+        self.concurrency = concurrency
+        self.running = False
+        self.tasks: list[asyncio.Task] = []
+
+    async def start(self):
+        """Start the worker loops."""
+        if self.running:
+            return
+
+        self.running = True
+        for _ in range(self.concurrency):
+            self.tasks.append(asyncio.create_task(self._run()))
+
+    async def stop(self):
+        """Stop the worker loops."""
+        self.running = False
+        for task in self.tasks:
+            task.cancel()
+        self.tasks.clear()
+
+    async def _run(self):
+        """Pop and execute jobs until stopped."""
+        while self.running:
+            try:
+                job = await self.redis.dequeue_job()
+                if job is not None:
+                    await self._execute(job)
+            except Exception as e:
+                logger.error("Job worker error", error=str(e))
+                await asyncio.sleep(1)
+
+    async def _execute(self, job: dict):
+        """Run one job and report its outcome."""
+        job_id, name, user_id = job["id"], job["name"], job["user_id"]
+        handler = JOBS.get(name)
+
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job: {name}")
+
+            await self.redis.set_job_state(
+                job_id,
+                _encode({"status": "running", "name": name, "user_id": user_id}),
+            )
+            async with async_session_maker() as db:
+                result = await handler(db, self.redis, UUID(user_id), **job["kwargs"])
+                await db.commit()
+
+            state = {"status": "complete", "name": name, "user_id": user_id, "result": result}
+            event_type = "job_complete"
+        except Exception as e:
+            logger.error("Job failed", job_id=job_id, job=name, error=str(e))
+            state = {"status": "failed", "name": name, "user_id": user_id, "error": str(e)}
+            event_type = "job_failed"
+
+        await self.redis.set_job_state(job_id, _encode(state))
+        await self.redis.publish_raw(
+            f"user:{user_id}:events",
+            _encode({
+                "type": event_type,
+                "payload": {"job_id": job_id, **state},
+                "timestamp": datetime.utcnow(),
+            }),
+        )
+
+
+# Global worker instance
+worker = JobWorker(redis_client, concurrency=settings.job_worker_concurrency)
+
+
+async def start_worker():
+    """Start the in-process job worker."""
+    await worker.start()
+
+
+async def stop_worker():
+    """Stop the in-process job worker."""
+    await worker.stop()
+
+
+async def main():
+    """Run a standalone worker process."""
+    await redis_client.connect()
+    await worker.start()
+    try:
+        await asyncio.gather(*worker.tasks)
+    finally:
+        await worker.stop()
+        await redis_client.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
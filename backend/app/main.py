@@ -10,16 +10,22 @@ Philosophy:
 - ORBIT learns passively, asks minimally
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import structlog
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; keep asyncio's default loop
+    uvloop = None
+
 from app.core.config import settings
 from app.core.database import init_db, close_db
 from app.core.redis import redis_client
-from app.core.scheduler import start_scheduler, stop_scheduler
+from app.api.responses import ORJSONResponse
 from app.api.routes import (
     auth,
     intent,
@@ -50,6 +56,10 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+# libuv-based event loop for every loop created in this process
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -61,18 +71,33 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database initialized")
 
+    # Scheduler and worker bring in the agents; load them only when serving
+    from app.core.scheduler import start_scheduler, stop_scheduler
+    from app.core.worker import start_worker, stop_worker
+
     # Initialize Redis
     await redis_client.connect()
     logger.info("Redis connected")
 
+    # Single Redis subscriber feeding all WebSockets in this process
+    event_dispatcher = asyncio.create_task(events.dispatch_events(redis_client))
+    heartbeat = asyncio.create_task(events.heartbeat())
+
     # Start background scheduler
     await start_scheduler()
     logger.info("Background scheduler started")
 
+    if settings.run_job_worker:
+        await start_worker()
+        logger.info("Job worker started")
+
     yield
 
     # Shutdown
     logger.info("Shutting down ORBIT")
+    event_dispatcher.cancel()
+    heartbeat.cancel()
+    await stop_worker()
     await stop_scheduler()
     await close_db()
     await redis_client.disconnect()
@@ -97,6 +122,7 @@ app = FastAPI(
     """,
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
 )
@@ -165,4 +191,8 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.is_development,
         workers=settings.workers,
+        loop="uvloop" if uvloop is not None else "asyncio",
+        http="httptools",
+        backlog=settings.backlog,
+        limit_concurrency=settings.limit_concurrency,
     )
@@ -3,24 +3,26 @@ ORBIT - SQLAlchemy Database Models
 Core data structures for the cognitive operating system
 """
 
+import uuid
 from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
 from sqlalchemy import (
     Boolean,
-    Column,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
     Text,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB
+from sqlalchemy.orm import Mapped, WriteOnlyMapped, mapped_column, relationship
 
 from app.core.database import Base
 
@@ -96,32 +98,37 @@ class User(Base):
     
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    hashed_password = Column(String(255), nullable=False)
-    name = Column(String(100), nullable=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     
     # Settings
-    voice_enabled = Column(Boolean, default=True)
-    timezone = Column(String(50), default="UTC")
-    language = Column(String(10), default="en")
+    voice_enabled: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    timezone: Mapped[Optional[str]] = mapped_column(String(50), default="UTC")
+    language: Mapped[Optional[str]] = mapped_column(String(10), default="en")
     
     # Status
-    is_active = Column(Boolean, default=True)
-    is_verified = Column(Boolean, default=False)
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    is_verified: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    last_active_at = Column(DateTime, nullable=True)
-
-    # Relationships
-    cognitive_profile = relationship("CognitiveProfile", back_populates="user", uselist=False)
-    intents = relationship("Intent", back_populates="user")
-    goals = relationship("Goal", back_populates="user")
-    tasks = relationship("Task", back_populates="user")
-    memories = relationship("Memory", back_populates="user")
-    events = relationship("BehavioralEvent", back_populates="user")
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    last_active_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    # Relationships; the per-user collections are write-only, so a User
+    # never loads them and they are queried explicitly when needed. The
+    # profile is read through the profile cache, never from the User, so
+    # touching it here raises instead of lazy-loading
+    cognitive_profile: Mapped[Optional["CognitiveProfile"]] = relationship(
+        back_populates="user", lazy="raise"
+    )
+    intents: WriteOnlyMapped["Intent"] = relationship(back_populates="user")
+    goals: WriteOnlyMapped["Goal"] = relationship(back_populates="user")
+    tasks: WriteOnlyMapped["Task"] = relationship(back_populates="user")
+    memories: WriteOnlyMapped["Memory"] = relationship(back_populates="user")
+    events: WriteOnlyMapped["BehavioralEvent"] = relationship(back_populates="user")
 
 
 # ============================================================================
@@ -136,52 +143,56 @@ class CognitiveProfile(Base):
     
     __tablename__ = "cognitive_profiles"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), unique=True, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), unique=True, nullable=False)
 
     # Work Patterns
-    preferred_work_hours_start = Column(Integer, default=9)  # 24h format
-    preferred_work_hours_end = Column(Integer, default=17)
-    peak_focus_hours = Column(ARRAY(Integer), default=[10, 11, 14, 15])  # Best hours
+    preferred_work_hours_start: Mapped[Optional[int]] = mapped_column(Integer, default=9)  # 24h format
+    preferred_work_hours_end: Mapped[Optional[int]] = mapped_column(Integer, default=17)
+    peak_focus_hours: Mapped[Optional[list[int]]] = mapped_column(ARRAY(Integer), default=[10, 11, 14, 15])  # Best hours
     
     # Focus Characteristics
-    average_focus_duration = Column(Integer, default=25)  # minutes
-    optimal_focus_duration = Column(Integer, default=45)  # learned over time
-    focus_decay_rate = Column(Float, default=0.1)  # how fast focus drops
+    average_focus_duration: Mapped[Optional[int]] = mapped_column(Integer, default=25)  # minutes
+    optimal_focus_duration: Mapped[Optional[int]] = mapped_column(Integer, default=45)  # learned over time
+    focus_decay_rate: Mapped[Optional[float]] = mapped_column(Float, default=0.1)  # how fast focus drops
     
     # Behavioral Patterns
-    task_abandonment_rate = Column(Float, default=0.0)  # 0-1 scale
-    task_completion_rate = Column(Float, default=0.0)
-    overcommitment_score = Column(Float, default=0.0)  # tendency to take on too much
-    consistency_score = Column(Float, default=0.5)  # follow-through rate
+    task_abandonment_rate: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # 0-1 scale
+    task_completion_rate: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    overcommitment_score: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # tendency to take on too much
+    consistency_score: Mapped[Optional[float]] = mapped_column(Float, default=0.5)  # follow-through rate
     
     # Intent Patterns
-    average_intents_per_day = Column(Float, default=5.0)
-    intent_clarity_score = Column(Float, default=0.5)  # how clear their intents are
-    intent_to_action_rate = Column(Float, default=0.5)  # intents that become tasks
+    average_intents_per_day: Mapped[Optional[float]] = mapped_column(Float, default=5.0)
+    intent_clarity_score: Mapped[Optional[float]] = mapped_column(Float, default=0.5)  # how clear their intents are
+    intent_to_action_rate: Mapped[Optional[float]] = mapped_column(Float, default=0.5)  # intents that become tasks
     
     # Emotional Patterns (detected through voice/text)
-    stress_indicators = Column(JSON, default=dict)  # patterns that indicate stress
-    calm_indicators = Column(JSON, default=dict)  # patterns that indicate calm
-    overwhelm_triggers = Column(JSON, default=list)  # what causes overwhelm
+    stress_indicators: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)  # patterns that indicate stress
+    calm_indicators: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)  # patterns that indicate calm
+    overwhelm_triggers: Mapped[Optional[list]] = mapped_column(JSON, default=list)  # what causes overwhelm
     
     # Learning Data
-    successful_strategies = Column(JSON, default=list)  # what has worked
-    unsuccessful_strategies = Column(JSON, default=list)  # what hasn't worked
-    preferred_task_types = Column(JSON, default=list)
-    avoided_task_types = Column(JSON, default=list)
+    successful_strategies: Mapped[Optional[list]] = mapped_column(JSON, default=list)  # what has worked
+    unsuccessful_strategies: Mapped[Optional[list]] = mapped_column(JSON, default=list)  # what hasn't worked
+    preferred_task_types: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    avoided_task_types: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+
+    # Notification settings; preferred hours are a 24-bit mask. JSONB so
+    # updates can merge keys server-side with ||
+    preferences: Mapped[Optional[dict]] = mapped_column(JSONB, default=dict)
     
     # Meta
-    profile_confidence = Column(Float, default=0.0)  # how confident we are in the profile
-    last_updated = Column(DateTime, default=datetime.utcnow)
-    data_points_collected = Column(Integer, default=0)
+    profile_confidence: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # how confident we are in the profile
+    last_updated: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
+    data_points_collected: Mapped[Optional[int]] = mapped_column(Integer, default=0)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationship
-    user = relationship("User", back_populates="cognitive_profile")
+    user: Mapped["User"] = relationship(back_populates="cognitive_profile")
 
 
 # ============================================================================
@@ -195,41 +206,59 @@ class Intent(Base):
     """
     
     __tablename__ = "intents"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    __table_args__ = (
+        # list_intents, newest first
+        Index("ix_intent_user_created", "user_id", text("created_at DESC")),
+        # list_intents?is_processed=false: the unprocessed backlog
+        Index(
+            "ix_intent_user_unprocessed",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("is_processed = false"),
+        ),
+        # Scheduler decay sweep: unprocessed intents by age, across users
+        Index(
+            "ix_intents_unprocessed_created",
+            "created_at",
+            postgresql_where=text("is_processed = false"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
     # Content
-    raw_input = Column(Text, nullable=False)  # Original voice/text
-    interpreted_intent = Column(Text, nullable=True)  # AI interpretation
+    raw_input: Mapped[str] = mapped_column(Text, nullable=False)  # Original voice/text
+    interpreted_intent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # AI interpretation
     
     # Classification
-    urgency = Column(Enum(IntentUrgency), default=IntentUrgency.MEDIUM)
-    is_ambiguous = Column(Boolean, default=False)
-    ambiguity_reason = Column(String(255), nullable=True)
+    urgency: Mapped[Optional[IntentUrgency]] = mapped_column(Enum(IntentUrgency), default=IntentUrgency.MEDIUM)
+    is_ambiguous: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    ambiguity_reason: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
     # Context
-    emotional_tone = Column(String(50), nullable=True)  # calm, stressed, excited
-    context_tags = Column(ARRAY(String), default=list)
+    emotional_tone: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # calm, stressed, excited
+    context_tags: Mapped[Optional[list[str]]] = mapped_column(ARRAY(String), default=list)
     
     # Processing
-    is_processed = Column(Boolean, default=False)
-    processing_notes = Column(Text, nullable=True)
+    is_processed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    processing_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Decay (intents lose urgency over time)
-    initial_priority = Column(Float, default=1.0)
-    current_priority = Column(Float, default=1.0)
-    decay_rate = Column(Float, default=0.1)  # per hour
+    initial_priority: Mapped[Optional[float]] = mapped_column(Float, default=1.0)
+    current_priority: Mapped[Optional[float]] = mapped_column(Float, default=1.0)
+    decay_rate: Mapped[Optional[float]] = mapped_column(Float, default=0.1)  # per hour
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    processed_at = Column(DateTime, nullable=True)
-    expires_at = Column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
-    user = relationship("User", back_populates="intents")
-    goals = relationship("Goal", back_populates="intent")
-    tasks = relationship("Task", back_populates="intent")
+    user: Mapped["User"] = relationship(back_populates="intents")
+    goals: Mapped[list["Goal"]] = relationship(back_populates="intent")
+    tasks: Mapped[list["Task"]] = relationship(back_populates="intent")
 
 
 # ============================================================================
@@ -244,37 +273,37 @@ class Goal(Base):
     
     __tablename__ = "goals"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    intent_id = Column(UUID(as_uuid=True), ForeignKey("intents.id"), nullable=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    intent_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("intents.id"), nullable=True)
 
     # Content
-    title = Column(String(255), nullable=False)
-    description = Column(Text, nullable=True)
-    success_criteria = Column(Text, nullable=True)  # What does "done" look like?
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    success_criteria: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # What does "done" look like?
     
     # Status
-    status = Column(Enum(GoalStatus), default=GoalStatus.ACTIVE)
-    progress = Column(Float, default=0.0)  # 0-1
+    status: Mapped[Optional[GoalStatus]] = mapped_column(Enum(GoalStatus), default=GoalStatus.ACTIVE)
+    progress: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # 0-1
     
     # Priority (affected by gravity)
-    priority = Column(Float, default=1.0)
-    priority_gravity = Column(Float, default=0.0)  # pulls priority up/down
+    priority: Mapped[Optional[float]] = mapped_column(Float, default=1.0)
+    priority_gravity: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # pulls priority up/down
     
     # Timeframe
-    target_date = Column(DateTime, nullable=True)
-    estimated_effort_hours = Column(Float, nullable=True)
-    actual_effort_hours = Column(Float, default=0.0)
+    target_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    estimated_effort_hours: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    actual_effort_hours: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    completed_at = Column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
-    user = relationship("User", back_populates="goals")
-    intent = relationship("Intent", back_populates="goals")
-    tasks = relationship("Task", back_populates="goal")
+    user: Mapped["User"] = relationship(back_populates="goals")
+    intent: Mapped[Optional["Intent"]] = relationship(back_populates="goals")
+    tasks: Mapped[list["Task"]] = relationship(back_populates="goal")
 
 
 # ============================================================================
@@ -287,50 +316,75 @@ class Task(Base):
     """
     
     __tablename__ = "tasks"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    intent_id = Column(UUID(as_uuid=True), ForeignKey("intents.id"), nullable=True)
-    goal_id = Column(UUID(as_uuid=True), ForeignKey("goals.id"), nullable=True)
+    __table_args__ = (
+        # list_tasks: status filter and priority order straight off the index
+        Index(
+            "ix_task_user_status_priority",
+            "user_id",
+            "status",
+            text("priority DESC"),
+            postgresql_include=["id", "title", "estimated_minutes"],
+        ),
+        # get_focus_task: the top pending task is the first index entry
+        Index(
+            "ix_task_focus",
+            "user_id",
+            text("priority DESC"),
+            "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        # get_focus_task: most recently started in-progress task
+        Index(
+            "ix_task_in_progress",
+            "user_id",
+            text("started_at DESC"),
+            postgresql_where=text("status = 'IN_PROGRESS'"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    intent_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("intents.id"), nullable=True)
+    goal_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("goals.id"), nullable=True)
 
     # Content
-    title = Column(String(255), nullable=False)
-    description = Column(Text, nullable=True)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Status
-    status = Column(Enum(TaskStatus), default=TaskStatus.PENDING)
+    status: Mapped[Optional[TaskStatus]] = mapped_column(Enum(TaskStatus), default=TaskStatus.PENDING)
     
     # Priority & Scheduling
-    priority = Column(Float, default=1.0)
-    orbital_distance = Column(Float, default=1.0)  # Distance from focus (UI)
+    priority: Mapped[Optional[float]] = mapped_column(Float, default=1.0)
+    orbital_distance: Mapped[Optional[float]] = mapped_column(Float, default=1.0)  # Distance from focus (UI)
     
     # Time Estimates
-    estimated_minutes = Column(Integer, nullable=True)
-    actual_minutes = Column(Integer, nullable=True)
+    estimated_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    actual_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     
     # Context
-    energy_required = Column(String(20), default="medium")  # low, medium, high
-    focus_required = Column(String(20), default="medium")
-    context_tags = Column(ARRAY(String), default=list)
+    energy_required: Mapped[Optional[str]] = mapped_column(String(20), default="medium")  # low, medium, high
+    focus_required: Mapped[Optional[str]] = mapped_column(String(20), default="medium")
+    context_tags: Mapped[Optional[list[str]]] = mapped_column(ARRAY(String), default=list)
     
     # Scheduling
-    scheduled_for = Column(DateTime, nullable=True)
-    due_date = Column(DateTime, nullable=True)
+    scheduled_for: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    due_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Completion
-    completion_notes = Column(Text, nullable=True)
-    abandonment_reason = Column(String(255), nullable=True)
+    completion_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    abandonment_reason: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    started_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
-    user = relationship("User", back_populates="tasks")
-    intent = relationship("Intent", back_populates="tasks")
-    goal = relationship("Goal", back_populates="tasks")
+    user: Mapped["User"] = relationship(back_populates="tasks")
+    intent: Mapped[Optional["Intent"]] = relationship(back_populates="tasks")
+    goal: Mapped[Optional["Goal"]] = relationship(back_populates="tasks")
 
 
 # ============================================================================
@@ -344,41 +398,65 @@ class Memory(Base):
     """
     
     __tablename__ = "memories"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    __table_args__ = (
+        # list_memories, with and without a type filter, by importance
+        Index(
+            "ix_memory_user_type_importance",
+            "user_id",
+            "memory_type",
+            text("importance_score DESC"),
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "ix_memory_user_importance",
+            "user_id",
+            text("importance_score DESC"),
+            postgresql_where=text("is_active = true"),
+        ),
+        # Scheduler worklist: users with short-term memories due to
+        # consolidate
+        Index(
+            "ix_memory_short_term_due",
+            "created_at",
+            "user_id",
+            postgresql_where=text("memory_type = 'SHORT_TERM' AND is_active = true"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
     # Content
-    content = Column(Text, nullable=False)
-    summary = Column(String(500), nullable=True)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    summary: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     
     # Classification
-    memory_type = Column(Enum(MemoryType), default=MemoryType.EPISODIC)
+    memory_type: Mapped[Optional[MemoryType]] = mapped_column(Enum(MemoryType), default=MemoryType.EPISODIC)
     
     # Relevance
-    importance_score = Column(Float, default=0.5)  # 0-1
-    retrieval_count = Column(Integer, default=0)
-    last_retrieved_at = Column(DateTime, nullable=True)
+    importance_score: Mapped[Optional[float]] = mapped_column(Float, default=0.5)  # 0-1
+    retrieval_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    last_retrieved_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Vector Embedding
-    embedding_id = Column(String(255), nullable=True)  # Reference to vector store
-    embedding_model = Column(String(100), nullable=True)
+    embedding_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # Reference to vector store
+    embedding_model: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     
     # Context
-    source_type = Column(String(50), nullable=True)  # intent, task, event
-    source_id = Column(UUID(as_uuid=True), nullable=True)
-    context_tags = Column(ARRAY(String), default=list)
+    source_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # intent, task, event
+    source_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    context_tags: Mapped[Optional[list[str]]] = mapped_column(ARRAY(String), default=list)
     
     # Lifecycle
-    expires_at = Column(DateTime, nullable=True)  # For short-term memories
-    is_active = Column(Boolean, default=True)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # For short-term memories
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationship
-    user = relationship("User", back_populates="memories")
+    user: Mapped["User"] = relationship(back_populates="memories")
 
 
 # ============================================================================
@@ -392,32 +470,51 @@ class BehavioralEvent(Base):
     """
     
     __tablename__ = "behavioral_events"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    __table_args__ = (
+        # Per-type event windows for profile learning
+        Index("ix_be_user_type_created", "user_id", "event_type", "created_at"),
+        # Session evaluation windows and newest-first history, all types;
+        # event_type is carried so the history ETag query stays index-only
+        Index(
+            "ix_be_user_created",
+            "user_id",
+            "created_at",
+            postgresql_include=["event_type"],
+        ),
+        # Only the not-yet-analyzed tail is scanned by learn_from_events
+        Index(
+            "ix_be_user_unanalyzed",
+            "user_id",
+            "created_at",
+            postgresql_where=text("is_analyzed = false"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
     # Event Details
-    event_type = Column(Enum(EventType), nullable=False)
+    event_type: Mapped[EventType] = mapped_column(Enum(EventType), nullable=False)
     
     # Related Entity
-    entity_type = Column(String(50), nullable=True)  # task, goal, intent
-    entity_id = Column(UUID(as_uuid=True), nullable=True)
+    entity_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # task, goal, intent
+    entity_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
     
     # Event Data
-    event_data = Column(JSON, default=dict)
+    event_data: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
     
     # Context at time of event
-    time_of_day = Column(Integer, nullable=True)  # Hour 0-23
-    day_of_week = Column(Integer, nullable=True)  # 0=Monday
-    session_duration_minutes = Column(Integer, nullable=True)
+    time_of_day: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # Hour 0-23
+    day_of_week: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # 0=Monday
+    session_duration_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     
     # Analysis
-    is_analyzed = Column(Boolean, default=False)
-    analysis_notes = Column(Text, nullable=True)
-    contributed_to_profile = Column(Boolean, default=False)
+    is_analyzed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    analysis_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    contributed_to_profile: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     
     # Timestamp
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
 
     # Relationship
-    user = relationship("User", back_populates="events")
+    user: Mapped["User"] = relationship(back_populates="events")
@@ -3,6 +3,8 @@ ORBIT - Pydantic Schemas
 """
 
 from app.schemas.schemas import (
+    # Types
+    UUIDStr,
     # User
     UserCreate,
     UserUpdate,
@@ -43,6 +45,8 @@ from app.schemas.schemas import (
     # WebSocket
     WSEvent,
     AgentThought,
+    # Background jobs
+    JobAccepted,
     # Auth
     Token,
     TokenData,
@@ -50,6 +54,7 @@ from app.schemas.schemas import (
 )
 
 __all__ = [
+    "UUIDStr",
     "UserCreate",
     "UserUpdate",
     "UserResponse",
@@ -79,6 +84,7 @@ __all__ = [
     "VoiceOutputRequest",
     "WSEvent",
     "AgentThought",
+    "JobAccepted",
     "Token",
     "TokenData",
     "LoginRequest",
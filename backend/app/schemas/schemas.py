@@ -4,10 +4,10 @@ Request and Response models
 """
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Annotated, Any, ClassVar, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, StringConstraints
 
 from app.models.models import (
     IntentUrgency,
@@ -22,13 +22,42 @@ from app.models.models import (
 # BASE SCHEMAS
 # ============================================================================
 
+# Canonical UUID string for path parameters. Checked with a pattern rather
+# than parsed into uuid.UUID; asyncpg parses it on the way to Postgres.
+# Either case is accepted and lowered, since Redis keys embed the id.
+UUIDStr = Annotated[
+    str,
+    StringConstraints(
+        to_lower=True,
+        pattern=r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$",
+    ),
+]
+
 class ORBITBase(BaseModel):
     """Base schema with common configuration."""
     
+    # Field names, fixed once per class for from_orm_fast
+    _field_names: ClassVar[tuple[str, ...]] = ()
+
     class Config:
         from_attributes = True
         use_enum_values = True
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._field_names = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """
+        Build a response from an ORM row without validation.
+
+        Only for rows the database has already shaped; request bodies and
+        other untrusted input still go through model_validate.
+        """
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls._field_names})
+
 
 # ============================================================================
 # USER SCHEMAS
@@ -295,7 +324,7 @@ class BehavioralEventResponse(ORBITBase):
 
 class PlanRequest(BaseModel):
     """Request for the planner to create a plan from an intent."""
-    intent_id: UUID
+    intent_id: UUIDStr
     max_tasks: int = Field(default=5, ge=1, le=10)
     consider_current_load: bool = True
 
@@ -386,6 +415,16 @@ class AgentThought(BaseModel):
     is_final: bool = False
 
 
+# ============================================================================
+# BACKGROUND JOB SCHEMAS
+# ============================================================================
+
+class JobAccepted(BaseModel):
+    """A queued background job; its result arrives over the event stream."""
+    job_id: str
+    status: str = "queued"
+
+
 # ============================================================================
 # AUTHENTICATION SCHEMAS
 # ============================================================================
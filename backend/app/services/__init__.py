@@ -2,7 +2,7 @@
 ORBIT - Services Module
 """
 
-from app.services.ai_service import AIService
+from app.services.ai_service import AIService, ai_service
 from app.services.intent_service import IntentService
 from app.services.planner_service import PlannerService
 from app.services.executor_service import ExecutorService
@@ -16,6 +16,7 @@ from app.services.notification_service import NotificationService, notification_
 
 __all__ = [
     "AIService",
+    "ai_service",
     "IntentService",
     "PlannerService",
     "ExecutorService",
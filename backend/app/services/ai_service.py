@@ -3,14 +3,235 @@ ORBIT - AI Service
 LLM integration for reasoning
 """
 
-from typing import Optional
+import asyncio
+import copy
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Optional
 
+import orjson
 from anthropic import AsyncAnthropic
 
 from app.core.config import settings
 from app.models import CognitiveProfile, IntentUrgency
 from app.schemas import IntentInterpretation, PlanStep
 
+# Distinct prompts whose replies are kept in memory
+REPLY_CACHE_SIZE = 4096
+
+# System prompts; fixed per agent, so built once at import
+_SYSTEM_INTERPRET = """You are ORBIT's Intent Interpreter. Your role is to understand what the user truly wants.
+
+Core principles:
+1. Detect underlying intent, not just surface request
+2. Identify urgency without assuming everything is urgent
+3. Notice emotional tone (stressed, calm, excited, overwhelmed)
+4. Flag ambiguity when the intent is unclear
+5. Prefer minimal, focused interpretation
+
+Reply only by calling the provided tool."""
+
+_SYSTEM_PLANNER = """You are ORBIT's Planner Agent. Create minimal, achievable plans.
+
+Core principles:
+1. Less is more - prefer fewer, clearer steps
+2. Each step should be completable in one focus session
+3. Consider user's actual capacity, not ideal capacity
+4. It's okay to suggest "just one thing"
+5. Front-load the most important step
+
+Reply only by calling the provided tool."""
+
+_SYSTEM_EVALUATOR = """You are ORBIT's Evaluator Agent. Learn from what happened.
+
+Core principles:
+1. Abandonment is valid data, not failure
+2. Look for patterns, not blame
+3. Suggest small adjustments, not overhauls
+4. Celebrate completion without being patronizing
+
+Reply only by calling the provided tool."""
+
+_STYLE_INSTRUCTIONS = {
+    "calm": "Respond calmly and briefly. Prefer one sentence.",
+    "encouraging": "Be gently encouraging without being effusive.",
+    "direct": "Be direct and practical. No filler words.",
+}
+
+_SYSTEM_RESPONSE = {
+    style: f"""You are ORBIT, a calm cognitive assistant.
+
+{instructions}
+
+Core principles:
+1. Never spam or overwhelm
+2. Silence is valid - you can say nothing
+3. One clear thought per response
+4. No emoji, no exclamation points
+5. Respect the user's attention"""
+    for style, instructions in _STYLE_INSTRUCTIONS.items()
+}
+
+# Structured-output tools; the model is forced to call one, so its reply
+# arrives as a dict matching the input schema instead of free text
+_INTERPRET_TOOL = {
+    "name": "record_interpretation",
+    "description": "Record the interpretation of the user's intent.",
+    "input_schema": IntentInterpretation.model_json_schema(),
+}
+
+_PLAN_TOOL = {
+    "name": "record_plan",
+    "description": "Record the plan for the user's intent.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "steps": {"type": "array", "items": PlanStep.model_json_schema()},
+            "reasoning": {"type": "string"},
+            "warnings": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["steps"],
+    },
+}
+
+_EVALUATE_TOOL = {
+    "name": "record_evaluation",
+    "description": "Record the evaluation of the task outcome.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "was_helpful": {"type": ["boolean", "null"]},
+            "effectiveness_score": {"type": "number", "minimum": 0, "maximum": 1},
+            "insights": {"type": "array", "items": {"type": "string"}},
+            "profile_updates": {"type": "array", "items": {"type": "string"}},
+            "suggestions": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["effectiveness_score", "insights", "profile_updates", "suggestions"],
+    },
+}
+
+
+class _ReplyCache:
+    """
+    Async LRU of LLM replies keyed on the prompt inputs.
+
+    Concurrent misses for the same key share one call. Failed calls are
+    not cached, so the next request retries; if the caller running the
+    shared call is cancelled, its waiters retry the call themselves.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, asyncio.Future] = OrderedDict()
+
+    async def get(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        while (future := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Retry only when the shared call was cancelled, not us
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._entries[key] = future
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+        try:
+            result = await call()
+        except BaseException as e:
+            if self._entries.get(key) is future:
+                del self._entries[key]
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved; only waiters that joined this call see it
+                future.exception()
+            raise
+        future.set_result(result)
+        return result
+
+
+def profile_fingerprint(profile: Optional[CognitiveProfile]) -> Optional[tuple]:
+    """
+    Coarse snapshot of the profile fields the intent prompt uses.
+
+    Scores are rounded so users with similar profiles share cached replies.
+    """
+    if profile is None:
+        return None
+    return (
+        round(profile.overcommitment_score, 2),
+        round(profile.consistency_score, 2),
+        profile.average_focus_duration,
+        round(profile.task_abandonment_rate, 2),
+    )
+
+
+class _StepScanner:
+    """
+    Bracket counter that picks finished step objects out of a streamed plan.
+
+    Tracks nesting outside of string literals; an object that opens and
+    closes directly inside the root object's array is a complete step.
+    """
+
+    def __init__(self):
+        self._text: list[str] = []
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._start = 0
+        self._pos = 0
+
+    def feed(self, chunk: str) -> list[dict]:
+        """Consume a chunk of text; return any steps it completed."""
+        self._text.append(chunk)
+        steps = []
+        for char in chunk:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if char == "{" and self._stack == ["{", "["]:
+                    self._start = self._pos
+                self._stack.append(char)
+            elif char in "}]" and self._stack:
+                self._stack.pop()
+                if char == "}" and self._stack == ["{", "["]:
+                    steps.append(self._slice(self._start, self._pos + 1))
+            self._pos += 1
+        return [step for step in steps if step is not None]
+
+    def _slice(self, start: int, end: int) -> Optional[dict]:
+        text = "".join(self._text)
+        self._text = [text]
+        try:
+            value = orjson.loads(text[start:end])
+        except orjson.JSONDecodeError:
+            return None
+        return value if isinstance(value, dict) else None
+
+
+def _plan_step(step_data: dict, default_order: int) -> PlanStep:
+    return PlanStep(
+        order=step_data.get("order", default_order),
+        task_title=step_data.get("task_title", ""),
+        task_description=step_data.get("task_description"),
+        estimated_minutes=step_data.get("estimated_minutes"),
+        energy_required=step_data.get("energy_required", "medium"),
+        depends_on=step_data.get("depends_on", []),
+    )
+
 
 class AIService:
     """
@@ -25,6 +246,42 @@ class AIService:
     def __init__(self):
         self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
         self.model = settings.claude_model
+        self._interpretations = _ReplyCache(REPLY_CACHE_SIZE)
+        self._evaluations = _ReplyCache(REPLY_CACHE_SIZE)
+
+    async def _stream_tool(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        tool: dict,
+        on_json: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> dict:
+        """
+        Stream a forced tool call and return its input.
+
+        on_json sees each fragment of the tool input JSON as it arrives, so
+        callers can work on the reply while the rest is still being generated.
+        """
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[
+                {"role": "user", "content": user_prompt}
+            ],
+            system=system_prompt,
+            tools=[tool],
+            tool_choice={"type": "tool", "name": tool["name"]},
+        ) as stream:
+            async for event in stream:
+                if on_json is not None and event.type == "input_json":
+                    await on_json(event.partial_json)
+            message = await stream.get_final_message()
+
+        for block in message.content:
+            if block.type == "tool_use":
+                return block.input
+        raise ValueError(f"Model did not call {tool['name']}")
 
     async def interpret_intent(
         self,
@@ -39,34 +296,53 @@ class AIService:
         - Urgency level
         - Ambiguity
         - Emotional tone
+
+        Replies are cached on the input and a rounded profile fingerprint,
+        so repeated intents skip the model call.
         """
-        # Build context from cognitive profile
+        fingerprint = profile_fingerprint(cognitive_profile)
+        try:
+            interpretation = await self._interpretations.get(
+                (raw_input, fingerprint),
+                lambda: self._interpret(raw_input, fingerprint),
+            )
+            return interpretation.model_copy(deep=True)
+
+        except Exception as e:
+            # Fallback interpretation
+            return IntentInterpretation(
+                interpreted_intent=raw_input,
+                urgency=IntentUrgency.MEDIUM,
+                is_ambiguous=True,
+                ambiguity_reason=f"AI interpretation failed: {str(e)}",
+                emotional_tone="neutral",
+                context_tags=[],
+                confidence=0.3,
+            )
+
+    async def _interpret(
+        self,
+        raw_input: str,
+        fingerprint: Optional[tuple],
+    ) -> IntentInterpretation:
+        """Ask the model to interpret an intent; raises on failure."""
+        # Build context from the cognitive profile fingerprint
         profile_context = ""
-        if cognitive_profile:
+        if fingerprint:
+            overcommitment, consistency, focus_duration, abandonment = fingerprint
             profile_context = f"""
 User Context:
-- Overcommitment tendency: {cognitive_profile.overcommitment_score:.1%}
-- Consistency score: {cognitive_profile.consistency_score:.1%}
-- Average focus duration: {cognitive_profile.average_focus_duration} minutes
-- Task abandonment rate: {cognitive_profile.task_abandonment_rate:.1%}
+- Overcommitment tendency: {overcommitment:.1%}
+- Consistency score: {consistency:.1%}
+- Average focus duration: {focus_duration} minutes
+- Task abandonment rate: {abandonment:.1%}
 """
 
-        system_prompt = """You are ORBIT's Intent Interpreter. Your role is to understand what the user truly wants.
-
-Core principles:
-1. Detect underlying intent, not just surface request
-2. Identify urgency without assuming everything is urgent
-3. Notice emotional tone (stressed, calm, excited, overwhelmed)
-4. Flag ambiguity when the intent is unclear
-5. Prefer minimal, focused interpretation
-
-Respond in JSON format only."""
-
         user_prompt = f"""Interpret this intent:
 "{raw_input}"
 {profile_context}
 
-Respond with JSON:
+Call record_interpretation with:
 {{
     "interpreted_intent": "Clear statement of what user wants",
     "urgency": "low|medium|high|critical",
@@ -78,49 +354,10 @@ Respond with JSON:
     "confidence": 0.0-1.0
 }}"""
 
-        try:
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ],
-                system=system_prompt,
-            )
-
-            # Parse response
-            import json
-            content = response.content[0].text
-            # Extract JSON from response
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-            
-            data = json.loads(content.strip())
-
-            return IntentInterpretation(
-                interpreted_intent=data.get("interpreted_intent", raw_input),
-                urgency=IntentUrgency(data.get("urgency", "medium")),
-                is_ambiguous=data.get("is_ambiguous", False),
-                ambiguity_reason=data.get("ambiguity_reason"),
-                emotional_tone=data.get("emotional_tone"),
-                suggested_clarification=data.get("suggested_clarification"),
-                context_tags=data.get("context_tags", []),
-                confidence=data.get("confidence", 0.7),
-            )
-
-        except Exception as e:
-            # Fallback interpretation
-            return IntentInterpretation(
-                interpreted_intent=raw_input,
-                urgency=IntentUrgency.MEDIUM,
-                is_ambiguous=True,
-                ambiguity_reason=f"AI interpretation failed: {str(e)}",
-                emotional_tone="neutral",
-                context_tags=[],
-                confidence=0.3,
-            )
+        data = await self._stream_tool(
+            _SYSTEM_INTERPRET, user_prompt, 1024, _INTERPRET_TOOL
+        )
+        return IntentInterpretation.model_validate(data)
 
     async def generate_plan(
         self,
@@ -128,6 +365,7 @@ Respond with JSON:
         max_tasks: int,
         cognitive_profile: Optional[CognitiveProfile] = None,
         current_tasks: list = None,
+        on_step: Optional[Callable[[PlanStep], Awaitable[None]]] = None,
     ) -> list[PlanStep]:
         """
         Generate a plan from an interpreted intent.
@@ -136,6 +374,9 @@ Respond with JSON:
         - Break into minimal steps
         - Consider user's capacity
         - Apply intent decay
+
+        on_step is awaited with each step as soon as the model finishes
+        writing it, before the rest of the plan has arrived.
         """
         profile_context = ""
         if cognitive_profile:
@@ -146,24 +387,13 @@ User capacity:
 - Current tasks: {len(current_tasks or [])} pending
 """
 
-        system_prompt = """You are ORBIT's Planner Agent. Create minimal, achievable plans.
-
-Core principles:
-1. Less is more - prefer fewer, clearer steps
-2. Each step should be completable in one focus session
-3. Consider user's actual capacity, not ideal capacity
-4. It's okay to suggest "just one thing"
-5. Front-load the most important step
-
-Respond in JSON format only."""
-
         user_prompt = f"""Create a plan for this intent:
 "{intent}"
 
 Maximum steps: {max_tasks}
 {profile_context}
 
-Respond with JSON:
+Call record_plan with:
 {{
     "steps": [
         {{
@@ -180,36 +410,27 @@ Respond with JSON:
 }}"""
 
         try:
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=2048,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ],
-                system=system_prompt,
+            on_json = None
+            if on_step is not None:
+                scanner = _StepScanner()
+                emitted = 0
+
+                async def emit_steps(fragment: str):
+                    nonlocal emitted
+                    for step_data in scanner.feed(fragment):
+                        emitted += 1
+                        await on_step(_plan_step(step_data, emitted))
+
+                on_json = emit_steps
+
+            data = await self._stream_tool(
+                _SYSTEM_PLANNER, user_prompt, 2048, _PLAN_TOOL, on_json
             )
 
-            import json
-            content = response.content[0].text
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-            
-            data = json.loads(content.strip())
-
-            steps = []
-            for step_data in data.get("steps", []):
-                steps.append(PlanStep(
-                    order=step_data.get("order", len(steps) + 1),
-                    task_title=step_data.get("task_title", ""),
-                    task_description=step_data.get("task_description"),
-                    estimated_minutes=step_data.get("estimated_minutes"),
-                    energy_required=step_data.get("energy_required", "medium"),
-                    depends_on=step_data.get("depends_on", []),
-                ))
-
-            return steps
+            return [
+                _plan_step(step_data, order)
+                for order, step_data in enumerate(data.get("steps", []), start=1)
+            ]
 
         except Exception as e:
             # Fallback: single simple task
@@ -238,16 +459,6 @@ Respond with JSON:
         - Abandonment is data, not failure
         - Identify patterns without judgment
         """
-        system_prompt = """You are ORBIT's Evaluator Agent. Learn from what happened.
-
-Core principles:
-1. Abandonment is valid data, not failure
-2. Look for patterns, not blame
-3. Suggest small adjustments, not overhauls
-4. Celebrate completion without being patronizing
-
-Respond in JSON format only."""
-
         context = f"""Task: "{task_title}"
 Completed: {was_completed}
 Estimated: {estimated_minutes or 'unknown'} minutes
@@ -257,7 +468,7 @@ Actual: {actual_minutes or 'unknown'} minutes
         user_prompt = f"""Evaluate this task outcome:
 {context}
 
-Respond with JSON:
+Call record_evaluation with:
 {{
     "was_helpful": true|false|null,
     "effectiveness_score": 0.0-1.0,
@@ -266,24 +477,15 @@ Respond with JSON:
     "suggestions": ["Small improvement for next time"]
 }}"""
 
-        try:
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ],
-                system=system_prompt,
+        async def evaluate() -> dict:
+            return await self._stream_tool(
+                _SYSTEM_EVALUATOR, user_prompt, 1024, _EVALUATE_TOOL
             )
 
-            import json
-            content = response.content[0].text
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-            
-            return json.loads(content.strip())
+        try:
+            # Identical outcomes reuse the cached evaluation
+            evaluation = await self._evaluations.get(user_prompt, evaluate)
+            return copy.deepcopy(evaluation)
 
         except Exception:
             return {
@@ -308,23 +510,6 @@ Respond with JSON:
         - Prefer silence over noise
         - Calm, slower pace
         """
-        style_instructions = {
-            "calm": "Respond calmly and briefly. Prefer one sentence.",
-            "encouraging": "Be gently encouraging without being effusive.",
-            "direct": "Be direct and practical. No filler words.",
-        }
-
-        system_prompt = f"""You are ORBIT, a calm cognitive assistant.
-
-{style_instructions.get(style, style_instructions['calm'])}
-
-Core principles:
-1. Never spam or overwhelm
-2. Silence is valid - you can say nothing
-3. One clear thought per response
-4. No emoji, no exclamation points
-5. Respect the user's attention"""
-
         try:
             response = await self.client.messages.create(
                 model=self.model,
@@ -332,10 +517,14 @@ Core principles:
                 messages=[
                     {"role": "user", "content": f"{context}\n\nUser: {user_input}"}
                 ],
-                system=system_prompt,
+                system=_SYSTEM_RESPONSE.get(style, _SYSTEM_RESPONSE["calm"]),
             )
 
             return response.content[0].text.strip()
 
         except Exception:
             return "I understand."
+
+
+# Singleton instance; shares one Anthropic client and its connection pool
+ai_service = AIService()
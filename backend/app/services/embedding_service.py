@@ -3,11 +3,45 @@ ORBIT - Embedding Service
 Generate embeddings for memory and semantic search
 """
 
+import asyncio
+import hashlib
 from typing import Optional
 
+import numpy as np
 from anthropic import AsyncAnthropic
 
 from app.core.config import settings
+from app.core.redis import redis_client
+
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Requests arriving within this window share one batch call
+BATCH_WINDOW_SECONDS = 0.02
+MAX_BATCH_SIZE = 32
+
+# Embeddings are deterministic per text, so they are memoized for a day
+EMBEDDING_CACHE_TTL = 86400
+
+
+def quantize(embedding: np.ndarray) -> bytes:
+    """
+    Scalar-quantize an embedding to int8 for the memo cache.
+
+    The payload is a float32 scale followed by one int8 per dimension, a
+    quarter of the float32 size. Scaling by the largest component keeps
+    the full int8 range in use.
+    """
+    peak = float(np.max(np.abs(embedding))) if embedding.size else 0.0
+    scale = np.float32(peak / 127 if peak > 0 else 1.0)
+    values = np.rint(embedding / scale).astype(np.int8)
+    return scale.tobytes() + values.tobytes()
+
+
+def dequantize(payload: bytes) -> np.ndarray:
+    """Expand a quantize() payload back to a float32 embedding."""
+    scale = np.frombuffer(payload, dtype=np.float32, count=1)[0]
+    values = np.frombuffer(payload, dtype=np.int8, offset=4)
+    return values.astype(np.float32) * scale
 
 
 class EmbeddingService:
@@ -22,36 +56,16 @@ class EmbeddingService:
     async def generate_embedding(
         self,
         text: str,
-        model: str = "text-embedding-3-small",
-    ) -> Optional[list[float]]:
+        model: str = DEFAULT_EMBEDDING_MODEL,
+    ) -> Optional[np.ndarray]:
         """
         Generate embedding for text.
         
-        Uses embedding model for vector generation.
+        Uses embedding model for vector generation. Embeddings are float32
+        arrays; call .tobytes() for a compact payload.
         """
         try:
-            # For production, use OpenAI embeddings or similar
-            # For now, generate a pseudo-embedding using text hashing
-            # This is a placeholder - replace with real embeddings
-            
-            import hashlib
-            import numpy as np
-            
-            # Create deterministic pseudo-embedding from text
-            # THIS IS NOT A REAL EMBEDDING - replace with actual embedding API
-            hash_bytes = hashlib.sha256(text.encode()).digest()
-            
-            # Expand hash to embedding dimension
-            np.random.seed(int.from_bytes(hash_bytes[:4], 'big'))
-            embedding = np.random.randn(self.dimension).astype(np.float32)
-            
-            # Normalize
-            norm = np.linalg.norm(embedding)
-            if norm > 0:
-                embedding = embedding / norm
-            
-            return embedding.tolist()
-            
+            return self._pseudo_embeddings([text])[0]
         except Exception as e:
             print(f"Error generating embedding: {e}")
             return None
@@ -59,17 +73,143 @@ class EmbeddingService:
     async def generate_batch_embeddings(
         self,
         texts: list[str],
-    ) -> list[Optional[list[float]]]:
+        model: str = DEFAULT_EMBEDDING_MODEL,
+    ) -> list[Optional[np.ndarray]]:
         """Generate embeddings for multiple texts."""
-        results = []
-        for text in texts:
-            embedding = await self.generate_embedding(text)
-            results.append(embedding)
-        return results
+        try:
+            return list(self._pseudo_embeddings(texts))
+        except Exception as e:
+            print(f"Error generating embeddings: {e}")
+            return [None] * len(texts)
+
+    def _pseudo_embeddings(self, texts: list[str]) -> np.ndarray:
+        """
+        Deterministic pseudo-embeddings from text hashing.
+
+        THIS IS NOT A REAL EMBEDDING - replace with an actual embedding API
+        (OpenAI embeddings or similar). Each text seeds its own generator,
+        so a text embeds the same alone or in a batch; rows are drawn into
+        one matrix and normalized together.
+        """
+        matrix = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for row, text in zip(matrix, texts):
+            seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+            np.random.default_rng(seed).standard_normal(dtype=np.float32, out=row)
+
+        # Normalize rows in place
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+        return matrix
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent embedding requests.
+
+    Callers await embed(); requests arriving within a short window (or
+    until the batch is full) are answered together: one Redis lookup for
+    memoized embeddings, then one batch call for the misses, per model.
+    """
+
+    def __init__(
+        self,
+        service: EmbeddingService,
+        max_batch: int = MAX_BATCH_SIZE,
+        window: float = BATCH_WINDOW_SECONDS,
+    ):
+        self.service = service
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def embed(
+        self,
+        text: str,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+    ) -> Optional[np.ndarray]:
+        """Get the embedding for one text via the next batch."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, model, future))
+        return await future
+
+    async def _run(self):
+        """Collect requests into batches and resolve them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._resolve(batch)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def _resolve(self, batch: list[tuple[str, str, asyncio.Future]]):
+        """Answer a batch from the memo cache, embedding only the misses."""
+        # Identical texts in a batch share one digest and one embedding
+        waiters: dict[str, list[asyncio.Future]] = {}
+        requests: dict[str, tuple[str, str]] = {}
+        for text, model, future in batch:
+            digest = hashlib.sha256(f"{model}:{text}".encode()).hexdigest()
+            waiters.setdefault(digest, []).append(future)
+            requests[digest] = (text, model)
+
+        digests = list(requests)
+        cached = await redis_client.get_cached_embeddings(digests)
+        results: dict[str, Optional[np.ndarray]] = {
+            digest: dequantize(value)
+            for digest, value in zip(digests, cached)
+            if value is not None
+        }
+
+        misses: dict[str, list[str]] = {}
+        for digest in digests:
+            if digest not in results:
+                misses.setdefault(requests[digest][1], []).append(digest)
+
+        fresh: dict[str, bytes] = {}
+        for model, model_digests in misses.items():
+            embeddings = await self.service.generate_batch_embeddings(
+                [requests[digest][0] for digest in model_digests],
+                model=model,
+            )
+            for digest, embedding in zip(model_digests, embeddings):
+                if embedding is None:
+                    results[digest] = None
+                    continue
+                # Answer with the quantized form too, so a text gets the
+                # same vector whether or not it was cached
+                fresh[digest] = quantize(embedding)
+                results[digest] = dequantize(fresh[digest])
+
+        if fresh:
+            await redis_client.cache_embeddings(fresh, ttl=EMBEDDING_CACHE_TTL)
+
+        for digest, futures in waiters.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(results[digest])
 
 
-# Singleton
+# Singletons
 embedding_service = EmbeddingService()
+embedding_batcher = EmbeddingBatcher(embedding_service)
 
 
 async def get_embedding_service() -> EmbeddingService:
@@ -16,7 +16,7 @@ from app.models import (
     TaskStatus, GoalStatus, EventType,
 )
 from app.schemas import EvaluationResponse, CognitiveInsight
-from app.services.ai_service import AIService
+from app.services.ai_service import ai_service
 
 
 class EvaluatorService:
@@ -25,7 +25,7 @@ class EvaluatorService:
     def __init__(self, db: AsyncSession, redis: RedisClient):
         self.db = db
         self.redis = redis
-        self.ai_service = AIService()
+        self.ai_service = ai_service
 
     async def evaluate(
         self,
@@ -51,6 +51,9 @@ class EvaluatorService:
             if not entity:
                 raise ValueError("Task not found")
 
+            # Release the connection for the length of the LLM call
+            await self.db.commit()
+
             # Use AI to evaluate
             evaluation = await self.ai_service.evaluate_completion(
                 task_title=entity.title,
@@ -119,12 +122,8 @@ class EvaluatorService:
 
         if entity_type == "task":
             # Update task completion/abandonment rates
-            total_tasks = await self._count_user_tasks(user_id)
-            completed_tasks = await self._count_user_tasks(
-                user_id, status=TaskStatus.COMPLETED
-            )
-            abandoned_tasks = await self._count_user_tasks(
-                user_id, status=TaskStatus.ABANDONED
+            total_tasks, completed_tasks, abandoned_tasks = await self._count_user_tasks(
+                user_id
             )
 
             if total_tasks > 0:
@@ -146,28 +145,19 @@ class EvaluatorService:
 
         await self.db.commit()
 
-        # Update cached profile
-        await self.redis.cache_cognitive_profile(
-            str(user_id),
-            {
-                "task_completion_rate": profile.task_completion_rate,
-                "task_abandonment_rate": profile.task_abandonment_rate,
-                "average_focus_duration": profile.average_focus_duration,
-                "profile_confidence": profile.profile_confidence,
-            },
-        )
+        # Cached profile is stale now; next read repopulates it
+        await self.redis.invalidate_cognitive_profile(str(user_id))
 
-    async def _count_user_tasks(
-        self,
-        user_id: UUID,
-        status: Optional[TaskStatus] = None,
-    ) -> int:
-        """Count user's tasks, optionally filtered by status."""
-        query = select(func.count(Task.id)).where(Task.user_id == user_id)
-        if status:
-            query = query.where(Task.status == status)
-        result = await self.db.execute(query)
-        return result.scalar() or 0
+    async def _count_user_tasks(self, user_id: UUID) -> tuple[int, int, int]:
+        """Count user's tasks: (total, completed, abandoned), in one query."""
+        result = await self.db.execute(
+            select(
+                func.count(Task.id),
+                func.count(Task.id).filter(Task.status == TaskStatus.COMPLETED),
+                func.count(Task.id).filter(Task.status == TaskStatus.ABANDONED),
+            ).where(Task.user_id == user_id)
+        )
+        return tuple(result.one())
 
     async def evaluate_session(
         self,
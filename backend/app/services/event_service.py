@@ -3,6 +3,7 @@ ORBIT - Event Service
 Handles behavioral event logging and WebSocket management
 """
 
+import asyncio
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
@@ -14,34 +15,93 @@ from sqlalchemy import select
 from app.models import BehavioralEvent, EventType
 
 
+# Events buffered per socket; past this the oldest are dropped
+SEND_QUEUE_SIZE = 1024
+
+# Upper bound on queued events coalesced into one frame
+MAX_FRAME_EVENTS = 256
+
+
 class ConnectionManager:
-    """Manage WebSocket connections."""
+    """
+    Manage WebSocket connections.
+
+    Each socket gets a bounded queue and its own writer task. Publishers
+    enqueue and return immediately, so one slow client never holds up
+    the others. Events are JSON-encoded bytes; the writer sends whatever
+    has queued up as one binary frame holding a JSON array.
+    """
 
     def __init__(self):
         self.active_connections: dict[str, WebSocket] = {}
+        self.queues: dict[str, asyncio.Queue] = {}
+        self._writers: dict[str, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket, user_id: str):
         """Accept and store a WebSocket connection."""
         await websocket.accept()
+        # A reconnect replaces the user's previous socket
+        self.disconnect(user_id)
+
+        queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
         self.active_connections[user_id] = websocket
+        self.queues[user_id] = queue
+        self._writers[user_id] = asyncio.create_task(
+            self._writer(websocket, queue, user_id)
+        )
+
+    def disconnect(self, user_id: str, websocket: Optional[WebSocket] = None):
+        """
+        Remove a WebSocket connection.
+
+        When a websocket is given, only remove it if it is still the
+        user's current connection.
+        """
+        if websocket is not None and self.active_connections.get(user_id) is not websocket:
+            return
 
-    def disconnect(self, user_id: str):
-        """Remove a WebSocket connection."""
         self.active_connections.pop(user_id, None)
+        self.queues.pop(user_id, None)
+        writer = self._writers.pop(user_id, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
 
     def is_connected(self, user_id: str) -> bool:
         """Check if a user is connected."""
         return user_id in self.active_connections
 
-    async def send_personal_message(self, message: str, user_id: str):
-        """Send a message to a specific user."""
-        if user_id in self.active_connections:
-            await self.active_connections[user_id].send_text(message)
-
-    async def broadcast(self, message: str):
-        """Broadcast message to all connections."""
-        for connection in self.active_connections.values():
-            await connection.send_text(message)
+    def send_personal_message(self, message: str, user_id: str):
+        """Queue a JSON-encoded event for a specific user."""
+        self.send_personal_bytes(message.encode(), user_id)
+
+    def send_personal_bytes(self, message: bytes, user_id: str):
+        """Queue an already-encoded JSON event for a specific user."""
+        queue = self.queues.get(user_id)
+        if queue is None:
+            return
+        if queue.full():
+            # Drop the oldest event rather than grow without bound
+            queue.get_nowait()
+        queue.put_nowait(message)
+
+    def broadcast(self, message: str):
+        """Queue a JSON-encoded event for all connections."""
+        data = message.encode()
+        for user_id in list(self.queues):
+            self.send_personal_bytes(data, user_id)
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue, user_id: str):
+        """Drain a socket's queue, coalescing ready events into one frame."""
+        try:
+            while True:
+                events = [await queue.get()]
+                while len(events) < MAX_FRAME_EVENTS and not queue.empty():
+                    events.append(queue.get_nowait())
+                await websocket.send_bytes(b"[" + b",".join(events) + b"]")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(user_id, websocket)
 
 
 class EventService:
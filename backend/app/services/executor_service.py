@@ -47,6 +47,7 @@ class ExecutorService:
         )
         self.db.add(task)
         await self.db.commit()
+        await self.redis.invalidate_focus_task(str(user_id))
         await self.db.refresh(task)
 
         return task
@@ -75,6 +76,7 @@ class ExecutorService:
             setattr(task, field, value)
 
         await self.db.commit()
+        await self.redis.invalidate_focus_task(str(user_id))
         await self.db.refresh(task)
 
         return task
@@ -153,6 +155,7 @@ class ExecutorService:
         )
 
         await self.db.commit()
+        await self.redis.invalidate_focus_task(str(user_id))
 
         # Broadcast start event
         await self.redis.publish_event(
@@ -227,6 +230,7 @@ class ExecutorService:
         )
 
         await self.db.commit()
+        await self.redis.invalidate_focus_task(str(user_id))
 
         # Broadcast completion
         await self.redis.publish_event(
@@ -283,6 +287,7 @@ class ExecutorService:
         )
 
         await self.db.commit()
+        await self.redis.invalidate_focus_task(str(user_id))
 
         # Broadcast abandonment (learning opportunity)
         await self.redis.publish_event(
@@ -331,6 +336,7 @@ class ExecutorService:
         task.orbital_distance = min(2.0, task.orbital_distance + 0.2)
 
         await self.db.commit()
+        await self.redis.invalidate_focus_task(str(user_id))
 
         return {
             "task_id": str(task_id),
@@ -3,6 +3,7 @@ ORBIT - Intent Service
 Handles intent creation and interpretation
 """
 
+import asyncio
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
@@ -13,7 +14,7 @@ from sqlalchemy import select
 from app.core.redis import RedisClient
 from app.models import Intent, User, CognitiveProfile, IntentUrgency, EventType
 from app.schemas import IntentInterpretation
-from app.services.ai_service import AIService
+from app.services.ai_service import ai_service
 from app.services.event_service import EventService
 
 
@@ -23,7 +24,7 @@ class IntentService:
     def __init__(self, db: AsyncSession, redis: RedisClient):
         self.db = db
         self.redis = redis
-        self.ai_service = AIService()
+        self.ai_service = ai_service
         self.event_service = EventService(db)
 
     async def create_intent(
@@ -43,23 +44,25 @@ class IntentService:
         self.db.add(intent)
         await self.db.flush()
 
-        # Store as current intent in Redis
-        await self.redis.set_current_intent(
-            str(user_id),
-            {
-                "id": str(intent.id),
-                "raw_input": raw_input,
-                "created_at": datetime.utcnow().isoformat(),
-            },
-        )
-
-        # Log behavioral event
-        await self.event_service.log_event(
-            user_id=user_id,
-            event_type=EventType.INTENT_EXPRESSED,
-            entity_type="intent",
-            entity_id=intent.id,
-            event_data={"source": source, "length": len(raw_input)},
+        # Store as current intent in Redis while the behavioral event
+        # is written; none of these depend on each other
+        await asyncio.gather(
+            self.redis.notify_intent_created(str(user_id)),
+            self.redis.set_current_intent(
+                str(user_id),
+                {
+                    "id": str(intent.id),
+                    "raw_input": raw_input,
+                    "created_at": datetime.utcnow().isoformat(),
+                },
+            ),
+            self.event_service.log_event(
+                user_id=user_id,
+                event_type=EventType.INTENT_EXPRESSED,
+                entity_type="intent",
+                entity_id=intent.id,
+                event_data={"source": source, "length": len(raw_input)},
+            ),
         )
 
         await self.db.commit()
@@ -75,22 +78,23 @@ class IntentService:
         """
         Use AI to interpret an intent.
         """
-        # Get intent
+        # Get intent and, for context, the cognitive profile in one round trip
         result = await self.db.execute(
-            select(Intent).where(
+            select(Intent, CognitiveProfile)
+            .outerjoin(CognitiveProfile, CognitiveProfile.user_id == Intent.user_id)
+            .where(
                 Intent.id == intent_id,
                 Intent.user_id == user_id,
             )
         )
-        intent = result.scalar_one_or_none()
-        if not intent:
+        row = result.one_or_none()
+        if not row:
             raise ValueError("Intent not found")
+        intent, profile = row
 
-        # Get cognitive profile for context
-        profile_result = await self.db.execute(
-            select(CognitiveProfile).where(CognitiveProfile.user_id == user_id)
-        )
-        profile = profile_result.scalar_one_or_none()
+        # End the read transaction so the connection is back in the pool
+        # for the length of the LLM call
+        await self.db.commit()
 
         # Use AI to interpret
         interpretation = await self.ai_service.interpret_intent(
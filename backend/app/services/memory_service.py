@@ -8,11 +8,22 @@ from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Integer, cast, select
 
 from app.core.redis import RedisClient
 from app.models import Memory, MemoryType
 from app.schemas import MemoryCreate, MemoryResponse, MemorySearchResult
+# Short-term memories older than this are promoted or expired
+CONSOLIDATION_AGE = timedelta(hours=12)
+
+
+def consolidation_due(cutoff: datetime) -> tuple:
+    """WHERE clause for short-term memories ready to consolidate."""
+    return (
+        Memory.memory_type == MemoryType.SHORT_TERM,
+        Memory.created_at < cutoff,
+        Memory.is_active == True,
+    )
 
 
 class MemoryService:
@@ -21,8 +32,6 @@ class MemoryService:
     def __init__(self, db: AsyncSession, redis: RedisClient):
         self.db = db
         self.redis = redis
-        # Vector store will be initialized here (FAISS)
-        self._vector_store = None
 
     async def create_memory(
         self,
@@ -52,9 +61,6 @@ class MemoryService:
         await self.db.commit()
         await self.db.refresh(memory)
 
-        # TODO: Generate and store embedding
-        # await self._store_embedding(memory)
-
         return memory
 
     async def search_memories(
@@ -69,27 +75,38 @@ class MemoryService:
         Semantic search across memories.
         
         IMPORTANT: Only returns relevant memories to avoid prompt overload.
+
+        Keyword search until a real embedding model is wired in: relevance
+        is the share of query terms found in the memory, and memories below
+        min_relevance are dropped.
         """
-        # For now, do simple keyword search
-        # TODO: Implement vector similarity search with FAISS
+        terms = list(dict.fromkeys(query.lower().split()))
+        if not terms:
+            return []
 
-        base_query = select(Memory).where(
+        matched = sum(
+            cast(Memory.content.icontains(term, autoescape=True), Integer)
+            for term in terms
+        )
+        relevance = (matched / float(len(terms))).label("relevance")
+
+        base_query = select(Memory, relevance).where(
             Memory.user_id == user_id,
             Memory.is_active == True,
+            relevance >= min_relevance,
         )
 
         if memory_types:
             base_query = base_query.where(Memory.memory_type.in_(memory_types))
 
-        # Simple relevance: check if query terms appear in content
-        base_query = base_query.where(
-            Memory.content.ilike(f"%{query}%")
-        ).order_by(
-            Memory.importance_score.desc()
+        base_query = base_query.order_by(
+            relevance.desc(),
+            Memory.importance_score.desc(),
         ).limit(limit)
 
         result = await self.db.execute(base_query)
-        memories = result.scalars().all()
+        rows = result.all()
+        memories = [memory for memory, _ in rows]
 
         # Update retrieval counts
         for memory in memories:
@@ -97,14 +114,13 @@ class MemoryService:
             memory.last_retrieved_at = datetime.utcnow()
         await self.db.commit()
 
-        # Return with mock relevance scores for now
         return [
             MemorySearchResult(
-                memory=MemoryResponse.model_validate(m),
-                relevance_score=0.8,  # TODO: Real similarity score
-                context_match=0.7,
+                memory=MemoryResponse.from_orm_fast(memory),
+                relevance_score=score,
+                context_match=score,
             )
-            for m in memories
+            for memory, score in rows
         ]
 
     async def get_context_memories(
@@ -154,14 +170,12 @@ class MemoryService:
         - Prune redundant memories
         """
         # Get short-term memories older than 12 hours
-        cutoff = datetime.utcnow() - timedelta(hours=12)
+        cutoff = datetime.utcnow() - CONSOLIDATION_AGE
 
         result = await self.db.execute(
             select(Memory).where(
                 Memory.user_id == user_id,
-                Memory.memory_type == MemoryType.SHORT_TERM,
-                Memory.created_at < cutoff,
-                Memory.is_active == True,
+                *consolidation_due(cutoff),
             )
         )
         old_short_term = result.scalars().all()
@@ -228,22 +242,3 @@ class MemoryService:
                 })
 
         return patterns
-
-    async def _store_embedding(self, memory: Memory):
-        """
-        Generate and store embedding for a memory.
-        TODO: Implement with FAISS
-        """
-        pass
-
-    async def _search_by_embedding(
-        self,
-        query_embedding: list[float],
-        user_id: UUID,
-        limit: int,
-    ) -> list[tuple[UUID, float]]:
-        """
-        Search memories by embedding similarity.
-        TODO: Implement with FAISS
-        """
-        return []
@@ -5,12 +5,12 @@ Handles intelligent notification delivery respecting user's attention.
 ORBIT never spams - notifications are rare, calm, and valuable.
 """
 
-from typing import Optional, Dict, Any, List
+import asyncio
+from typing import Optional, Dict, Any, Iterable, List
 from datetime import datetime, timezone, timedelta
 from uuid import UUID
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
 
 from app.models.models import (
     User,
@@ -20,10 +20,33 @@ from app.models.models import (
     NotificationPriority,
 )
 from app.core.redis import redis_client
+from app.services.profile_cache import load_cached_profile
 
 logger = structlog.get_logger()
 
 
+def hours_to_mask(hours: Iterable[int]) -> int:
+    """Pack hours of the day (0-23) into a bitmask."""
+    mask = 0
+    for hour in hours:
+        mask |= 1 << hour
+    return mask
+
+
+def quiet_hours_to_mask(start: int, end: int) -> int:
+    """Pack a quiet window [start, end) into an hour bitmask, wrapping past midnight."""
+    if start > end:  # Overnight, e.g. 22:00 - 07:00
+        hours = [*range(start, 24), *range(end)]
+    else:
+        hours = range(start, end)
+    return hours_to_mask(hours)
+
+
+def mask_to_hours(mask: int) -> List[int]:
+    """Unpack a bitmask into the hours of the day it contains."""
+    return [hour for hour in range(24) if mask >> hour & 1]
+
+
 class NotificationService:
     """
     Intelligent notification system that respects attention.
@@ -56,19 +79,17 @@ class NotificationService:
         - Too many recent notifications
         - Priority doesn't warrant interruption
         """
-        # Get user's cognitive profile
-        profile = await db.execute(
-            select(CognitiveProfile).where(
-                CognitiveProfile.user_id == user_id
-            )
+        # Get user's cognitive profile and attention state together
+        profile, (in_focus, sent_count, last_sent) = await asyncio.gather(
+            load_cached_profile(db, redis_client, user_id),
+            redis_client.get_notification_state(str(user_id)),
         )
-        profile = profile.scalar_one_or_none()
         
         if not profile:
             return priority == NotificationPriority.URGENT
         
         # Check focus mode
-        if await self._is_in_focus_mode(user_id):
+        if in_focus:
             # Only urgent notifications break focus
             return priority == NotificationPriority.URGENT
         
@@ -77,12 +98,12 @@ class NotificationService:
             return priority == NotificationPriority.URGENT
         
         # Check notification rate
-        if await self._exceeded_rate_limit(user_id):
+        if sent_count >= self.MAX_HOURLY_NOTIFICATIONS:
             return priority == NotificationPriority.URGENT
         
         # Low priority notifications have stricter criteria
         if priority == NotificationPriority.LOW:
-            return await self._is_good_time_for_low_priority(user_id, profile)
+            return self._is_good_time_for_low_priority(last_sent, profile)
         
         return True
 
@@ -139,14 +160,14 @@ class NotificationService:
         }
         
         # Publish to real-time channel
-        await redis_client.publish(
-            f"notifications:{user_id}",
-            notification
+        # Publish and track for rate limiting concurrently
+        await asyncio.gather(
+            redis_client.publish_event(f"notifications:{user_id}", notification),
+            redis_client.record_notification(
+                str(user_id), notification["timestamp"]
+            ),
         )
         
-        # Track notification for rate limiting
-        await self._record_notification(user_id)
-        
         logger.info(
             "Notification sent",
             user_id=str(user_id),
@@ -237,9 +258,7 @@ class NotificationService:
         limit: int = 10
     ) -> List[Dict[str, Any]]:
         """Get queued notifications for when user is available."""
-        key = f"pending_notifications:{user_id}"
-        pending = await redis_client.lrange(key, 0, limit - 1)
-        return pending or []
+        return await redis_client.get_pending_notifications(str(user_id), limit)
 
     async def deliver_pending(
         self,
@@ -247,7 +266,8 @@ class NotificationService:
         user_id: UUID
     ) -> int:
         """Deliver pending notifications. Returns count delivered."""
-        pending = await self.get_pending_notifications(user_id)
+        # Taken off the queue up front, so a concurrent call can't deliver twice
+        pending = await redis_client.pop_pending_notifications(str(user_id))
         
         if not pending:
             return 0
@@ -267,54 +287,29 @@ class NotificationService:
             ):
                 delivered += 1
         
-        # Clear delivered notifications
-        key = f"pending_notifications:{user_id}"
-        await redis_client.delete(key)
-        
         return delivered
 
     # Private helper methods
 
-    async def _is_in_focus_mode(self, user_id: UUID) -> bool:
-        """Check if user is currently in focus mode."""
-        focus_key = f"focus_mode:{user_id}"
-        return await redis_client.exists(focus_key)
-
     def _is_quiet_hours(self, profile: CognitiveProfile) -> bool:
         """Check if current time is in user's quiet hours."""
         if not profile.preferences:
             return False
         
-        quiet_start = profile.preferences.get("quiet_hours_start")
-        quiet_end = profile.preferences.get("quiet_hours_end")
-        
-        if not quiet_start or not quiet_end:
+        # Precomputed from the window when preferences are saved
+        quiet_mask = profile.preferences.get("quiet_hours_mask")
+        if not quiet_mask:
             return False
         
-        now = datetime.now(timezone.utc).hour
-        
-        # Handle overnight quiet hours (e.g., 22:00 - 07:00)
-        if quiet_start > quiet_end:
-            return now >= quiet_start or now < quiet_end
-        else:
-            return quiet_start <= now < quiet_end
+        return bool(quiet_mask >> datetime.now(timezone.utc).hour & 1)
 
-    async def _exceeded_rate_limit(self, user_id: UUID) -> bool:
-        """Check if we've sent too many notifications recently."""
-        key = f"notification_count:{user_id}"
-        count = await redis_client.get(key)
-        return int(count or 0) >= self.MAX_HOURLY_NOTIFICATIONS
-
-    async def _is_good_time_for_low_priority(
+    def _is_good_time_for_low_priority(
         self,
-        user_id: UUID,
+        last_time: Optional[str],
         profile: CognitiveProfile
     ) -> bool:
         """Determine if now is a good time for low-priority notifications."""
         # Check time since last notification
-        last_key = f"last_notification:{user_id}"
-        last_time = await redis_client.get(last_key)
-        
         if last_time:
             last_dt = datetime.fromisoformat(last_time)
             if datetime.now(timezone.utc) - last_dt < timedelta(
@@ -324,28 +319,13 @@ class NotificationService:
         
         # Check if user has preferred notification times
         if profile.preferences:
-            preferred_times = profile.preferences.get("notification_times", [])
-            if preferred_times:
+            preferred_mask = profile.preferences.get("notification_hours_mask")
+            if preferred_mask:
                 current_hour = datetime.now(timezone.utc).hour
-                return current_hour in preferred_times
+                return bool(preferred_mask >> current_hour & 1)
         
         return True
 
-    async def _record_notification(self, user_id: UUID) -> None:
-        """Record that a notification was sent for rate limiting."""
-        # Increment hourly counter
-        count_key = f"notification_count:{user_id}"
-        await redis_client.incr(count_key)
-        await redis_client.expire(count_key, 3600)  # 1 hour
-        
-        # Record timestamp
-        last_key = f"last_notification:{user_id}"
-        await redis_client.set(
-            last_key,
-            datetime.now(timezone.utc).isoformat(),
-            ex=86400  # 24 hours
-        )
-
     async def _queue_notification(
         self,
         user_id: UUID,
@@ -356,7 +336,6 @@ class NotificationService:
         data: Optional[Dict[str, Any]]
     ) -> None:
         """Queue notification for later delivery."""
-        key = f"pending_notifications:{user_id}"
         notification = {
             "title": title,
             "message": message,
@@ -366,9 +345,8 @@ class NotificationService:
             "queued_at": datetime.now(timezone.utc).isoformat()
         }
         
-        await redis_client.rpush(key, notification)
-        # Expire after 24 hours
-        await redis_client.expire(key, 86400)
+        # Expires after 24 hours
+        await redis_client.queue_notification(str(user_id), notification)
 
     def _batch_notifications(
         self,
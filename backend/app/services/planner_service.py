@@ -7,13 +7,17 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+import orjson
+import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.redis import RedisClient
 from app.models import Intent, Task, Goal, CognitiveProfile, TaskStatus
 from app.schemas import PlanResponse, PlanStep
-from app.services.ai_service import AIService
+from app.services.ai_service import ai_service
+
+logger = structlog.get_logger()
 
 
 class PlannerService:
@@ -22,7 +26,7 @@ class PlannerService:
     def __init__(self, db: AsyncSession, redis: RedisClient):
         self.db = db
         self.redis = redis
-        self.ai_service = AIService()
+        self.ai_service = ai_service
 
     async def create_plan(
         self,
@@ -71,13 +75,38 @@ class PlannerService:
         if profile and profile.overcommitment_score > 0.7:
             max_tasks = min(max_tasks, 3)  # Reduce scope for overcommitters
 
+        # Reads are done; release the connection for the length of the LLM call
+        await self.db.commit()
+
         # Generate plan using AI
         intent_text = intent.interpreted_intent or intent.raw_input
+
+        async def announce_step(step: PlanStep):
+            # Stream each step to the UI while the rest of the plan generates.
+            # publish_raw goes straight to Redis, past the orchestrator's
+            # batching of publish_event. A failed publish only costs the
+            # UI a preview; it must not abort the plan being generated
+            try:
+                await self.redis.publish_raw(
+                    f"user:{user_id}:events",
+                    orjson.dumps({
+                        "type": "agent_thought",
+                        "payload": {
+                            "agent": "planner",
+                            "thought": f"Step {step.order}: {step.task_title}",
+                            "is_final": False,
+                        },
+                    }),
+                )
+            except Exception:
+                logger.exception("Plan step announcement failed", intent_id=str(intent_id))
+
         steps = await self.ai_service.generate_plan(
             intent=intent_text,
             max_tasks=max_tasks,
             cognitive_profile=profile,
             current_tasks=current_tasks,
+            on_step=announce_step,
         )
 
         # Calculate total estimated time
@@ -170,6 +199,7 @@ class PlannerService:
             created_tasks.append(task)
 
         await self.db.commit()
+        await self.redis.invalidate_focus_task(str(user_id))
 
         # Clear cached plan
         await self.redis.delete_session_state(str(user_id), f"plan:{intent_id}")
@@ -0,0 +1,102 @@
+"""
+ORBIT - Cognitive Profile Cache
+Read-only profile snapshots kept in Redis as MessagePack
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+import msgspec
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import RedisClient
+from app.models import CognitiveProfile
+
+
+# Profiles change at most every few minutes; keep read paths off Postgres
+PROFILE_CACHE_TTL = 60
+
+
+class _CachedProfile(msgspec.Struct):
+    """MessagePack snapshot of a CognitiveProfile row for the Redis cache."""
+    id: UUID
+    user_id: UUID
+    preferred_work_hours_start: Optional[int] = None
+    preferred_work_hours_end: Optional[int] = None
+    peak_focus_hours: Optional[list[int]] = None
+    average_focus_duration: Optional[int] = None
+    optimal_focus_duration: Optional[int] = None
+    focus_decay_rate: Optional[float] = None
+    task_abandonment_rate: Optional[float] = None
+    task_completion_rate: Optional[float] = None
+    overcommitment_score: Optional[float] = None
+    consistency_score: Optional[float] = None
+    average_intents_per_day: Optional[float] = None
+    intent_clarity_score: Optional[float] = None
+    intent_to_action_rate: Optional[float] = None
+    stress_indicators: Optional[dict] = None
+    calm_indicators: Optional[dict] = None
+    overwhelm_triggers: Optional[list] = None
+    successful_strategies: Optional[list] = None
+    unsuccessful_strategies: Optional[list] = None
+    preferred_task_types: Optional[list] = None
+    avoided_task_types: Optional[list] = None
+    preferences: Optional[dict] = None
+    profile_confidence: Optional[float] = None
+    last_updated: Optional[datetime] = None
+    data_points_collected: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+_PROFILE_ENCODER = msgspec.msgpack.Encoder(uuid_format="bytes")
+_PROFILE_DECODER = msgspec.msgpack.Decoder(_CachedProfile)
+
+
+def _profile_to_cache(profile: CognitiveProfile) -> bytes:
+    """Serialize a profile's column values for the Redis cache."""
+    return _PROFILE_ENCODER.encode(
+        _CachedProfile(**{
+            field: getattr(profile, field)
+            for field in _CachedProfile.__struct_fields__
+        })
+    )
+
+
+def _profile_from_cache(data: bytes) -> CognitiveProfile:
+    """Build a detached, read-only profile from a cached snapshot."""
+    return CognitiveProfile(**msgspec.structs.asdict(_PROFILE_DECODER.decode(data)))
+
+
+async def load_cached_profile(
+    db: AsyncSession,
+    redis: RedisClient,
+    user_id: UUID,
+) -> Optional[CognitiveProfile]:
+    """
+    Get a cognitive profile for read-only use.
+
+    Served from Redis when possible. The returned instance is detached
+    on a cache hit, so never mutate it; write paths must load the
+    profile through the session instead.
+    """
+    cached = await redis.get_cached_cognitive_profile(str(user_id))
+    if cached:
+        try:
+            return _profile_from_cache(cached)
+        except msgspec.DecodeError:
+            pass  # Written in an older format; reload and overwrite it
+
+    result = await db.execute(
+        select(CognitiveProfile).where(CognitiveProfile.user_id == user_id)
+    )
+    profile = result.scalar_one_or_none()
+    if profile:
+        await redis.cache_cognitive_profile(
+            str(user_id),
+            _profile_to_cache(profile),
+            ttl=PROFILE_CACHE_TTL,
+        )
+    return profile
@@ -4,9 +4,13 @@ Voice input/output processing
 """
 
 import base64
+import os
+import tempfile
 from typing import Optional
 from uuid import UUID
 
+import structlog
+from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.redis import RedisClient
@@ -14,6 +18,11 @@ from app.core.config import settings
 from app.schemas import VoiceInputResponse, IntentResponse
 from app.services.intent_service import IntentService
 
+logger = structlog.get_logger()
+
+# Uploads are copied to disk in chunks of this size, never held whole
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class VoiceService:
     """Service for voice processing."""
@@ -55,7 +64,7 @@ class VoiceService:
                 raw_input=transcription,
                 source="voice",
             )
-            intent = IntentResponse.model_validate(intent_obj)
+            intent = IntentResponse.from_orm_fast(intent_obj)
 
         return VoiceInputResponse(
             transcription=transcription,
@@ -67,19 +76,20 @@ class VoiceService:
     async def transcribe_file(
         self,
         user_id: UUID,
-        file_content: bytes,
-        filename: str,
+        audio: UploadFile,
     ) -> VoiceInputResponse:
         """
         Transcribe an uploaded audio file.
+
+        The upload is streamed to a temp file for Whisper in fixed-size
+        chunks rather than read into memory.
         """
         # Determine format from filename
-        audio_format = filename.split(".")[-1].lower()
+        audio_format = audio.filename.split(".")[-1].lower()
 
-        transcription, confidence = await self._transcribe(
-            file_content,
+        transcription, confidence = await self._transcribe_upload(
+            audio,
             audio_format,
-            16000,
         )
 
         # Create intent
@@ -91,7 +101,7 @@ class VoiceService:
                 raw_input=transcription,
                 source="voice",
             )
-            intent = IntentResponse.model_validate(intent_obj)
+            intent = IntentResponse.from_orm_fast(intent_obj)
 
         return VoiceInputResponse(
             transcription=transcription,
@@ -115,23 +125,58 @@ class VoiceService:
             return "", 0.0
 
         try:
-            # Lazy load Whisper model
-            if self._whisper_model is None:
-                import whisper
-                self._whisper_model = whisper.load_model(settings.whisper_model)
-
             # Save to temp file (Whisper requires file path)
-            import tempfile
-            import os
-
             with tempfile.NamedTemporaryFile(
                 suffix=f".{audio_format}",
                 delete=False,
             ) as f:
                 f.write(audio_bytes)
                 temp_path = f.name
+        except Exception:
+            logger.exception("Transcription failed")
+            return "", 0.0
+
+        return await self._transcribe_path(temp_path)
+
+    async def _transcribe_upload(
+        self,
+        audio: UploadFile,
+        audio_format: str,
+    ) -> tuple[str, float]:
+        """Transcribe an upload, spooling it to disk chunk by chunk."""
+        if not settings.enable_voice:
+            return "", 0.0
+
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                suffix=f".{audio_format}",
+                delete=False,
+            ) as f:
+                temp_path = f.name
+                while chunk := await audio.read(UPLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        except Exception:
+            logger.exception("Transcription failed")
+            if temp_path:
+                os.unlink(temp_path)
+            return "", 0.0
 
+        return await self._transcribe_path(temp_path)
+
+    async def _transcribe_path(self, temp_path: str) -> tuple[str, float]:
+        """
+        Run Whisper on an audio file, deleting the file afterwards.
+
+        Returns (transcription, confidence).
+        """
+        try:
             try:
+                # Lazy load Whisper model
+                if self._whisper_model is None:
+                    import whisper
+                    self._whisper_model = whisper.load_model(settings.whisper_model)
+
                 # Transcribe
                 result = self._whisper_model.transcribe(
                     temp_path,
@@ -157,8 +202,8 @@ class VoiceService:
             finally:
                 os.unlink(temp_path)
 
-        except Exception as e:
-            print(f"Transcription error: {e}")
+        except Exception:
+            logger.exception("Transcription failed")
             return "", 0.0
 
     async def generate_speech(